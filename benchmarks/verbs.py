@@ -0,0 +1,350 @@
+"""Scaling benchmarks for every verb (DataFrame + GroupedFrame)
+
+Each (verb, shape, rows) case runs in a fresh process and reports:
+
+- `seconds`: best wall time for the redframes verb
+- `pandas_seconds`: best wall time for the raw pandas call the verb wraps
+- `overhead`: `seconds / pandas_seconds`
+- `peak_rss`/`pandas_peak_rss`: peak resident memory above the input data (bytes)
+
+Results are printed as JSON lines (one object per case):
+
+```sh
+python benchmarks/verbs.py --max-rows 1e6 > bench.jsonl
+python benchmarks/verbs.py --verbs sort join group.rollup --shapes string
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+import redframes as rf
+
+SHAPES = ["numeric", "string", "high-cardinality"]
+SIZES = [10**3, 10**4, 10**5, 10**6, 10**7, 10**8]
+
+
+def make_frame(shape: str, rows: int) -> pd.DataFrame:
+    """key (group/join column), a (float), b (float with NaN), s ("x::y" string)"""
+    rng = np.random.default_rng(42)
+    if shape == "numeric":
+        key = rng.integers(0, 100, rows)
+    elif shape == "string":
+        key = rng.choice([f"key-{i:03d}" for i in range(100)], rows).astype(object)
+    elif shape == "high-cardinality":
+        key = rng.integers(0, max(rows // 2, 1), rows)
+    else:
+        raise ValueError(f"unknown shape {shape}")
+    b = rng.normal(size=rows)
+    b[rng.random(rows) < 0.1] = np.nan
+    words = np.array([f"w{i}::v{i % 7}" for i in range(1000)], dtype=object)
+    return pd.DataFrame(
+        {
+            "key": key,
+            "a": rng.normal(size=rows),
+            "b": b,
+            "s": words[rng.integers(0, len(words), rows)],
+        }
+    )
+
+
+def make_wide(rows: int) -> pd.DataFrame:
+    """id + var (10 values) + a, for spread"""
+    rng = np.random.default_rng(42)
+    ids = np.arange(rows)
+    return pd.DataFrame(
+        {"id": ids // 10, "var": (ids % 10).astype(str), "a": rng.normal(size=rows)}
+    )
+
+
+Case = Tuple[Callable[[Any], Any], Callable[[Any], Any], int]
+
+# verb -> (redframes call, raw pandas call, max rows)
+# both receive a dict with "rf"/"pd" frames (and a lookup table for joins)
+CASES: dict[str, Case] = {
+    "accumulate": (
+        lambda d: d["rf"].accumulate("a", into="c"),
+        lambda d: d["pd"].assign(c=d["pd"]["a"].cumsum()),
+        10**8,
+    ),
+    "append": (
+        lambda d: d["rf"].append(d["rf"]),
+        lambda d: pd.concat([d["pd"], d["pd"]], ignore_index=True),
+        10**8,
+    ),
+    "combine": (
+        lambda d: d["rf"].combine(["key", "s"], into="c", sep="-"),
+        lambda d: d["pd"]["key"].astype(str).str.cat(d["pd"]["s"], sep="-"),
+        10**7,
+    ),
+    "cross": (
+        lambda d: d["rf"].select(["key", "a"]).cross(),
+        lambda d: pd.merge(d["pd"][["key", "a"]], d["pd"][["key", "a"]], how="cross"),
+        10**3,
+    ),
+    "dedupe": (
+        lambda d: d["rf"].dedupe("key"),
+        lambda d: d["pd"].drop_duplicates("key"),
+        10**8,
+    ),
+    "denix": (
+        lambda d: d["rf"].denix("b"),
+        lambda d: d["pd"].dropna(subset=["b"]),
+        10**8,
+    ),
+    "drop": (
+        lambda d: d["rf"].drop("s"),
+        lambda d: d["pd"].drop(columns="s"),
+        10**8,
+    ),
+    "fill": (
+        lambda d: d["rf"].fill("b", direction="down"),
+        lambda d: d["pd"]["b"].ffill(),
+        10**8,
+    ),
+    "filter": (
+        lambda d: d["rf"].filter(lambda row: row["a"] > 0),
+        lambda d: d["pd"].loc[d["pd"]["a"] > 0],
+        10**8,
+    ),
+    "gather": (
+        lambda d: d["rf"].gather(["a", "b"]),
+        lambda d: pd.melt(d["pd"], id_vars=["key", "s"], value_vars=["a", "b"]),
+        10**8,
+    ),
+    "join": (
+        lambda d: d["rf"].join(d["rf_lookup"], on="key"),
+        lambda d: pd.merge(d["pd"], d["pd_lookup"], on="key", how="left"),
+        10**8,
+    ),
+    "mutate": (
+        lambda d: d["rf"].mutate({"c": lambda row: row["a"] * 2}),
+        lambda d: d["pd"].apply(lambda row: row["a"] * 2, axis=1),
+        10**5,
+    ),
+    "mutate.vectorized": (
+        lambda d: d["rf"].mutate({"c": lambda df: df["a"] * 2}, vectorized=True),
+        lambda d: d["pd"].assign(c=d["pd"]["a"] * 2),
+        10**8,
+    ),
+    "pack": (
+        lambda d: d["rf"].pack("s", sep="|"),
+        lambda d: d["pd"]["s"].str.cat(sep="|"),
+        10**7,
+    ),
+    "rank": (
+        lambda d: d["rf"].rank("a", into="r"),
+        lambda d: d["pd"]["a"].rank(method="dense"),
+        10**8,
+    ),
+    "rename": (
+        lambda d: d["rf"].rename({"a": "z"}),
+        lambda d: d["pd"].rename(columns={"a": "z"}),
+        10**8,
+    ),
+    "replace": (
+        lambda d: d["rf"].replace({"s": {"w1::v1": "w1"}}),
+        lambda d: d["pd"].replace({"s": {"w1::v1": "w1"}}),
+        10**8,
+    ),
+    "rollup": (
+        lambda d: d["rf"].rollup({"m": ("a", rf.stat.mean), "n": ("b", rf.stat.max)}),
+        lambda d: (d["pd"]["a"].mean(), d["pd"]["b"].max()),
+        10**8,
+    ),
+    "sample": (
+        lambda d: d["rf"].sample(0.5, seed=1),
+        lambda d: d["pd"].sample(frac=0.5, random_state=1),
+        10**8,
+    ),
+    "select": (
+        lambda d: d["rf"].select(["key", "a"]),
+        lambda d: d["pd"][["key", "a"]],
+        10**8,
+    ),
+    "shuffle": (
+        lambda d: d["rf"].shuffle(seed=1),
+        lambda d: d["pd"].sample(frac=1, random_state=1),
+        10**8,
+    ),
+    "sort": (
+        lambda d: d["rf"].sort("a"),
+        lambda d: d["pd"].sort_values("a"),
+        10**8,
+    ),
+    "split": (
+        lambda d: d["rf"].split("s", into=["s1", "s2"], sep="::"),
+        lambda d: d["pd"]["s"].str.split("::", expand=True),
+        10**8,
+    ),
+    "spread": (
+        lambda d: d["rf_wide"].spread("var", using="a"),
+        lambda d: d["pd_wide"].pivot(index="id", columns="var", values="a"),
+        10**7,
+    ),
+    "take": (
+        lambda d: d["rf"].take(-10),
+        lambda d: d["pd"].tail(10),
+        10**8,
+    ),
+    "unpack": (
+        lambda d: d["rf"].unpack("s", sep="::"),
+        lambda d: d["pd"].assign(s=d["pd"]["s"].str.split("::")).explode("s"),
+        10**7,
+    ),
+    "group.accumulate": (
+        lambda d: d["rf"].group("key").accumulate("a", into="c"),
+        lambda d: d["pd"].groupby("key", sort=False)["a"].cumsum(),
+        10**8,
+    ),
+    "group.gather": (
+        lambda d: d["rf"].select(["key", "a", "b"]).group("key").gather(),
+        lambda d: pd.melt(d["pd"][["key", "a", "b"]], id_vars=["key"]),
+        10**8,
+    ),
+    "group.pack": (
+        lambda d: d["rf"].group("key").pack("s", sep="|"),
+        lambda d: d["pd"].groupby("key", sort=False)["s"].agg("|".join),
+        10**7,
+    ),
+    "group.rank": (
+        lambda d: d["rf"].group("key").rank("a", into="r"),
+        lambda d: d["pd"].groupby("key", sort=False)["a"].rank(method="dense"),
+        10**8,
+    ),
+    "group.rollup": (
+        lambda d: d["rf"]
+        .group("key")
+        .rollup({"m": ("a", rf.stat.mean), "n": ("b", rf.stat.count)}),
+        lambda d: d["pd"]
+        .groupby("key", sort=False)
+        .agg(m=("a", "mean"), n=("b", "size")),
+        10**8,
+    ),
+    "group.take": (
+        lambda d: d["rf"].group("key").take(1),
+        lambda d: d["pd"].groupby("key", sort=False).head(1),
+        10**8,
+    ),
+}
+
+
+def _rss() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:  # not linux
+        return _peak()
+
+
+def _reset_peak() -> None:
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:  # not linux (peak then includes everything before the call)
+        pass
+
+
+def _peak() -> int:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def _time(func: Callable[[Any], Any], data: dict, repeat: int) -> tuple[float, int]:
+    best = float("inf")
+    peak = 0
+    for _ in range(repeat):
+        baseline = _rss()
+        _reset_peak()
+        start = time.perf_counter()
+        result = func(data)
+        best = min(best, time.perf_counter() - start)
+        peak = max(peak, _peak() - baseline)
+        del result
+    return best, peak
+
+
+def measure(verb: str, shape: str, rows: int, repeat: int) -> dict[str, Any]:
+    redframes_call, pandas_call, _ = CASES[verb]
+    pdf = make_frame(shape, rows)
+    lookup = pdf[["key"]].drop_duplicates().reset_index(drop=True)
+    lookup["value"] = np.arange(len(lookup))
+    data = {
+        "pd": pdf,
+        "rf": rf.wrap(pdf, copy=False),
+        "pd_lookup": lookup,
+        "rf_lookup": rf.wrap(lookup, copy=False),
+    }
+    if verb == "spread":  # (the only case that needs the wide frame)
+        wide = make_wide(rows)
+        data["pd_wide"], data["rf_wide"] = wide, rf.wrap(wide, copy=False)
+    seconds, peak = _time(redframes_call, data, repeat)
+    pandas_seconds, pandas_peak = _time(pandas_call, data, repeat)
+    return {
+        "verb": verb,
+        "shape": shape,
+        "rows": rows,
+        "seconds": seconds,
+        "pandas_seconds": pandas_seconds,
+        "overhead": seconds / pandas_seconds if pandas_seconds else None,
+        "peak_rss": peak,
+        "pandas_peak_rss": pandas_peak,
+        "redframes": rf.__version__,
+        "pandas": pd.__version__,
+        "python": platform.python_version(),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--verbs", nargs="*", default=list(CASES), choices=list(CASES))
+    parser.add_argument("--shapes", nargs="*", default=SHAPES, choices=SHAPES)
+    parser.add_argument("--min-rows", type=float, default=1e3)
+    parser.add_argument("--max-rows", type=float, default=1e6)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="-", help="JSON lines file (- = stdout)")
+    args = parser.parse_args(argv)
+    sizes = [size for size in SIZES if args.min_rows <= size <= args.max_rows]
+    context = multiprocessing.get_context("spawn")
+    output = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        for verb in args.verbs:
+            for shape in args.shapes:
+                for rows in sizes:
+                    if rows > CASES[verb][2]:
+                        continue
+                    # a fresh process per case keeps peak memory independent
+                    with ProcessPoolExecutor(1, mp_context=context) as pool:
+                        future = pool.submit(measure, verb, shape, rows, args.repeat)
+                        result = future.result()
+                    output.write(json.dumps(result) + "\n")
+                    output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
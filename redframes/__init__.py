@@ -1,4 +1,7 @@
 from . import stat
+from .cache import cache
 from .core import DataFrame
-from .io import load, save, unwrap, wrap
+from .engine import engine
+from .io import load, save, stream, unwrap, wrap
+from .profile import profile
 from .version import __version__
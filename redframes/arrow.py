@@ -0,0 +1,125 @@
+"""Arrow-backed column helpers (require the optional pyarrow dependency)"""
+
+from __future__ import annotations
+
+import numpy as np  # pyright: ignore[reportMissingImports]
+
+from .types import (
+    Any,
+    Column,
+    Columns,
+    DateTime,
+    PandasArrowDtype,
+    PandasDataFrame,
+    PandasSeries,
+    Values,
+)
+
+try:
+    import pyarrow as pa  # pyright: ignore[reportMissingImports]
+    import pyarrow.compute as pc  # pyright: ignore[reportMissingImports]
+except ImportError:  # pragma: no cover
+    pa = pc = None
+
+
+def _check_arrow() -> None:
+    if pa == None:
+        raise ImportError("arrow storage requires `pip install pyarrow`")
+
+
+def _has_arrow() -> bool:
+    return pa != None
+
+
+def _is_arrow(column: PandasSeries) -> bool:
+    return isinstance(column.dtype, PandasArrowDtype)
+
+
+def _to_list(column: PandasSeries) -> Values:
+    """Python values (None for nulls, not pd.NA)"""
+    return pa.array(column.array).to_pylist()  # type: ignore
+
+
+def _from_dict(data: dict[Column, Values]) -> PandasDataFrame:
+    _check_arrow()
+    table = pa.table({key: list(values) for key, values in data.items()})  # type: ignore
+    return table.to_pandas(types_mapper=PandasArrowDtype)
+
+
+def _python_type(dtype: PandasArrowDtype) -> type | PandasArrowDtype:
+    arrow_type = dtype.pyarrow_dtype
+    if pa.types.is_boolean(arrow_type):  # type: ignore
+        return bool
+    if pa.types.is_integer(arrow_type):  # type: ignore
+        return int
+    if pa.types.is_floating(arrow_type):  # type: ignore
+        return float
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):  # type: ignore
+        return str
+    if pa.types.is_timestamp(arrow_type):  # type: ignore
+        return DateTime
+    return dtype
+
+
+def _strings(column: PandasSeries) -> Any:
+    return pc.cast(pa.array(column.array), pa.string())  # type: ignore
+
+
+def _combine(df: PandasDataFrame, columns: Columns, sep: str) -> PandasSeries:
+    """Join columns element-wise (null if any of the values are null)"""
+    strings = [_strings(df[column]) for column in columns]
+    combined = pc.binary_join_element_wise(*strings, sep)  # type: ignore
+    return PandasSeries(combined, index=df.index, dtype=PandasArrowDtype(pa.string()))  # type: ignore
+
+
+def _flat(column: PandasSeries) -> Any:
+    """Contiguous Arrow strings (None if an object column holds non-strings)"""
+    if _is_arrow(column):
+        strings = _strings(column)
+    else:
+        try:
+            strings = pa.array(column.array, type=pa.string(), from_pandas=True)  # type: ignore
+        except (pa.ArrowInvalid, pa.ArrowTypeError):  # type: ignore
+            return None
+    if isinstance(strings, pa.ChunkedArray):  # type: ignore
+        strings = strings.combine_chunks()
+    return strings
+
+
+def _explode(strings: Any, sep: str) -> tuple[Any, Any]:
+    """Split into a list array: (parent row of every value, flat values)"""
+    lists = pc.split_pattern(strings, sep)  # type: ignore
+    lists = pc.fill_null(lists, pa.scalar([None], lists.type))  # type: ignore
+    return pc.list_parent_indices(lists).to_numpy(), pc.list_flatten(lists)  # type: ignore
+
+
+def _implode(strings: Any, codes: Any, groups: int, sep: str) -> Any:
+    """Join the (non-null) values of each group (`codes` number the rows' groups)"""
+    keep = (codes >= 0) & pc.is_valid(strings).to_numpy(zero_copy_only=False)  # type: ignore
+    rows = np.flatnonzero(keep)
+    rows = rows[np.argsort(codes[rows], kind="stable")]
+    offsets = np.concatenate(
+        [[0], np.cumsum(np.bincount(codes[rows], minlength=groups))]
+    )
+    lists = pa.LargeListArray.from_arrays(offsets, strings.take(rows))  # type: ignore
+    return pc.binary_join(lists, sep)  # type: ignore
+
+
+def _split(column: PandasSeries, sep: str, into: int) -> list[PandasSeries]:
+    """Split into (at most) `into` pieces, the last one keeps the remainder"""
+    strings = _strings(column)
+    if isinstance(strings, pa.ChunkedArray):  # type: ignore
+        strings = strings.combine_chunks()
+    lists = pc.split_pattern(strings, sep, max_splits=into - 1)  # type: ignore
+    flat = pc.list_flatten(lists)  # type: ignore
+    offsets = lists.offsets.to_numpy()
+    starts = offsets[:-1] - offsets[0]
+    lengths = pc.fill_null(pc.list_value_length(lists), 0).to_numpy()  # type: ignore
+    dtype = PandasArrowDtype(pa.string())  # type: ignore
+    pieces = []
+    for i in range(into):
+        found = lengths > i
+        indices = pa.array(np.where(found, starts + i, 0), mask=~found)  # type: ignore
+        piece = flat.take(indices) if len(flat) else pa.nulls(len(column), pa.string())  # type: ignore
+        pieces.append(PandasSeries(piece, index=column.index, dtype=dtype))
+    return pieces
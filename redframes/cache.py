@@ -0,0 +1,175 @@
+"""Opt-in memoization of (expensive) verb results"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import marshal
+import os
+import pickle
+from collections import OrderedDict
+from contextlib import contextmanager
+from types import FunctionType, ModuleType
+from typing import Callable, Iterator
+
+from .checks import _check_type
+from .hashing import _fingerprint
+from .types import Any, PandasDataFrame, PandasGroupedFrame
+
+_CACHE: OrderedDict[str, tuple[PandasDataFrame, int]] = OrderedDict()
+_SETTINGS: list[tuple[int, str | None]] = []
+
+
+class _Unkeyable(Exception):
+    pass
+
+
+@contextmanager
+def cache(budget: int = 2**30, path: str | None = None) -> Iterator[None]:
+    """Memoize `join`, `cross`, `rollup` and `spread` results (LRU, up to `budget` bytes)
+
+    Results are keyed by a fingerprint of the input data, the verb and its
+    arguments (functions by their code and the globals they read), and
+    survive across `with` blocks (and sessions, with `path`, where `budget`
+    also bounds the files on disk). Calls with lambdas (or other unkeyable
+    arguments) are never cached.
+
+    Example:
+
+    ```python
+    with rf.cache(budget=2**30, path=".redframes"):
+        df = facts.join(dim, on="key").group("key").rollup({"n": ("key", rf.stat.count)})
+    ```
+    """
+    _check_type(budget, int)
+    _check_type(path, {str, None})
+    if budget <= 0:
+        raise ValueError("must be > 0")
+    if path != None:
+        os.makedirs(path, exist_ok=True)
+    _SETTINGS.append((budget, path))
+    _evict(budget)
+    if path != None:
+        _evict_disk(budget, path)
+    try:
+        yield
+    finally:
+        _SETTINGS.pop()
+
+
+def _evict(budget: int) -> None:
+    total = sum(size for _, size in _CACHE.values())
+    while _CACHE and (total > budget):
+        _, (_, size) = _CACHE.popitem(last=False)
+        total -= size
+
+
+def _evict_disk(budget: int, path: str) -> None:
+    files = [entry for entry in os.scandir(path) if entry.name.endswith(".pkl")]
+    files.sort(key=lambda entry: entry.stat().st_mtime)  # least recently used first
+    total = sum(entry.stat().st_size for entry in files)
+    while files and (total > budget):
+        entry = files.pop(0)
+        total -= entry.stat().st_size
+        os.remove(entry.path)
+
+
+def _freeze_function(func: FunctionType, seen: frozenset[int]) -> Any:
+    """Key a function by its code and the (module level) globals it reads"""
+    code = hashlib.sha1(marshal.dumps(func.__code__)).hexdigest()
+    key = (func.__module__, func.__qualname__, code)
+    if id(func) in seen:  # recursion
+        return key
+    seen = seen | {id(func)}
+    key += (_freeze(func.__defaults__, seen), _freeze(func.__kwdefaults__, seen))
+    names = [name for name in func.__code__.co_names if name in func.__globals__]
+    refs = []
+    for name in names:
+        value = func.__globals__[name]
+        if isinstance(value, ModuleType):
+            refs.append((name, value.__name__))
+        else:
+            refs.append((name, _freeze(value, seen)))
+    return key + (tuple(refs),)
+
+
+def _freeze(value: Any, seen: frozenset[int] = frozenset()) -> Any:
+    if (value is None) or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v, seen) for v in value)
+    if isinstance(value, dict):
+        return tuple((_freeze(k, seen), _freeze(v, seen)) for k, v in value.items())
+    if isinstance(getattr(value, "_data", None), PandasDataFrame):
+        return ("DataFrame", value.fingerprint())
+    if callable(value):
+        name = getattr(value, "__qualname__", "<lambda>")
+        if ("<lambda>" in name) or ("<locals>" in name):
+            raise _Unkeyable()
+        if isinstance(value, FunctionType):
+            return _freeze_function(value, seen)
+        return (getattr(value, "__module__", None), name)
+    raise _Unkeyable()
+
+
+def _key(self: Any, verb: str, arguments: dict[str, Any]) -> str:
+    grouped = isinstance(self._data, PandasGroupedFrame)
+    fingerprint = _fingerprint(self._data.obj) if grouped else self.fingerprint()
+    groups = _freeze(self._data.keys) if grouped else None
+    frozen = (fingerprint, groups, verb, _freeze(arguments))
+    return hashlib.sha1(repr(frozen).encode()).hexdigest()
+
+
+def _load(key: str, budget: int, path: str | None) -> PandasDataFrame | None:
+    if key in _CACHE:
+        _CACHE.move_to_end(key)
+        return _CACHE[key][0]
+    file = None if (path == None) else os.path.join(path, f"{key}.pkl")
+    if (file == None) or not os.path.exists(file):
+        return None
+    with open(file, "rb") as f:
+        data = pickle.load(f)
+    os.utime(file)  # most recently used
+    _store(key, data, budget, None)
+    return data
+
+
+def _store(key: str, data: PandasDataFrame, budget: int, path: str | None) -> None:
+    size = int(data.memory_usage(deep=True).sum())
+    if size <= budget:
+        _CACHE[key] = (data, size)
+        _evict(budget)
+    if path != None:
+        file = os.path.join(path, f"{key}.pkl")
+        with open(f"{file}.tmp", "wb") as f:
+            pickle.dump(data, f)
+        os.replace(f"{file}.tmp", file)
+        _evict_disk(budget, path)
+
+
+def _cached(method: Callable) -> Callable:
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not _SETTINGS:
+            return method(self, *args, **kwargs)
+        budget, path = _SETTINGS[-1]
+        try:
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(list(bound.arguments.items())[1:])
+            key = _key(self, method.__name__, arguments)
+        except (_Unkeyable, TypeError):
+            return method(self, *args, **kwargs)
+        data = _load(key, budget, path)
+        if data is None:
+            result = method(self, *args, **kwargs)
+            _store(key, result._data, budget, path)
+            return result
+        from .core import _wrap
+
+        return _wrap(data)
+
+    return wrapper
@@ -9,6 +9,8 @@ from .types import (
     PandasRangeIndex,
 )
 
+_FORMATS = [".csv", ".parquet", ".feather", ".arrow", ".rf"]
+
 
 def _check_type(argument: Any, against: type | set[type | None]) -> None:
     if isinstance(against, set):
@@ -63,6 +65,6 @@ def _check_columns(df: PandasDataFrame) -> None:
         raise KeyError("must not contain duplicate keys")
 
 
-def _check_file(path: str) -> None:
-    if not path.endswith(".csv"):
-        raise TypeError("must end in .csv")
+def _check_file(path: str, formats: list[str] = _FORMATS) -> None:
+    if not path.endswith(tuple(formats)):
+        raise TypeError(f"must end in {' | '.join(formats)}")
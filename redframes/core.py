@@ -3,7 +3,13 @@ from __future__ import annotations
 import pprint
 import warnings
 
-from .checks import _check_type
+from .arrow import _from_dict, _is_arrow, _python_type, _to_list
+from .cache import _cached
+from .checks import _check_keys, _check_type
+from .encode import _check_ratio, _decode, _encode
+from .hashing import _fingerprint, _same_types
+from .index import _HashIndex
+from .profile import _profiled
 from .types import (
     Any,
     Column,
@@ -19,6 +25,8 @@ from .types import (
     NumpyType,
     OldColumn,
     OldValue,
+    PandasArrowDtype,
+    PandasCategoricalDtype,
     PandasDataFrame,
     PandasGroupedFrame,
     Value,
@@ -65,6 +73,7 @@ class _TakeMixin:
     def __init__(self, data: PandasDataFrame | PandasGroupedFrame) -> None:
         self._data = data
 
+    @_profiled
     def take(self, rows: int, **kwargs) -> DataFrame:
         """Take any number of rows (from the top/bottom)
 
@@ -130,6 +139,7 @@ class _CommonMixin(_TakeMixin):
     def __init__(self, data: PandasDataFrame | PandasGroupedFrame) -> None:
         self._data = data
 
+    @_profiled
     def accumulate(self, column: Column, into: Column) -> DataFrame:
         """Run a cumulative sum over a column
 
@@ -157,6 +167,7 @@ class _CommonMixin(_TakeMixin):
         """
         return _wrap(accumulate(self._data, column, into))
 
+    @_profiled
     def gather(
         self,
         columns: Columns | None = None,
@@ -165,6 +176,8 @@ class _CommonMixin(_TakeMixin):
     ):
         """Gather columns into rows (opposite of spread)
 
+        Null values are dropped, and the variable column is dictionary-encoded.
+
         Examples:
 
         ```python
@@ -240,6 +253,7 @@ class _CommonMixin(_TakeMixin):
         """
         return _wrap(gather(self._data, columns, beside, into))
 
+    @_profiled
     def pack(self, column: Column, sep: str) -> DataFrame:
         """Collate and concatenate row values for a target column (opposite of unpack)
 
@@ -282,6 +296,7 @@ class _CommonMixin(_TakeMixin):
         """
         return _wrap(pack(self._data, column, sep))
 
+    @_profiled
     def rank(
         self,
         column: Column,
@@ -322,7 +337,11 @@ class _CommonMixin(_TakeMixin):
         """
         return _wrap(rank(self._data, column, into, descending))
 
-    def rollup(self, over: dict[Column, tuple[Column, Func]]) -> DataFrame:
+    @_profiled
+    @_cached
+    def rollup(
+        self, over: dict[Column, tuple[Column, Func]], budget: int | None = None
+    ) -> DataFrame:
         """Apply summary functions and/or statistics to target columns
 
         Example:
@@ -352,8 +371,14 @@ class _CommonMixin(_TakeMixin):
         |   fcount |   fmean |   fsum |   fmax |   bmedian |   bmin |   bstd |
         |---------:|--------:|-------:|-------:|----------:|-------:|-------:|
         |        5 |       3 |     15 |      5 |         2 |     -5 |  54.93 |
+
+        Out-of-core (grouped, spills partial aggregates to disk above `budget` bytes):
+
+        ```python
+        df.group("foo").rollup({"bsum": ("bar", rf.stat.sum)}, budget=2**30)
+        ```
         """
-        return _wrap(rollup(self._data, over))
+        return _wrap(rollup(self._data, over, budget))
 
     def summarize(self, over: dict[Column, tuple[Column, Func]]) -> DataFrame:
         message = "Marked for removal, please use `rollup` instead"
@@ -372,10 +397,15 @@ class GroupedFrame(_CommonMixin):
 
 
 class DataFrame(_CommonMixin, _InterchangeMixin):
-    def __init__(self, data: dict[Column, Values] | None = None) -> None:
+    def __init__(
+        self,
+        data: dict[Column, Values] | None = None,
+        arrow: bool = False,
+        encode: float | None = None,
+    ) -> None:
         """Initialize a DataFrame with a standard dictionary
 
-        Example:
+        Examples:
 
         ```python
         df = rf.DataFrame({"foo": [1, 2], "bar": ["A", "B"]})
@@ -384,12 +414,36 @@ class DataFrame(_CommonMixin, _InterchangeMixin):
         |------:|:------|
         |     1 | A     |
         |     2 | B     |
+
+        Arrow-backed columns (requires pyarrow):
+
+        ```python
+        df = rf.DataFrame({"foo": [1, 2], "bar": ["A", "B"]}, arrow=True)
+        df.types
+        # {'foo': int, 'bar': str}
+        ```
+
+        Dictionary-encoded strings (when unique values / rows <= `encode`):
+
+        ```python
+        df = rf.DataFrame({"foo": range(4), "bar": ["A", "B", "A", "A"]}, encode=0.5)
+        df.types
+        # {'foo': int, 'bar': object}
+        ```
         """
         _check_type(data, {dict, None})
+        _check_type(arrow, bool)
+        _check_type(encode, {float, None})
+        _check_ratio(encode)
+        self._index = None
+        self._fingerprint: tuple[PandasDataFrame, str] | None = None
         if not data:
             self._data = PandasDataFrame()
-        if isinstance(data, dict):
+        elif arrow:
+            self._data = _from_dict(data)
+        else:
             self._data = PandasDataFrame(data)
+        self._data = _encode(self._data, encode)
 
     def __eq__(self, rhs: Any) -> bool:
         """Check if two DataFrames are equal to each other
@@ -408,7 +462,24 @@ class DataFrame(_CommonMixin, _InterchangeMixin):
         """
         if not isinstance(rhs, DataFrame):
             return False
-        return self._data.equals(rhs._data)
+        if self._data.shape != rhs._data.shape:
+            return False
+        if not self._data.columns.equals(rhs._data.columns):
+            return False
+        if not self._data.dtypes.equals(rhs._data.dtypes):
+            return False
+        lhs_fingerprint, rhs_fingerprint = self._fingerprinted(), rhs._fingerprinted()
+        mismatch = (
+            lhs_fingerprint and rhs_fingerprint and (lhs_fingerprint != rhs_fingerprint)
+        )
+        if mismatch:
+            return False
+        return self._data.equals(rhs._data) and _same_types(self._data, rhs._data)
+
+    def _fingerprinted(self) -> str | None:
+        if (self._fingerprint != None) and (self._fingerprint[0] is self._data):
+            return self._fingerprint[1]
+        return None
 
     def __getitem__(self, key: Column) -> Values:
         """Retrive values (as a python list) from a specified column
@@ -421,7 +492,10 @@ class DataFrame(_CommonMixin, _InterchangeMixin):
         # [1, 2]
         ```
         """
-        return list(self._data[key])
+        values = _decode(self._data, [key])[key]
+        if _is_arrow(values):
+            return _to_list(values)
+        return list(values)
 
     def __repr__(self) -> str:
         return self._data.__repr__()
@@ -534,10 +608,16 @@ class DataFrame(_CommonMixin, _InterchangeMixin):
         clean_types = {}
         for column in self.columns:
             current = raw_types[column]
+            if isinstance(current, PandasCategoricalDtype):  # encoded
+                current = current.categories.dtype
+            if isinstance(current, PandasArrowDtype):
+                clean_types[column] = _python_type(current)
+                continue
             clean = numpy_types.get(current, current)  # type: ignore
             clean_types[column] = clean
         return clean_types
 
+    @_profiled
     def append(self, other: DataFrame) -> DataFrame:
         """Append rows from another DataFrame
 
@@ -572,6 +652,7 @@ class DataFrame(_CommonMixin, _InterchangeMixin):
         _check_type(other, DataFrame)
         return _wrap(append(self._data, other._data))
 
+    @_profiled
     def combine(
         self, columns: Columns, into: Column, sep: str, drop: bool = True
     ) -> DataFrame:
@@ -597,6 +678,8 @@ class DataFrame(_CommonMixin, _InterchangeMixin):
         """
         return _wrap(combine(self._data, columns, into, sep, drop))
 
+    @_profiled
+    @_cached
     def cross(
         self, rhs: DataFrame | None = None, postfix: tuple[str, str] = ("_lhs", "_rhs")
     ) -> DataFrame:
@@ -655,6 +738,7 @@ class DataFrame(_CommonMixin, _InterchangeMixin):
         _check_type(rhs, DataFrame)
         return _wrap(cross(self._data, rhs._data, postfix))  # type: ignore
 
+    @_profiled
     def dedupe(self, columns: LazyColumns | None = None) -> DataFrame:
         """Remove duplicate rows
 
@@ -702,8 +786,9 @@ class DataFrame(_CommonMixin, _InterchangeMixin):
         |     2 | B     |
         |     2 | A     |
         """
-        return _wrap(dedupe(self._data, columns))
+        return _wrap(dedupe(self._data, columns, self._index))
 
+    @_profiled
     def denix(self, columns: LazyColumns | None = None) -> DataFrame:
         """Remove rows with *NaN/None* values
 
@@ -754,6 +839,7 @@ class DataFrame(_CommonMixin, _InterchangeMixin):
         """
         return _wrap(denix(self._data, columns))
 
+    @_profiled
     def drop(self, columns: LazyColumns) -> DataFrame:
         """Drop entire columns
 
@@ -785,6 +871,7 @@ class DataFrame(_CommonMixin, _InterchangeMixin):
         """
         return _wrap(drop(self._data, columns))
 
+    @_profiled
     def fill(
         self,
         columns: LazyColumns | None = None,
@@ -860,7 +947,8 @@ class DataFrame(_CommonMixin, _InterchangeMixin):
         """
         return _wrap(fill(self._data, columns, direction, constant))
 
-    def filter(self, func: Func) -> DataFrame:
+    @_profiled
+    def filter(self, func: Func, jit: bool = False) -> DataFrame:
         """Keep rows matching specific conditions
 
         Compatible operators: `|`, `&`, `< <= == != >= >`, `isin`
@@ -907,9 +995,38 @@ class DataFrame(_CommonMixin, _InterchangeMixin):
         |:------|------:|
         | A     |     1 |
         | B     |     4 |
+
+        Compiled (row-wise with numba, requires `pip install numba`):
+
+        ```python
+        df.filter(lambda row: row["bar"] % 2 == 0, jit=True)
+        ```
+        | foo   |   bar |
+        |:------|------:|
+        | A     |     2 |
+        | B     |     4 |
         """
-        return _wrap(filter(self._data, func))
+        return _wrap(filter(self._data, func, jit))
 
+    def fingerprint(self) -> str:
+        """Hash column names, types and values (stable across processes)
+
+        Example:
+
+        ```python
+        adf = rf.DataFrame({"foo": [1, 2], "bar": ["A", "B"]})
+        bdf = rf.DataFrame({"foo": [1, 2], "bar": ["A", "B"]})
+        adf.fingerprint() == bdf.fingerprint()
+        # True
+        ```
+        """
+        fingerprint = self._fingerprinted()
+        if fingerprint == None:
+            fingerprint = _fingerprint(self._data)
+            self._fingerprint = (self._data, fingerprint)
+        return fingerprint
+
+    @_profiled
     def group(self, by: LazyColumns) -> GroupedFrame:
         """Prepare groups for compatible verbs
 
@@ -1009,6 +1126,53 @@ class DataFrame(_CommonMixin, _InterchangeMixin):
         """
         return GroupedFrame(group(self._data, by))
 
+    @_profiled
+    def index_on(self, column: Column) -> DataFrame:
+        """Build a hash index on a key column (for `lookup`, `join` and `dedupe`)
+
+        Example:
+
+        ```python
+        df = rf.DataFrame({"foo": ["A", "B", "A", "C"], "bar": [1, 2, 3, 4]})
+        df = df.index_on("foo")
+        ```
+
+        + `lookup` (equality filter):
+
+        ```python
+        df.lookup(["A", "C"])
+        ```
+        | foo   |   bar |
+        |:------|------:|
+        | A     |     1 |
+        | A     |     3 |
+        | C     |     4 |
+
+        + `join` (left/inner, when this frame is the `rhs` and `on` is the key):
+
+        ```python
+        rf.DataFrame({"foo": ["C", "A"]}).join(df, on="foo")
+        ```
+
+        + `dedupe` (on the key):
+
+        ```python
+        df.dedupe("foo")
+        ```
+        | foo   |   bar |
+        |:------|------:|
+        | A     |     1 |
+        | B     |     2 |
+        | C     |     4 |
+        """
+        _check_type(column, str)
+        _check_keys(column, self._data.columns)
+        df = _wrap(self._data)
+        df._index = _HashIndex(self._data, column)
+        return df
+
+    @_profiled
+    @_cached
     def join(
         self,
         rhs: DataFrame,
@@ -1083,13 +1247,83 @@ class DataFrame(_CommonMixin, _InterchangeMixin):
         | D     |   nan | #     |
         """
         _check_type(rhs, DataFrame)
-        return _wrap(join(self._data, rhs._data, on, how, postfix))
+        return _wrap(join(self._data, rhs._data, on, how, postfix, rhs._index))
 
-    def mutate(self, over: dict[Column, Func]) -> DataFrame:
-        """Create a new, or overwrite an existing column
+    def lazy(self) -> "LazyFrame":  # type: ignore
+        """Record verbs into an optimized plan (that only runs on `collect`)
+
+        Example:
+
+        ```python
+        df = rf.DataFrame({"foo": [1, 2, 3, 4], "bar": ["A", "B", "C", "D"]})
+        ```
+        |   foo | bar   |
+        |------:|:------|
+        |     1 | A     |
+        |     2 | B     |
+        |     3 | C     |
+        |     4 | D     |
+
+        ```python
+        (
+            df.lazy()
+            .filter(lambda row: row["foo"] >= 2)
+            .select("bar")
+            .take(2)
+            .collect()
+        )
+        ```
+        | bar   |
+        |:------|
+        | B     |
+        | C     |
+        """
+        from .lazy import LazyFrame
+
+        return LazyFrame(self._data)
+
+    @_profiled
+    def lookup(self, keys: Value | Values) -> DataFrame:
+        """Keep rows where the indexed column matches any of the keys (see `index_on`)
 
         Example:
 
+        ```python
+        df = rf.DataFrame({"foo": ["A", "B", "A", "C"], "bar": [1, 2, 3, 4]})
+        ```
+        | foo   |   bar |
+        |:------|------:|
+        | A     |     1 |
+        | B     |     2 |
+        | A     |     3 |
+        | C     |     4 |
+
+        ```python
+        df.index_on("foo").lookup("A")
+        ```
+        | foo   |   bar |
+        |:------|------:|
+        | A     |     1 |
+        | A     |     3 |
+        """
+        if self._index == None:
+            raise ValueError("must be indexed, use index_on first")
+        keys = keys if isinstance(keys, list) else [keys]
+        data = self._data.take(self._index.positions(keys))
+        return _wrap(data.reset_index(drop=True))
+
+    @_profiled
+    def mutate(
+        self,
+        over: dict[Column, Func],
+        vectorized: bool = False,
+        workers: int | None = None,
+        jit: bool = False,
+    ) -> DataFrame:
+        """Create a new, or overwrite an existing column
+
+        Examples:
+
         ```python
         df = rf.DataFrame({"foo": [1, 2, 3]})
         ```
@@ -1099,6 +1333,8 @@ class DataFrame(_CommonMixin, _InterchangeMixin):
         |     2 |
         |     3 |
 
+        Row-wise (functions receive a single row):
+
         ```python
         df.mutate({
             "bar": lambda row: float(row["foo"]),
@@ -1111,9 +1347,46 @@ class DataFrame(_CommonMixin, _InterchangeMixin):
         |     1 |     1 | X2.0  | Jazz  |
         |     2 |     2 | X4.0  | Jazz  |
         |     3 |     3 | X6.0  | Jazz  |
+
+        Vectorized (functions receive whole columns):
+
+        ```python
+        df.mutate({
+            "bar": lambda df: df["foo"] * 1.5,
+            "baz": lambda df: "X" + (df["bar"] * 2).astype(str)
+        }, vectorized=True)
+        ```
+        |   foo |   bar | baz   |
+        |------:|------:|:------|
+        |     1 |   1.5 | X3.0  |
+        |     2 |   3   | X6.0  |
+        |     3 |   4.5 | X9.0  |
+
+        Parallel (row-wise functions run in a pool of processes):
+
+        ```python
+        df.mutate({"bar": lambda row: row["foo"] ** 2}, workers=4)
+        ```
+        |   foo |   bar |
+        |------:|------:|
+        |     1 |     1 |
+        |     2 |     4 |
+        |     3 |     9 |
+
+        Compiled (numeric row-wise functions with numba, requires `pip install numba`):
+
+        ```python
+        df.mutate({"bar": lambda row: row["foo"] ** 2}, jit=True)
+        ```
+        |   foo |   bar |
+        |------:|------:|
+        |     1 |     1 |
+        |     2 |     4 |
+        |     3 |     9 |
         """
-        return _wrap(mutate(self._data, over))
+        return _wrap(mutate(self._data, over, vectorized, workers, jit))
 
+    @_profiled
     def rename(self, columns: dict[OldColumn, NewColumn]) -> DataFrame:
         """Rename column keys (from "old" to "new")
 
@@ -1138,6 +1411,7 @@ class DataFrame(_CommonMixin, _InterchangeMixin):
         """
         return _wrap(rename(self._data, columns))
 
+    @_profiled
     def replace(self, over: dict[Column, dict[OldValue, NewValue]]) -> DataFrame:
         """Replace matching values within columns (from "old" to "new")
 
@@ -1170,6 +1444,7 @@ class DataFrame(_CommonMixin, _InterchangeMixin):
         """
         return _wrap(replace(self._data, over))
 
+    @_profiled
     def sample(self, rows: int | float, seed: int | None = None) -> DataFrame:
         """Randomly sample any number of rows
 
@@ -1224,6 +1499,7 @@ class DataFrame(_CommonMixin, _InterchangeMixin):
         """
         return _wrap(sample(self._data, rows, seed))
 
+    @_profiled
     def select(self, columns: LazyColumns) -> DataFrame:
         """Select specific columns
 
@@ -1259,6 +1535,7 @@ class DataFrame(_CommonMixin, _InterchangeMixin):
         """
         return _wrap(select(self._data, columns))
 
+    @_profiled
     def shuffle(self, seed: int | None = None) -> DataFrame:
         """Shuffle the order of all rows
 
@@ -1288,6 +1565,7 @@ class DataFrame(_CommonMixin, _InterchangeMixin):
         """
         return _wrap(shuffle(self._data, seed))
 
+    @_profiled
     def sort(self, columns: LazyColumns, descending: bool = False) -> DataFrame:
         """Sort rows by specific columns
 
@@ -1341,11 +1619,15 @@ class DataFrame(_CommonMixin, _InterchangeMixin):
         """
         return _wrap(sort(self._data, columns, descending))
 
+    @_profiled
     def split(
         self, column: Column, into: Columns, sep: str, drop: bool = True
     ) -> DataFrame:
         """Split a single column into multiple columns (opposite of `combine`)
 
+        Splits at most `len(into) - 1` times: the last column keeps the
+        remainder, and short rows are padded with nulls.
+
         Example:
 
         ```python
@@ -1368,6 +1650,8 @@ class DataFrame(_CommonMixin, _InterchangeMixin):
         """
         return _wrap(split(self._data, column, into, sep, drop))
 
+    @_profiled
+    @_cached
     def spread(self, column: Column, using: Column) -> DataFrame:
         """Spread rows into columns (opposite of `gather`)
 
@@ -1398,6 +1682,7 @@ class DataFrame(_CommonMixin, _InterchangeMixin):
         """
         return _wrap(spread(self._data, column, using))
 
+    @_profiled
     def unpack(self, column: Column, sep: str) -> DataFrame:
         """'Explode' concatenated row values into multiple rows (opposite of `pack`)
 
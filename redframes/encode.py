@@ -0,0 +1,104 @@
+"""Dictionary (categorical) encoding of low-cardinality string columns"""
+
+from __future__ import annotations
+
+import numpy as np  # pyright: ignore[reportMissingImports]
+import pandas as pd  # pyright: ignore[reportMissingImports]
+
+from .share import _assign
+from .types import (
+    Columns,
+    NewValue,
+    OldValue,
+    PandasCategoricalDtype,
+    PandasDataFrame,
+    PandasSeries,
+    Value,
+)
+
+
+def _check_ratio(ratio: float | None) -> None:
+    if (ratio != None) and not (0 < ratio <= 1):
+        raise ValueError("must be between 0 and 1")
+
+
+def _is_encodable(column: PandasSeries, ratio: float) -> bool:
+    if (column.dtype != object) or (len(column) == 0):
+        return False
+    values = column.dropna()
+    if not values.map(type).eq(str).all():
+        return False
+    return values.nunique() <= ratio * len(column)
+
+
+def _encode(df: PandasDataFrame, ratio: float | None) -> PandasDataFrame:
+    """Store string columns as integer codes + categories (unique/rows <= ratio)"""
+    if ratio == None:
+        return df
+    columns = [col for col in df.columns if _is_encodable(df[col], ratio)]
+    if not columns:
+        return df
+    return df.astype({col: "category" for col in columns})
+
+
+def _is_encoded(column: PandasSeries) -> bool:
+    return isinstance(column.dtype, PandasCategoricalDtype)
+
+
+def _sorted(column: PandasSeries) -> PandasSeries:
+    """Keep categories in value order (`sort` follows the category order)"""
+    try:
+        categories = sorted(column.cat.categories)
+    except TypeError:  # mixed types don't sort as values either
+        return column
+    return column.cat.reorder_categories(categories)
+
+
+def _decode(df: PandasDataFrame, columns: Columns) -> PandasDataFrame:
+    """Back to plain values (min/max, vectorized functions, `df[column]`)"""
+    decoded = {}
+    for col in columns:
+        if _is_encoded(df[col]):
+            values = df[col].astype(df[col].cat.categories.dtype)
+            if values.dtype == object:  # nulls as None (like unencoded strings)
+                values = values.where(values.notna(), None)
+            decoded[col] = values
+    return _assign(df, decoded) if decoded else df
+
+
+def _add_category(
+    df: PandasDataFrame, columns: Columns, value: Value
+) -> PandasDataFrame:
+    """Make room for a (fill) value in encoded columns"""
+    additions = {}
+    for col in columns:
+        if _is_encoded(df[col]) and (value not in df[col].cat.categories):
+            additions[col] = _sorted(df[col].cat.add_categories([value]))
+    return _assign(df, additions) if additions else df
+
+
+def _replace_encoded(
+    column: PandasSeries, mapping: dict[OldValue, NewValue]
+) -> PandasSeries:
+    """Replace values by rewriting the categories (and codes), not every row"""
+    categories = column.cat.categories.to_series().replace(mapping)
+    codes, uniques = pd.factorize(categories, sort=True, use_na_sentinel=True)
+    codes = np.append(codes, -1)[column.cat.codes.to_numpy()]  # null stays null
+    values = pd.Categorical.from_codes(codes, categories=uniques)
+    return PandasSeries(values, index=column.index, name=column.name)
+
+
+def _align(
+    lhs: PandasDataFrame, rhs: PandasDataFrame, on: Columns
+) -> tuple[PandasDataFrame, PandasDataFrame]:
+    """Share (sorted) categories across encoded columns (so merge can use the codes)"""
+    for col in on:
+        left, right = lhs[col], rhs[col]
+        if not (_is_encoded(left) and _is_encoded(right)):
+            continue
+        if left.cat.categories.equals(right.cat.categories):
+            continue
+        categories = left.cat.categories.union(right.cat.categories)
+        lhs = _assign(lhs, {col: _sorted(left.cat.set_categories(categories))})
+        rhs = _assign(rhs, {col: _sorted(right.cat.set_categories(categories))})
+    return lhs, rhs
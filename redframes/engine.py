@@ -0,0 +1,154 @@
+"""Execution engines (pandas by default, polars when requested)"""
+
+from __future__ import annotations
+
+import importlib.util
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+import numpy as np  # pyright: ignore[reportMissingImports]
+
+from .checks import _check_type
+from .types import Column, Func, Join, LazyColumns, PandasDataFrame
+
+_ENGINES = ["pandas", "polars"]
+# per thread/task (so concurrent `with rf.engine(...)` blocks don't interfere)
+_ENGINE: ContextVar[str] = ContextVar("redframes_engine", default="pandas")
+
+
+@contextmanager
+def engine(name: str) -> Iterator[None]:
+    """Run (compatible) verbs on a different execution engine
+
+    Compatible verbs: `join`, `rollup` (grouped), `sort`
+
+    Example:
+
+    ```python
+    df = rf.DataFrame({"foo": ["A", "B", "A"], "bar": [1, 2, 3]})
+    ```
+
+    ```python
+    with rf.engine("polars"):
+        df.group("foo").rollup({"bar": ("bar", rf.stat.sum)})
+    ```
+    | foo   |   bar |
+    |:------|------:|
+    | A     |     4 |
+    | B     |     2 |
+    """
+    _check_type(name, str)
+    if not name in _ENGINES:
+        raise ValueError("must be one of {'pandas', 'polars'}")
+    # polars is imported on first use (it adds ~0.3s to `import redframes`)
+    if (name == "polars") and (importlib.util.find_spec("polars") == None):
+        raise ImportError("polars engine requires `pip install polars pyarrow`")
+    token = _ENGINE.set(name)
+    try:
+        yield
+    finally:
+        _ENGINE.reset(token)
+
+
+def _engine() -> str:
+    return _ENGINE.get()
+
+
+def _to_polars(df: PandasDataFrame) -> "pl.DataFrame | None":  # type: ignore
+    import polars as pl  # pyright: ignore[reportMissingImports]
+
+    try:
+        return pl.from_pandas(df)  # type: ignore
+    except Exception:  # mixed object columns (and friends) stay on pandas
+        return None
+
+
+def _to_pandas(df: "pl.DataFrame") -> PandasDataFrame:  # type: ignore
+    return df.to_pandas()
+
+
+def _polars_join(
+    lhs: PandasDataFrame,
+    rhs: PandasDataFrame,
+    on: LazyColumns,
+    how: Join,
+    postfix: tuple[str, str],
+) -> PandasDataFrame | None:
+    import polars as pl  # pyright: ignore[reportMissingImports]
+
+    on = [on] if isinstance(on, str) else on
+    if how in {"inner", "full"}:  # pandas' row order isn't a sort of the inputs here
+        nulls = lhs[on].isna().any(axis=None) or rhs[on].isna().any(axis=None)
+        many = lhs.duplicated(on).any() and rhs.duplicated(on).any()
+        if nulls or ((how == "inner") and many):
+            return None
+    left, right = _to_polars(lhs), _to_polars(rhs)
+    if (left is None) or (right is None):
+        return None
+    overlap = [col for col in lhs.columns if (col in rhs.columns) and (col not in on)]
+    left = left.rename({col: f"{col}{postfix[0]}" for col in overlap})
+    right = right.rename({col: f"{col}{postfix[1]}" for col in overlap})
+    order = {"left": "left", "inner": "left", "right": "right", "full": "left_right"}
+    try:
+        df = left.join(
+            right,
+            on=on,
+            how=how,
+            nulls_equal=True,
+            coalesce=True,
+            maintain_order=order[how],  # type: ignore
+        )
+    except pl.exceptions.PolarsError:  # type: ignore
+        return None
+    if how == "full":
+        df = df.sort(on, nulls_last=True, maintain_order=True)
+    columns = [f"{col}{postfix[0]}" if col in overlap else col for col in lhs.columns]
+    columns += [f"{col}{postfix[1]}" if col in overlap else col for col in rhs.columns]
+    columns = [col for i, col in enumerate(columns) if col not in columns[:i]]
+    return _to_pandas(df.select(columns))
+
+
+def _polars_sort(
+    df: PandasDataFrame, columns: LazyColumns, descending: bool
+) -> PandasDataFrame | None:
+    data = _to_polars(df)
+    if data is None:
+        return None
+    data = data.sort(
+        columns, descending=descending, nulls_last=True, maintain_order=True
+    )
+    return _to_pandas(data)
+
+
+def _polars_aggregation(column: Column, func: Func) -> "pl.Expr | None":  # type: ignore
+    import polars as pl  # pyright: ignore[reportMissingImports]
+
+    expressions = {
+        len: lambda: pl.col(column).len().cast(pl.Int64),  # type: ignore
+        np.mean: lambda: pl.col(column).mean(),  # type: ignore
+        np.sum: lambda: pl.col(column).sum(),  # type: ignore
+        np.max: lambda: pl.col(column).max(),  # type: ignore
+        np.median: lambda: pl.col(column).median(),  # type: ignore
+        np.min: lambda: pl.col(column).min(),  # type: ignore
+        np.std: lambda: pl.col(column).std(),  # type: ignore
+    }
+    expression = expressions.get(func)  # type: ignore
+    return None if (expression == None) else expression()
+
+
+def _polars_rollup(
+    df: PandasDataFrame, by: list[Column], over: dict[Column, tuple[Column, Func]]
+) -> PandasDataFrame | None:
+    aggregations = []
+    for into, (column, func) in over.items():
+        aggregation = _polars_aggregation(column, func)
+        if aggregation is None:
+            return None
+        aggregations.append(aggregation.alias(into))
+    data = _to_polars(df)
+    if data is None:
+        return None
+    data = data.drop_nulls(by)
+    data = data.group_by(by, maintain_order=True).agg(aggregations)
+    return _to_pandas(data)
@@ -0,0 +1,60 @@
+"""Vectorized (per-column) content hashes for DataFrames"""
+
+from __future__ import annotations
+
+import hashlib
+
+import pandas as pd  # pyright: ignore[reportMissingImports]
+
+from .types import PandasDataFrame, PandasSeries
+
+
+def _objects(column: PandasSeries) -> PandasSeries:
+    is_category = isinstance(column.dtype, pd.CategoricalDtype)
+    if is_category and (column.dtype.categories.dtype == object):
+        return column.astype(object)
+    return column
+
+
+def _cell_types(column: PandasSeries) -> PandasSeries:
+    """Type name of every object cell (all nulls share one name)"""
+    types = column.map(lambda value: type(value).__qualname__, na_action="ignore")
+    return types.fillna("null")
+
+
+def _hash_column(column: PandasSeries) -> bytes:
+    column = _objects(column)
+    if column.dtype.kind == "f":
+        column = column + 0.0  # -0.0 == 0.0
+    try:
+        hashes = pd.util.hash_pandas_object(column, index=False)
+    except TypeError:  # unhashable values (lists, dicts, ...)
+        hashes = pd.util.hash_pandas_object(column.map(repr), index=False)
+    digest = hashlib.blake2b(hashes.to_numpy().tobytes(), digest_size=16)
+    if column.dtype == object:  # objects hash as strings: 1 vs "1" vs 1.0
+        types = pd.util.hash_pandas_object(_cell_types(column), index=False)
+        digest.update(types.to_numpy().tobytes())
+    return digest.digest()
+
+
+def _same_types(lhs: PandasDataFrame, rhs: PandasDataFrame) -> bool:
+    """Check that (equal) frames also agree on the type of every object cell"""
+    for position in range(lhs.shape[1]):
+        lhs_column = _objects(lhs.iloc[:, position])
+        if lhs_column.dtype != object:
+            continue
+        rhs_column = _objects(rhs.iloc[:, position])
+        if not _cell_types(lhs_column).equals(_cell_types(rhs_column)):
+            return False
+    return True
+
+
+def _fingerprint(df: PandasDataFrame) -> str:
+    """Hex digest over column names, dtypes and (row ordered) values"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(
+        repr([(str(col), str(dtype)) for col, dtype in df.dtypes.items()]).encode()
+    )
+    for position in range(df.shape[1]):
+        digest.update(_hash_column(df.iloc[:, position]))
+    return digest.hexdigest()
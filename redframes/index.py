@@ -0,0 +1,58 @@
+"""Hash index (key -> row positions) for a single DataFrame column"""
+
+from __future__ import annotations
+
+import numpy as np  # pyright: ignore[reportMissingImports]
+import pandas as pd  # pyright: ignore[reportMissingImports]
+
+from .types import Any, Column, NumpyArray, PandasDataFrame, PandasIndex
+
+
+def _ranges(starts: NumpyArray, lengths: NumpyArray) -> NumpyArray:
+    """Concatenated aranges: [starts[0], starts[0] + 1, ..., starts[1], ...]"""
+    firsts = np.cumsum(lengths) - lengths
+    return np.repeat(starts - firsts, lengths) + np.arange(lengths.sum())
+
+
+class _HashIndex:
+    def __init__(self, df: PandasDataFrame, column: Column) -> None:
+        codes, uniques = pd.factorize(df[column], use_na_sentinel=False)
+        self.column = column
+        self.dtype = df[column].dtype
+        self.keys = PandasIndex(uniques)
+        self.keys.get_indexer(self.keys[:1])  # build the hash table once, up front
+        self.rows = np.argsort(codes, kind="stable")  # grouped by key, in row order
+        self.offsets = np.concatenate([[0], np.cumsum(np.bincount(codes))])
+
+    def __repr__(self) -> str:
+        return f"HashIndex({self.column!r}, {len(self.keys)} keys)"
+
+    def _codes(self, keys: Any) -> NumpyArray:
+        keys = PandasIndex(keys)
+        keys = keys.where(keys.notna(), np.nan)  # factorize stores None as nan
+        return self.keys.get_indexer(keys)
+
+    def positions(self, keys: Any) -> NumpyArray:
+        """Row positions (in row order) for every row matching any of the keys"""
+        codes = self._codes(keys)
+        codes = np.unique(codes[codes >= 0])
+        starts, stops = self.offsets[codes], self.offsets[codes + 1]
+        return np.sort(self.rows[_ranges(starts, stops - starts)])
+
+    def firsts(self) -> NumpyArray:
+        """Row position of the first row for every key (in row order)"""
+        return np.sort(self.rows[self.offsets[:-1]])
+
+    def indexers(self, keys: NumpyArray, keep: bool) -> tuple[NumpyArray, NumpyArray]:
+        """Join indexers for probe keys (-1 = no match, keep = left join)"""
+        codes = self._codes(keys)
+        found = codes >= 0
+        matches = np.where(found, np.diff(self.offsets)[codes], 0)
+        left_idx = np.repeat(np.arange(len(keys)), matches)
+        right_idx = self.rows[_ranges(self.offsets[codes][found], matches[found])]
+        if keep:  # unmatched probe keys stay (in order) with a -1
+            left_idx = np.concatenate([left_idx, np.flatnonzero(~found)])
+            right_idx = np.concatenate([right_idx, np.full((~found).sum(), -1)])
+            order = np.argsort(left_idx, kind="stable")
+            left_idx, right_idx = left_idx[order], right_idx[order]
+        return left_idx, right_idx
@@ -1,3 +1,4 @@
 from .convert import unwrap, wrap
 from .load import load
 from .save import save
+from .stream import stream
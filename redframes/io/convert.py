@@ -5,9 +5,11 @@ from ..core import DataFrame
 from ..types import PandasDataFrame
 
 
-def unwrap(rdf: DataFrame) -> PandasDataFrame:
+def unwrap(rdf: DataFrame, copy: bool = True) -> PandasDataFrame:
     """Convert a rf.DataFrame into a pd.DataFrame (opposite of `wrap`)
 
+    Set `copy=False` for a zero-copy view (do not modify the result in place!)
+
     Example:
 
     ```python
@@ -16,12 +18,15 @@ def unwrap(rdf: DataFrame) -> PandasDataFrame:
     ```
     """
     _check_type(rdf, DataFrame)
-    return rdf._data.copy()
+    _check_type(copy, bool)
+    return rdf._data.copy() if copy else rdf._data
 
 
-def wrap(pdf: PandasDataFrame) -> DataFrame:
+def wrap(pdf: PandasDataFrame, copy: bool = True) -> DataFrame:
     """Convert a pd.DataFrame into a rf.DataFrame (opposite of `unwrap`)
 
+    Set `copy=False` to share memory with `pdf` (do not modify `pdf` afterwards!)
+
     Example:
 
     ```python
@@ -30,10 +35,11 @@ def wrap(pdf: PandasDataFrame) -> DataFrame:
     ```
     """
     _check_type(pdf, PandasDataFrame)
+    _check_type(copy, bool)
     _check_index(pdf)
     _check_columns(pdf)
     rdf = DataFrame()
-    rdf._data = pdf.copy()
+    rdf._data = pdf.copy() if copy else pdf
     return rdf
 
 
@@ -1,23 +1,53 @@
-import pandas as pd  # pyright: ignore[reportMissingImports]
+from __future__ import annotations
 
-from redframes.types import PandasDataFrame
+import pandas as pd  # pyright: ignore[reportMissingImports]
 
 from ..checks import _check_columns, _check_file, _check_index, _check_type
 from ..core import DataFrame, _wrap
+from ..encode import _check_ratio, _encode
+from ..types import PandasDataFrame
+from .native import _load_native
 
 
-def load(path: str, **kwargs) -> DataFrame:
-    """Load a csv file into a rf.DataFrame (opposite of `save`)
+def load(path: str, encode: float | None = None, **kwargs) -> DataFrame:
+    """Load a csv/parquet/feather/rf file into a rf.DataFrame (opposite of `save`)
 
-    Example:
+    Examples:
 
     ```python
     df = rf.load("example.csv")
     ```
+
+    Only read some columns (and row groups) from a parquet file:
+
+    ```python
+    df = rf.load("example.parquet", columns=["foo"], filters=[("foo", ">", 1)])
+    ```
+
+    Memory-map a native .rf directory (zero-copy, columns are paged in on use):
+
+    ```python
+    df = rf.load("example.rf", columns=["foo"])
+    ```
+
+    Dictionary-encode repeated strings (when unique values / rows <= `encode`):
+
+    ```python
+    df = rf.load("example.csv", encode=0.5)
+    ```
     """
     _check_type(path, str)
+    _check_type(encode, {float, None})
     _check_file(path)
-    data: PandasDataFrame = pd.read_csv(path, **kwargs)  # type: ignore
+    _check_ratio(encode)
+    if path.endswith(".rf"):
+        data: PandasDataFrame = _load_native(path, **kwargs)
+    elif path.endswith(".parquet"):
+        data = pd.read_parquet(path, **kwargs)  # type: ignore
+    elif path.endswith((".feather", ".arrow")):
+        data = pd.read_feather(path, **kwargs)  # type: ignore
+    else:
+        data = pd.read_csv(path, **kwargs)  # type: ignore
     _check_index(data)
     _check_columns(data)
-    return _wrap(data)
+    return _wrap(_encode(data, encode))
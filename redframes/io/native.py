@@ -0,0 +1,165 @@
+"""Native ".rf" column store (a directory of raw, memory-mappable buffers)
+
+example.rf/
+    schema.json           # rows + one spec per column
+    0.npy                 # numeric/bool/datetime values
+    1.offsets.npy         # strings: int64 offsets into...
+    1.data.npy            # ...utf-8 bytes
+    1.validity.npy        # ...and a (little endian) null bitmap
+    2.npy                 # encoded: integer codes
+    2.categories.*.npy    # ...and the categories (as a nested column)
+    3.pkl                 # anything else (pickled, loaded eagerly)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pickle
+import shutil
+
+import numpy as np  # pyright: ignore[reportMissingImports]
+import pandas as pd  # pyright: ignore[reportMissingImports]
+
+from ..types import (
+    Any,
+    Columns,
+    PandasArrowDtype,
+    PandasCategoricalDtype,
+    PandasDataFrame,
+    PandasSeries,
+)
+
+try:
+    import pyarrow as pa  # pyright: ignore[reportMissingImports]
+except ImportError:  # pragma: no cover
+    pa = None
+
+_SCHEMA = "schema.json"
+_VERSION = 1
+
+
+def _is_strings(column: PandasSeries) -> bool:
+    if isinstance(column.dtype, PandasArrowDtype):
+        arrow_type = column.dtype.pyarrow_dtype
+        return pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type)  # type: ignore
+    if column.dtype != object:
+        return False
+    return column.dropna().map(type).eq(str).all()
+
+
+def _string_buffers(column: PandasSeries) -> tuple[Any, Any]:
+    if pa != None:
+        array = pa.array(column.array, type=pa.large_string(), from_pandas=True)
+        _, offsets, data = array.buffers()
+        offsets = np.frombuffer(offsets, dtype=np.int64)[: len(array) + 1]
+        data = np.frombuffer(data, dtype=np.uint8) if data else np.empty(0, np.uint8)
+        return offsets, data[: offsets[-1]]
+    valid = column.notna().to_numpy()
+    encoded = [value.encode("utf-8") for value in column[valid]]
+    lengths = np.zeros(len(column), dtype=np.int64)
+    lengths[valid] = [len(value) for value in encoded]
+    offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+    return offsets, np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+
+def _write_strings(column: PandasSeries, stem: str) -> None:
+    valid = column.notna().to_numpy()
+    offsets, data = _string_buffers(column)
+    np.save(f"{stem}.offsets.npy", offsets)
+    np.save(f"{stem}.data.npy", data)
+    np.save(f"{stem}.validity.npy", np.packbits(valid, bitorder="little"))
+
+
+def _arrow_type(column: PandasSeries) -> str | None:
+    if isinstance(column.dtype, PandasArrowDtype):
+        return str(column.dtype.pyarrow_dtype)
+    return None  # (object)
+
+
+def _read_strings(stem: str, arrow_type: str | None) -> Any:
+    offsets = np.load(f"{stem}.offsets.npy", mmap_mode="r")
+    rows = len(offsets) - 1
+    data = np.load(f"{stem}.data.npy", mmap_mode="r")
+    validity = np.load(f"{stem}.validity.npy", mmap_mode="r")
+    if pa != None:  # zero-copy: arrow reads the mapped buffers directly
+        buffers = [pa.py_buffer(b) for b in [validity, offsets, data]]
+        array = pa.LargeStringArray.from_buffers(
+            rows, buffers[1], buffers[2], buffers[0]
+        )
+        if arrow_type == None:  # saved from an object column
+            return array.to_numpy(zero_copy_only=False)
+        if arrow_type != "large_string":
+            array = array.cast(pa.type_for_alias(arrow_type))
+        return pd.arrays.ArrowExtensionArray(array)
+    valid = np.unpackbits(validity, count=rows, bitorder="little").astype(bool)
+    raw = data.tobytes()
+    values = np.full(rows, None, dtype=object)
+    for i in np.flatnonzero(valid):
+        values[i] = raw[offsets[i] : offsets[i + 1]].decode("utf-8")
+    return values
+
+
+def _write_column(column: PandasSeries, stem: str) -> dict[str, Any]:
+    if isinstance(column.dtype, PandasCategoricalDtype):
+        np.save(f"{stem}.npy", column.cat.codes.to_numpy())
+        categories = PandasSeries(column.cat.categories)
+        spec = _write_column(categories, f"{stem}.categories")
+        return {"kind": "category", "categories": spec}
+    if _is_strings(column):
+        _write_strings(column, stem)
+        return {"kind": "strings", "arrow": _arrow_type(column)}
+    if isinstance(column.dtype, np.dtype) and (column.dtype.kind in "biufmM"):
+        np.save(f"{stem}.npy", column.to_numpy())
+        return {"kind": "numpy"}
+    with open(f"{stem}.pkl", "wb") as f:
+        pickle.dump(column, f)
+    return {"kind": "pickle"}
+
+
+def _read_column(spec: dict[str, Any], stem: str) -> Any:
+    if spec["kind"] == "numpy":
+        return np.load(f"{stem}.npy", mmap_mode="r")
+    if spec["kind"] == "strings":
+        return _read_strings(stem, spec.get("arrow", "large_string"))
+    if spec["kind"] == "category":
+        codes = np.load(f"{stem}.npy", mmap_mode="r")
+        categories = _read_column(spec["categories"], f"{stem}.categories")
+        categories = np.asarray(categories, dtype=object)  # (small) python objects
+        dtype = PandasCategoricalDtype(pd.Index(categories))
+        return pd.Categorical.from_codes(codes, dtype=dtype, validate=False)
+    with open(f"{stem}.pkl", "rb") as f:
+        return pickle.load(f).array
+
+
+def _save_native(df: PandasDataFrame, path: str, **kwargs) -> None:
+    if kwargs:
+        raise TypeError(f"unexpected keyword arguments for .rf: {', '.join(kwargs)}")
+    if os.path.exists(path) and not os.path.exists(os.path.join(path, _SCHEMA)):
+        raise FileExistsError("must be a new path or an existing .rf directory")
+    temp = f"{path}.tmp"
+    shutil.rmtree(temp, ignore_errors=True)
+    os.makedirs(temp)
+    specs = []
+    for i, column in enumerate(df.columns):
+        spec = _write_column(df[column], os.path.join(temp, str(i)))
+        specs.append({"name": column, **spec})
+    schema = {"version": _VERSION, "rows": len(df), "columns": specs}
+    with open(os.path.join(temp, _SCHEMA), "w") as f:
+        json.dump(schema, f)
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(temp, path)
+
+
+def _load_native(path: str, columns: Columns | None = None) -> PandasDataFrame:
+    """Memory-map a .rf directory (pages are only read as columns are touched)"""
+    with open(os.path.join(path, _SCHEMA)) as f:
+        schema = json.load(f)
+    rows, data = schema["rows"], {}
+    for i, spec in enumerate(schema["columns"]):
+        if (columns != None) and (spec["name"] not in columns):
+            continue
+        values = _read_column(spec, os.path.join(path, str(i)))
+        data[spec["name"]] = PandasSeries(values, copy=False)
+    index, names = pd.RangeIndex(rows), list(data.keys())
+    return PandasDataFrame(data, index=index, columns=names, copy=False)
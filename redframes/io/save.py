@@ -1,17 +1,62 @@
+from __future__ import annotations
+
+import os
+
 from ..checks import _check_file, _check_type
 from ..core import DataFrame
+from .native import _save_native
+from .stream import Stream
+
+
+def _save_stream(stream: Stream, path: str, **kwargs) -> None:
+    """Write to a temp file first (the stream might still be reading `path`)"""
+    header, temp = True, f"{path}.tmp"
+    try:
+        with open(temp, "w", newline="") as f:
+            for chunk in stream:
+                chunk._data.to_csv(f, index=False, header=header, **kwargs)
+                header = False
+    except BaseException:
+        if os.path.exists(temp):
+            os.remove(temp)
+        raise
+    os.replace(temp, path)
 
 
-def save(df: DataFrame, path: str, **kwargs) -> None:
-    """Save a rf.DataFrame to a csv file (opposite of `load`)
+def save(df: DataFrame | Stream, path: str, **kwargs) -> None:
+    """Save a rf.DataFrame to a csv/parquet/feather/rf file (opposite of `load`)
 
-    Example:
+    Examples:
 
     ```python
     rf.save(df, "example.csv")
     ```
+
+    ```python
+    rf.save(df, "example.parquet")
+    ```
+
+    ```python
+    rf.save(df, "example.rf")
+    ```
+
+    ```python
+    rf.save(rf.stream("big.csv").denix(), "example.csv")
+    ```
     """
+    if isinstance(df, Stream):
+        _check_type(path, str)
+        _check_file(path, [".csv"])
+        _save_stream(df, path, **kwargs)
+        return
     _check_type(df, DataFrame)
     _check_type(path, str)
     _check_file(path)
-    df._data.to_csv(path, index=False, **kwargs)
+    if path.endswith(".rf"):
+        _save_native(df._data, path, **kwargs)
+    elif path.endswith(".parquet"):
+        df._data.to_parquet(path, index=False, **kwargs)
+    elif path.endswith((".feather", ".arrow")):
+        df._data.to_feather(path, **kwargs)
+    else:
+        df._data.to_csv(path, index=False, **kwargs)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from typing import Iterator
+
+import pandas as pd  # pyright: ignore[reportMissingImports]
+
+from ..checks import _check_columns, _check_file, _check_type
+from ..core import DataFrame, _wrap
+from ..lazy import _execute, _Step
+from ..types import (
+    Column,
+    Columns,
+    Func,
+    LazyColumns,
+    NewColumn,
+    NewValue,
+    OldColumn,
+    OldValue,
+    Value,
+)
+
+
+class Stream:
+    """Stream applies row-local verbs to every chunk of a csv file"""
+
+    def __init__(
+        self, path: str, chunksize: int, kwargs: dict, plan: list[_Step] | None = None
+    ) -> None:
+        self._path = path
+        self._chunksize = chunksize
+        self._kwargs = kwargs
+        self._plan = [] if (plan == None) else plan
+
+    def __repr__(self) -> str:
+        steps = [f"  {i}. {step!r}" for i, step in enumerate(self._plan)]
+        header = f"Stream({self._path!r}, chunksize={self._chunksize})"
+        return "\n".join([header] + steps)
+
+    def __iter__(self) -> Iterator[DataFrame]:
+        with pd.read_csv(self._path, chunksize=self._chunksize, **self._kwargs) as reader:  # type: ignore
+            for chunk in reader:
+                chunk = chunk.reset_index(drop=True)
+                _check_columns(chunk)
+                yield _wrap(_execute(chunk, self._plan))
+
+    def _then(self, verb: str, *args) -> Stream:
+        plan = self._plan + [_Step(verb, args)]
+        return Stream(self._path, self._chunksize, self._kwargs, plan)
+
+    def combine(
+        self, columns: Columns, into: Column, sep: str, drop: bool = True
+    ) -> Stream:
+        return self._then("combine", columns, into, sep, drop)
+
+    def denix(self, columns: LazyColumns | None = None) -> Stream:
+        return self._then("denix", columns)
+
+    def drop(self, columns: LazyColumns) -> Stream:
+        return self._then("drop", columns)
+
+    def fill(
+        self, columns: LazyColumns | None = None, constant: Value | None = None
+    ) -> Stream:
+        if constant == None:
+            raise ValueError("constant must not be None")
+        return self._then("fill", columns, None, constant)
+
+    def filter(self, func: Func) -> Stream:
+        return self._then("filter", func)
+
+    def mutate(
+        self,
+        over: dict[Column, Func],
+        vectorized: bool = False,
+        workers: int | None = None,
+        jit: bool = False,
+    ) -> Stream:
+        return self._then("mutate", over, vectorized, workers, jit)
+
+    def rename(self, columns: dict[OldColumn, NewColumn]) -> Stream:
+        return self._then("rename", columns)
+
+    def replace(self, over: dict[Column, dict[OldValue, NewValue]]) -> Stream:
+        return self._then("replace", over)
+
+    def select(self, columns: LazyColumns) -> Stream:
+        return self._then("select", columns)
+
+    def split(
+        self, column: Column, into: Columns, sep: str, drop: bool = True
+    ) -> Stream:
+        return self._then("split", column, into, sep, drop)
+
+
+def stream(path: str, chunksize: int = 100_000, **kwargs) -> Stream:
+    """Stream a csv file in chunks (for files that don't fit in memory)
+
+    Compatible verbs: `combine`, `denix`, `drop`, `fill` (constant), `filter`,
+    `mutate`, `rename`, `replace`, `select`, `split`
+
+    Example:
+
+    ```python
+    s = rf.stream("example.csv", chunksize=10_000)
+    s = s.filter(lambda row: row["foo"] > 1).select(["foo", "bar"])
+    rf.save(s, "filtered.csv")
+    ```
+
+    ```python
+    for df in rf.stream("example.csv", chunksize=10_000):
+        print(df.dimensions)
+    ```
+    """
+    _check_type(path, str)
+    _check_type(chunksize, int)
+    _check_file(path, [".csv"])
+    if chunksize <= 0:
+        raise ValueError("must be > 0")
+    return Stream(path, chunksize, kwargs)
@@ -0,0 +1,100 @@
+"""Numba-compiled row functions (require the optional numba dependency)"""
+
+from __future__ import annotations
+
+import importlib.util
+from collections import OrderedDict
+from types import ModuleType
+
+import numpy as np  # pyright: ignore[reportMissingImports]
+
+from .types import Any, Func, NumpyArray, PandasDataFrame, PandasSeries
+
+_KERNELS: OrderedDict[Any, Any] = OrderedDict()
+_MAX_KERNELS = 256
+
+
+def _check_numba() -> None:
+    # numba is imported on first use (it adds ~0.5s to `import redframes`)
+    if importlib.util.find_spec("numba") == None:
+        raise ImportError("jit requires `pip install numba`")
+
+
+def _records(df: PandasDataFrame) -> NumpyArray:
+    """Pack the numeric columns into a structured array (one record per row)"""
+    columns = [col for col in df.columns if isinstance(df[col].dtype, np.dtype)]
+    columns = [col for col in columns if df[col].dtype.kind in "biuf"]
+    common = df.head(1).to_numpy().dtype  # what `apply` rows are cast to
+    dtypes = {
+        col: common if common.kind in "biuf" else df[col].dtype for col in columns
+    }
+    records = np.empty(len(df), dtype=list(dtypes.items()))
+    for col in columns:
+        records[col] = df[col].to_numpy()
+    return records
+
+
+def _key(func: Func, dtype: np.dtype) -> Any:
+    """numba freezes globals and closure variables, so they belong in the key
+    (None if they can't be hashed: compile without caching)"""
+    try:
+        code, namespace = func.__code__, func.__globals__
+    except AttributeError:
+        return (func, dtype)
+    try:
+        cells = tuple(cell.cell_contents for cell in (func.__closure__ or ()))
+        names = [name for name in code.co_names if name in namespace]
+        values = [namespace[name] for name in names]
+        values = [v.__name__ if isinstance(v, ModuleType) else v for v in values]
+        key = (code, cells, tuple(zip(names, values)), dtype)
+        hash(key)
+    except (TypeError, ValueError):
+        return None
+    return key
+
+
+def _compile(func: Func) -> Any:
+    import numba  # pyright: ignore[reportMissingImports]
+
+    row = numba.njit(func)
+
+    @numba.njit
+    def kernel(records, out):
+        for i in range(len(records)):
+            out[i] = row(records[i])
+
+    return row, kernel
+
+
+def _jit_apply(df: PandasDataFrame, func: Func) -> PandasSeries | None:
+    """Run a row function as a compiled loop (None if numba can't handle it)"""
+    if len(df) == 0:
+        return None
+    records = _records(df)
+    key = _key(func, records.dtype)
+    if key in _KERNELS:
+        _KERNELS.move_to_end(key)
+        compiled = _KERNELS[key]
+    else:
+        try:
+            compiled = _compile(func)
+        except Exception:
+            compiled = None
+        if key != None:
+            _KERNELS[key] = compiled
+            if len(_KERNELS) > _MAX_KERNELS:
+                _KERNELS.popitem(last=False)
+    if compiled == None:
+        return None
+    row, kernel = compiled
+    try:
+        first = row(records[0])
+        if not isinstance(first, (bool, int, float, np.bool_, np.number)):
+            return None
+        out = np.empty(len(records), dtype=np.asarray(first).dtype)
+        kernel(records, out)
+    except Exception:
+        if key in _KERNELS:
+            _KERNELS[key] = None
+        return None
+    return PandasSeries(out, index=df.index)
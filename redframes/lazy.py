@@ -0,0 +1,486 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+import numpy as np  # pyright: ignore[reportMissingImports]
+
+from .checks import _check_type
+from .core import DataFrame, _wrap
+from .profile import _profiled
+from .types import (
+    Any,
+    Column,
+    Columns,
+    Direction,
+    Func,
+    Join,
+    LazyColumns,
+    NewColumn,
+    NewValue,
+    OldColumn,
+    OldValue,
+    PandasDataFrame,
+    Value,
+)
+from .verbs import (
+    accumulate,
+    append,
+    combine,
+    cross,
+    dedupe,
+    denix,
+    drop,
+    fill,
+    filter,
+    gather,
+    join,
+    mutate,
+    pack,
+    rank,
+    rename,
+    replace,
+    rollup,
+    sample,
+    select,
+    shuffle,
+    sort,
+    split,
+    spread,
+    take,
+    unpack,
+)
+
+_VERBS = {
+    "accumulate": accumulate,
+    "append": append,
+    "combine": combine,
+    "cross": cross,
+    "dedupe": dedupe,
+    "denix": denix,
+    "drop": drop,
+    "fill": fill,
+    "filter": filter,
+    "gather": gather,
+    "join": join,
+    "mutate": mutate,
+    "pack": pack,
+    "rank": rank,
+    "rename": rename,
+    "replace": replace,
+    "rollup": rollup,
+    "sample": sample,
+    "select": select,
+    "shuffle": shuffle,
+    "sort": sort,
+    "split": split,
+    "spread": spread,
+    "take": take,
+    "unpack": unpack,
+}
+
+# steps that keep every row (in order) and compute each row independently
+_ROW_LOCAL = {"combine", "drop", "rename", "replace", "select", "split"}
+
+
+class _Step(NamedTuple):
+    verb: str
+    args: tuple
+    keep: Columns | None = None
+    row_local: bool = False
+
+    def __repr__(self) -> str:
+        args = ", ".join(repr(arg) for arg in self.args)
+        if self.keep != None:
+            return f"{self.verb}({args}) -> {self.keep}"
+        return f"{self.verb}({args})"
+
+
+def _conjoin(funcs: list[Func]) -> Func:
+    """Fuse consecutive filters (each one still sees a freshly reset index)"""
+
+    def func(df: PandasDataFrame) -> Any:
+        rows = np.arange(len(df))
+        subset = df.reset_index(drop=True)
+        for f in funcs:
+            subset = subset.loc[f]
+            rows = rows[subset.index.to_numpy()]
+            subset = subset.reset_index(drop=True)
+        mask = np.zeros(len(df), dtype=bool)
+        mask[rows] = True
+        return mask
+
+    return func
+
+
+def _push_filters(plan: list[_Step]) -> list[_Step]:
+    """Predicate pushdown: filter rows before sorting them (row-local predicates only)"""
+    plan = list(plan)
+    for i in range(1, len(plan)):
+        j = i
+        while j > 0 and plan[j].row_local and plan[j - 1].verb == "sort":
+            plan[j - 1], plan[j] = plan[j], plan[j - 1]
+            j -= 1
+    return plan
+
+
+def _fuse_filters(plan: list[_Step]) -> list[_Step]:
+    """Fuse runs of filters into one step (one `reset_index` instead of many)"""
+    fused: list[_Step] = []
+    run: list[_Step] = []
+    for step in plan + [_Step("", ())]:
+        if step.verb == "filter":
+            run.append(step)
+            continue
+        if len(run) == 1:
+            fused.append(run[0])
+        if len(run) > 1:
+            funcs = [filtered.args[0] for filtered in run]
+            row_local = all(filtered.row_local for filtered in run)
+            fused.append(_Step("filter", (_conjoin(funcs),), row_local=row_local))
+        run = []
+        if step.verb:
+            fused.append(step)
+    return fused
+
+
+def _push_takes(plan: list[_Step]) -> list[_Step]:
+    """Limit pushdown: take rows before running row-local steps"""
+    plan = list(plan)
+    for i in range(1, len(plan)):
+        j = i
+        while j > 0 and plan[j].verb == "take":
+            previous = plan[j - 1]
+            row_wise_mutate = (previous.verb == "mutate") and not previous.args[1]
+            if not ((previous.verb in _ROW_LOCAL) or row_wise_mutate):
+                break
+            plan[j - 1], plan[j] = plan[j], plan[j - 1]
+            j -= 1
+    return plan
+
+
+def _references(step: _Step) -> set[Column] | None:
+    """Columns that a step explicitly references (None if unknown)"""
+    verb, args = step.verb, step.args
+    if verb in {"select", "drop", "sort", "dedupe", "denix", "fill"}:
+        columns = args[0]
+        columns = [] if (columns == None) else columns
+        return {columns} if isinstance(columns, str) else set(columns)
+    if verb in {"rename", "replace"}:
+        return set(args[0].keys())
+    if verb in {"accumulate", "rank", "split", "unpack", "pack"}:
+        return {args[0]}
+    if verb == "combine":
+        return set(args[0])
+    if verb == "rollup":
+        return {column for column, _ in args[0].values()}
+    if verb in {"take", "shuffle", "sample"}:
+        return set()
+    return None
+
+
+def _schema(step: _Step, columns: Columns | None) -> Columns | None:
+    """Columns after running a step (None if unknown)"""
+    verb, args = step.verb, step.args
+    if columns == None:
+        return None
+    if verb == "select":
+        return [args[0]] if isinstance(args[0], str) else list(args[0])
+    if verb == "drop":
+        dropped = [args[0]] if isinstance(args[0], str) else args[0]
+        return [col for col in columns if col not in dropped]
+    if verb == "rename":
+        return [args[0].get(col, col) for col in columns]
+    if verb in {"accumulate", "rank"}:
+        return columns + [args[1]] if args[1] not in columns else columns
+    if verb == "combine":
+        kept = [col for col in columns if col not in args[0]] if args[3] else columns
+        return kept + [args[1]] if args[1] not in kept else kept
+    if verb == "split":
+        kept = [col for col in columns if col != args[0]] if args[3] else columns
+        return kept + args[1]
+    if verb == "mutate":
+        return columns + [col for col in args[0] if col not in columns]
+    if verb == "rollup":
+        return list(args[0].keys())
+    if verb == "pack":
+        return [args[0]]
+    if verb in {
+        "dedupe",
+        "denix",
+        "fill",
+        "filter",
+        "replace",
+        "sample",
+        "shuffle",
+        "sort",
+        "take",
+        "unpack",
+    }:
+        return columns
+    return None
+
+
+def _needs(step: _Step, needed: set[Column] | None) -> set[Column] | None:
+    """Columns required before a step, given those required after it"""
+    verb, args = step.verb, step.args
+    if verb == "select":
+        columns = [args[0]] if isinstance(args[0], str) else args[0]
+        return set(columns) if (needed == None) else set(columns) & needed
+    if verb == "rollup":
+        return {column for column, _ in args[0].values()}
+    if verb == "pack":
+        return {args[0]}
+    if needed == None:
+        return None
+    if verb in {"drop", "fill", "replace", "take", "shuffle", "sample"}:
+        return needed
+    if verb in {"sort", "unpack"}:
+        return needed | (_references(step) or set())
+    if verb in {"dedupe", "denix"}:
+        return None if (args[0] == None) else needed | _references(step)  # type: ignore
+    if verb == "rename":
+        inverse = {new: old for old, new in args[0].items()}
+        return {inverse.get(col, col) for col in needed}
+    if verb in {"accumulate", "rank"}:
+        return (needed - {args[1]}) | {args[0]}
+    if verb == "combine":
+        return (needed - {args[1]}) | set(args[0])
+    if verb == "split":
+        return (needed - set(args[1])) | {args[0]}
+    return None
+
+
+def _trim(step: _Step, columns: Columns) -> _Step | None:
+    """Rewrite a step so that it only touches columns that survived pruning"""
+    verb, args = step.verb, step.args
+    if verb == "select":
+        selected = [args[0]] if isinstance(args[0], str) else args[0]
+        return _Step(verb, ([col for col in selected if col in columns],))
+    if verb == "drop":
+        dropped = [args[0]] if isinstance(args[0], str) else args[0]
+        dropped = [col for col in dropped if col in columns]
+        return _Step(verb, (dropped,)) if dropped else None
+    if verb == "rename":
+        mapping = {old: new for old, new in args[0].items() if old in columns}
+        return _Step(verb, (mapping,)) if mapping else None
+    if verb == "replace":
+        over = {col: values for col, values in args[0].items() if col in columns}
+        return _Step(verb, (over,)) if over else None
+    if (verb == "fill") and (args[0] != None):
+        filled = [args[0]] if isinstance(args[0], str) else args[0]
+        filled = [col for col in filled if col in columns]
+        return _Step(verb, (filled,) + args[1:]) if filled else None
+    return step
+
+
+def _prune(plan: list[_Step], columns: Columns) -> list[_Step]:
+    """Projection pruning: drop columns as soon as nothing downstream needs them"""
+    schemas: list[Columns | None] = [columns]
+    for step in plan:
+        references = _references(step)
+        if (schemas[-1] != None) and (references != None):
+            if references.difference(schemas[-1]):  # type: ignore
+                return plan  # let the verb raise the appropriate error
+        schemas.append(_schema(step, schemas[-1]))
+    needs: list[set[Column] | None] = [None]
+    for step in reversed(plan):
+        needs.insert(0, _needs(step, needs[0]))
+    pruned: list[_Step] = []
+    current = schemas[0]
+    for i, step in enumerate(plan):
+        needed, incoming = needs[i], current
+        at_boundary = (i == 0) or (needs[i - 1] == None)
+        prunable = (current != None) and (needed != None)
+        if prunable and at_boundary and set(current).difference(needed):  # type: ignore
+            current = [col for col in current if col in needed]  # type: ignore
+            if pruned and pruned[-1].verb == "filter":
+                pruned[-1] = pruned[-1]._replace(keep=current)
+                incoming = current
+            elif step.verb != "select":  # (a select narrows by itself)
+                pruned.append(_Step("select", (current,)))
+                incoming = current
+        if current != None:
+            trimmed = _trim(step, current)
+            if (trimmed == None) or (trimmed == _Step("select", (incoming,))):
+                continue
+            step = trimmed
+        pruned.append(step)
+        current = _schema(step, current)
+    return pruned
+
+
+def _optimize(plan: list[_Step], columns: Columns) -> list[_Step]:
+    plan = _push_filters(plan)
+    plan = _push_takes(plan)
+    plan = _fuse_filters(plan)
+    plan = _prune(plan, columns)
+    return plan
+
+
+def _execute(df: PandasDataFrame, plan: list[_Step]) -> PandasDataFrame:
+    for step in plan:
+        df = _VERBS[step.verb](df, *step.args)
+        if step.keep != None:
+            df = select(df, step.keep)
+    return df
+
+
+class LazyFrame:
+    """LazyFrame records verbs into a plan that only runs on `collect`"""
+
+    def __init__(self, data: PandasDataFrame, plan: list[_Step] | None = None) -> None:
+        self._data = data
+        self._plan = [] if (plan == None) else plan
+
+    def __repr__(self) -> str:
+        steps = [f"  {i}. {step!r}" for i, step in enumerate(self._plan)]
+        return "\n".join(["LazyFrame"] + steps)
+
+    def _then(self, verb: str, *args) -> LazyFrame:
+        return LazyFrame(self._data, self._plan + [_Step(verb, args)])
+
+    @_profiled
+    def collect(self, optimize: bool = True) -> DataFrame:
+        """Optimize and then run the recorded plan
+
+        Filters only run before an earlier `sort` if they were declared
+        `row_local=True` (their predicates must not depend on row order, like
+        `row.index`, `duplicated` or a `cumsum` would): `collect(optimize=False)`
+        runs the plan as is.
+
+        Example:
+
+        ```python
+        df = rf.DataFrame({"foo": [3, 1, 2], "bar": ["A", "B", "C"]})
+        ```
+        |   foo | bar   |
+        |------:|:------|
+        |     3 | A     |
+        |     1 | B     |
+        |     2 | C     |
+
+        ```python
+        lazy = df.lazy().sort("foo").filter(lambda row: row["foo"] > 1, row_local=True)
+        lazy.select("bar").collect()
+        ```
+        | bar   |
+        |:------|
+        | C     |
+        | A     |
+        """
+        _check_type(optimize, bool)
+        plan = self._plan
+        if optimize:
+            plan = _optimize(plan, list(self._data.columns))
+        return _wrap(_execute(self._data, plan))
+
+    def accumulate(self, column: Column, into: Column) -> LazyFrame:
+        return self._then("accumulate", column, into)
+
+    def append(self, other: DataFrame) -> LazyFrame:
+        _check_type(other, DataFrame)
+        return self._then("append", other._data)
+
+    def combine(
+        self, columns: Columns, into: Column, sep: str, drop: bool = True
+    ) -> LazyFrame:
+        return self._then("combine", columns, into, sep, drop)
+
+    def cross(
+        self, rhs: DataFrame, postfix: tuple[str, str] = ("_lhs", "_rhs")
+    ) -> LazyFrame:
+        _check_type(rhs, DataFrame)
+        return self._then("cross", rhs._data, postfix)
+
+    def dedupe(self, columns: LazyColumns | None = None) -> LazyFrame:
+        return self._then("dedupe", columns)
+
+    def denix(self, columns: LazyColumns | None = None) -> LazyFrame:
+        return self._then("denix", columns)
+
+    def drop(self, columns: LazyColumns) -> LazyFrame:
+        return self._then("drop", columns)
+
+    def fill(
+        self,
+        columns: LazyColumns | None = None,
+        direction: Direction | None = None,
+        constant: Value | None = None,
+    ) -> LazyFrame:
+        return self._then("fill", columns, direction, constant)
+
+    def filter(self, func: Func, row_local: bool = False) -> LazyFrame:
+        if not callable(func):
+            raise TypeError("must be Func")
+        _check_type(row_local, bool)
+        step = _Step("filter", (func,), row_local=row_local)
+        return LazyFrame(self._data, self._plan + [step])
+
+    def gather(
+        self,
+        columns: Columns | None = None,
+        beside: LazyColumns | None = None,
+        into: tuple[Column, Column] = ("variable", "value"),
+    ) -> LazyFrame:
+        return self._then("gather", columns, beside, into)
+
+    def join(
+        self,
+        rhs: DataFrame,
+        on: LazyColumns,
+        how: Join = "left",
+        postfix: tuple[str, str] = ("_lhs", "_rhs"),
+    ) -> LazyFrame:
+        _check_type(rhs, DataFrame)
+        return self._then("join", rhs._data, on, how, postfix)
+
+    def mutate(
+        self,
+        over: dict[Column, Func],
+        vectorized: bool = False,
+        workers: int | None = None,
+        jit: bool = False,
+    ) -> LazyFrame:
+        return self._then("mutate", over, vectorized, workers, jit)
+
+    def pack(self, column: Column, sep: str) -> LazyFrame:
+        return self._then("pack", column, sep)
+
+    def rank(self, column: Column, into: Column, descending: bool = False) -> LazyFrame:
+        return self._then("rank", column, into, descending)
+
+    def rename(self, columns: dict[OldColumn, NewColumn]) -> LazyFrame:
+        return self._then("rename", columns)
+
+    def replace(self, over: dict[Column, dict[OldValue, NewValue]]) -> LazyFrame:
+        return self._then("replace", over)
+
+    def rollup(self, over: dict[Column, tuple[Column, Func]]) -> LazyFrame:
+        return self._then("rollup", over)
+
+    def sample(self, rows: int | float, seed: int | None = None) -> LazyFrame:
+        return self._then("sample", rows, seed)
+
+    def select(self, columns: LazyColumns) -> LazyFrame:
+        return self._then("select", columns)
+
+    def shuffle(self, seed: int | None = None) -> LazyFrame:
+        return self._then("shuffle", seed)
+
+    def sort(self, columns: LazyColumns, descending: bool = False) -> LazyFrame:
+        return self._then("sort", columns, descending)
+
+    def split(
+        self, column: Column, into: Columns, sep: str, drop: bool = True
+    ) -> LazyFrame:
+        return self._then("split", column, into, sep, drop)
+
+    def spread(self, column: Column, using: Column) -> LazyFrame:
+        return self._then("spread", column, using)
+
+    def take(self, rows: int) -> LazyFrame:
+        _check_type(rows, int)
+        return self._then("take", rows)
+
+    def unpack(self, column: Column, sep: str) -> LazyFrame:
+        return self._then("unpack", column, sep)
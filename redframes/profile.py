@@ -0,0 +1,154 @@
+"""Per-verb profiling (wall time, shape in/out, memory allocated)"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator
+
+from .checks import _check_type
+from .types import Any, PandasDataFrame
+
+_COLUMNS = [
+    "verb",
+    "seconds",
+    "rows_in",
+    "rows_out",
+    "columns_in",
+    "columns_out",
+    "memory",
+]
+# per thread/task (like `rf.engine`, so concurrent blocks don't record each other)
+_PROFILES: ContextVar[tuple[Profile, ...]] = ContextVar(
+    "redframes_profiles", default=()
+)
+
+
+class Profile:
+    """Verb records collected inside an `rf.profile()` block"""
+
+    def __init__(self, memory: bool = False) -> None:
+        self._memory = memory
+        self._start = time.perf_counter()
+        self.records: list[dict[str, Any]] = []
+
+    def __repr__(self) -> str:
+        return f"Profile({len(self.records)} verbs)"
+
+    @property
+    def frame(self) -> "DataFrame":  # type: ignore
+        """Inspect the records as a DataFrame (one row per verb call)"""
+        from .core import _wrap
+
+        records = [{key: r[key] for key in _COLUMNS} for r in self.records]
+        data = PandasDataFrame(records, columns=_COLUMNS)
+        return _wrap(data)
+
+    def trace(self, path: str) -> None:
+        """Export the records as a Chrome trace (chrome://tracing, Perfetto)"""
+        _check_type(path, str)
+        if not path.endswith(".json"):
+            raise ValueError("must end in .json")
+        events = []
+        for record in self.records:
+            args = {key: record[key] for key in _COLUMNS[2:]}
+            event = {
+                "name": record["verb"],
+                "ph": "X",
+                "ts": (record["start"] - self._start) * 1e6,
+                "dur": record["seconds"] * 1e6,
+                "pid": record["pid"],
+                "tid": record["tid"],
+                "args": args,
+            }
+            events.append(event)
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events}, f)
+
+
+@contextmanager
+def profile(memory: bool = False) -> Iterator[Profile]:
+    """Record wall time, rows, columns (and memory) for every verb call
+
+    Example:
+
+    ```python
+    df = rf.DataFrame({"foo": [1, 2, 3], "bar": ["A", "B", "C"]})
+    ```
+
+    ```python
+    with rf.profile() as p:
+        df.filter(lambda row: row["foo"] > 1).select("bar")
+    p.frame
+    ```
+    | verb   |   seconds |   rows_in |   rows_out |   columns_in |   columns_out |   memory |
+    |:-------|----------:|----------:|-----------:|-------------:|--------------:|---------:|
+    | filter |  0.000512 |         3 |          2 |            2 |             2 |      nan |
+    | select |  0.000147 |         2 |          2 |            2 |             1 |      nan |
+
+    ```python
+    p.trace("profile.json")
+    ```
+    """
+    _check_type(memory, bool)
+    started = False
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        started = True
+    current = Profile(memory)
+    token = _PROFILES.set(_PROFILES.get() + (current,))
+    try:
+        yield current
+    finally:
+        _PROFILES.reset(token)
+        if started:
+            tracemalloc.stop()
+
+
+def _shape(data: Any) -> tuple[int | None, int | None]:
+    data = getattr(data, "_data", None)
+    data = getattr(data, "obj", data)  # GroupedFrame
+    if not isinstance(data, PandasDataFrame):
+        return None, None
+    return data.shape
+
+
+def _profiled(method: Callable) -> Callable:
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        profiles = _PROFILES.get()
+        if not profiles:
+            return method(self, *args, **kwargs)
+        memory = any(p._memory for p in profiles) and tracemalloc.is_tracing()
+        if memory:
+            before = tracemalloc.get_traced_memory()[0]
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+        start = time.perf_counter()
+        result = method(self, *args, **kwargs)
+        seconds = time.perf_counter() - start
+        rows_in, columns_in = _shape(self)
+        rows_out, columns_out = _shape(result)
+        record = {
+            "verb": method.__name__,
+            "seconds": seconds,
+            "rows_in": rows_in,
+            "rows_out": rows_out,
+            "columns_in": columns_in,
+            "columns_out": columns_out,
+            "memory": (tracemalloc.get_traced_memory()[1] - before) if memory else None,
+            "start": start,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        for p in profiles:
+            p.records.append(record)
+        return result
+
+    return wrapper
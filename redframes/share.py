@@ -0,0 +1,15 @@
+"""Column-level structural sharing (verbs never write to arrays in place)"""
+
+from __future__ import annotations
+
+from .types import Any, Column, Columns, PandasDataFrame
+
+
+def _assign(
+    df: PandasDataFrame, over: dict[Column, Any], drop: Columns | None = None
+) -> PandasDataFrame:
+    """Add/overwrite columns without copying any of the untouched columns"""
+    drop = [] if (drop == None) else drop
+    columns = {col: df[col] for col in df.columns if col not in drop}  # type: ignore
+    columns.update(over)
+    return PandasDataFrame(columns, index=df.index, copy=False)
@@ -0,0 +1,212 @@
+"""Hash-partitioned rollup that spills partial aggregates to disk"""
+
+from __future__ import annotations
+
+import math
+import os
+import tempfile
+
+import numpy as np  # pyright: ignore[reportMissingImports]
+import pandas as pd  # pyright: ignore[reportMissingImports]
+
+from .types import Column, Func, PandasDataFrame
+
+_PARTITIONS = 16
+_MAX_PARTITIONS = 1024
+_ROW = "__redframes_row__"
+
+# func -> [(partial aggregation, how partials merge)]
+_DECOMPOSABLE: dict[Func, list[tuple[str, str]]] = {
+    len: [("size", "sum")],
+    np.sum: [("sum", "sum")],
+    np.min: [("min", "min")],
+    np.max: [("max", "max")],
+    np.mean: [("sum", "sum"), ("count", "sum")],
+}
+
+
+# func -> the (same) pandas aggregation, for partitions that aggregate raw rows
+_NAMES: dict[Func, str] = {
+    len: "size",
+    np.sum: "sum",
+    np.min: "min",
+    np.max: "max",
+    np.mean: "mean",
+}
+
+
+def _check_decomposable(over: dict[Column, tuple[Column, Func]]) -> None:
+    for _, func in over.values():
+        if not func in _DECOMPOSABLE:
+            message = (
+                "budget requires decomposable functions (count, max, mean, min, sum)"
+            )
+            raise ValueError(message)
+
+
+def _is_exact(df: PandasDataFrame, over: dict[Column, tuple[Column, Func]]) -> bool:
+    """Do merged partials match the in-memory result bit for bit? (not float sums)"""
+    for column, func in over.values():
+        if func in {np.sum, np.mean} and df[column].dtype.kind not in "biu":
+            return False
+    return True
+
+
+def _partials(over: dict[Column, tuple[Column, Func]]) -> dict[str, tuple[Column, str]]:
+    partials = {_ROW: (_ROW, "min")}
+    for into, (column, func) in over.items():
+        for i, (how, _) in enumerate(_DECOMPOSABLE[func]):
+            partials[f"{into}__{i}"] = (column, how)
+    return partials
+
+
+def _merges(over: dict[Column, tuple[Column, Func]]) -> dict[str, tuple[str, str]]:
+    merges = {_ROW: (_ROW, "min")}
+    for into, (_, func) in over.items():
+        for i, (_, how) in enumerate(_DECOMPOSABLE[func]):
+            merges[f"{into}__{i}"] = (f"{into}__{i}", how)
+    return merges
+
+
+def _finalize(
+    df: PandasDataFrame, by: list[Column], over: dict[Column, tuple[Column, Func]]
+) -> PandasDataFrame:
+    columns = {col: df[col] for col in by}
+    for into, (_, func) in over.items():
+        if func == np.mean:
+            columns[into] = df[f"{into}__0"] / df[f"{into}__1"]
+        else:
+            columns[into] = df[f"{into}__0"]
+    return PandasDataFrame(columns, index=df.index)
+
+
+def _bytes_per_row(df: PandasDataFrame) -> int:
+    sample = df.head(10_000)
+    return max(int(sample.memory_usage(deep=True).sum() / max(len(sample), 1)), 1)
+
+
+def _partition_rollup(
+    df: PandasDataFrame,
+    by: list[Column],
+    over: dict[Column, tuple[Column, Func]],
+    budget: int,
+) -> PandasDataFrame:
+    """Hash-partition the rows themselves to disk, then aggregate one partition
+    at a time (every group's rows stay together and in order, so floats sum
+    exactly like they do in memory)
+    """
+    size = int(df.memory_usage(deep=True).sum())
+    partitions = min(max(_PARTITIONS, math.ceil(2 * size / budget)), _MAX_PARTITIONS)
+    rows = max(budget // (_bytes_per_row(df) * 4), 1)
+    spilled = [0] * partitions
+    with tempfile.TemporaryDirectory(prefix="redframes-") as tmp:
+        for start in range(0, len(df), rows):
+            chunk = df.iloc[start : start + rows]
+            chunk = chunk.assign(**{_ROW: np.arange(start, start + len(chunk))})
+            hashes = pd.util.hash_pandas_object(chunk[by], index=False)
+            partition = (hashes % partitions).to_numpy()
+            for p in np.unique(partition):
+                path = os.path.join(tmp, f"{p}-{spilled[p]}.pkl")
+                chunk[partition == p].to_pickle(path)
+                spilled[p] += 1
+        results = []
+        for p in range(partitions):
+            if not spilled[p]:
+                continue
+            pieces = [
+                pd.read_pickle(os.path.join(tmp, f"{p}-{i}.pkl"))
+                for i in range(spilled[p])
+            ]
+            merged = pd.concat(pieces, ignore_index=True)
+            merged = merged.groupby(by, as_index=False, sort=False, observed=True).agg(
+                **{_ROW: (_ROW, "min")},
+                **{
+                    into: (column, _NAMES[func])
+                    for into, (column, func) in over.items()
+                },
+            )
+            results.append(merged)
+    return _ordered(df, by, over, results)
+
+
+def _ordered(
+    df: PandasDataFrame,
+    by: list[Column],
+    over: dict[Column, tuple[Column, Func]],
+    results: list[PandasDataFrame],
+) -> PandasDataFrame:
+    """Concatenate the partitions in first appearance order (`groupby(sort=False)`)"""
+    if not results:  # every key is null
+        return (
+            df.iloc[:0]
+            .groupby(by, as_index=False, sort=False, observed=True)
+            .agg(**over)
+        )
+    result = pd.concat(results, ignore_index=True)
+    result = result.sort_values(_ROW, kind="stable", ignore_index=True)
+    return result.drop(columns=_ROW)
+
+
+def _spill_rollup(
+    df: PandasDataFrame,
+    by: list[Column],
+    over: dict[Column, tuple[Column, Func]],
+    budget: int,
+) -> PandasDataFrame:
+    """Aggregate in row chunks, hash-partition the partials, spill over budget
+
+    Partials are merged one partition at a time and re-ordered by first
+    appearance (to match `groupby(sort=False)`). Float sums and means can't
+    be merged exactly, so those rollups partition the rows instead.
+    """
+    _check_decomposable(over)
+    if not _is_exact(df, over):
+        return _partition_rollup(df, by, over, budget)
+    partials, merges = _partials(over), _merges(over)
+    rows = max(budget // (_bytes_per_row(df) * 4), 1)
+    buffers: list[list[PandasDataFrame]] = [[] for _ in range(_PARTITIONS)]
+    buffered = 0
+    spilled = [0] * _PARTITIONS
+    with tempfile.TemporaryDirectory(prefix="redframes-") as tmp:
+
+        def spill() -> None:
+            for p, buffer in enumerate(buffers):
+                for partial in buffer:
+                    path = os.path.join(tmp, f"{p}-{spilled[p]}.pkl")
+                    partial.to_pickle(path)
+                    spilled[p] += 1
+                buffer.clear()
+
+        for start in range(0, len(df), rows):
+            chunk = df.iloc[start : start + rows]
+            chunk = chunk.assign(**{_ROW: np.arange(start, start + len(chunk))})
+            partial = chunk.groupby(by, as_index=False, sort=False, observed=True).agg(
+                **partials
+            )
+            hashes = pd.util.hash_pandas_object(partial[by], index=False)
+            partition = (hashes % _PARTITIONS).to_numpy()
+            for p in np.unique(partition):
+                buffers[p].append(partial[partition == p])
+            buffered += partial.memory_usage(deep=True).sum()
+            if buffered > budget:
+                spill()
+                buffered = 0
+
+        results = []
+        for p in range(_PARTITIONS):
+            pieces = [
+                pd.read_pickle(os.path.join(tmp, f"{p}-{i}.pkl"))
+                for i in range(spilled[p])
+            ]
+            pieces += buffers[p]
+            if not pieces:
+                continue
+            merged = pd.concat(pieces, ignore_index=True)
+            merged = merged.groupby(by, as_index=False, sort=False, observed=True).agg(
+                **merges
+            )
+            results.append(merged)
+    if not results:
+        return _ordered(df, by, over, results)
+    results = [_finalize(result, by + [_ROW], over) for result in results]
+    return _ordered(df, by, over, results)
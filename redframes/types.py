@@ -21,8 +21,11 @@ Func = Callable[..., Any]
 Join = Literal["left", "right", "inner", "full"]
 NumpyArray = np.ndarray
 NumpyType = np.dtype
+PandasArrowDtype = pd.ArrowDtype
+PandasCategoricalDtype = pd.CategoricalDtype
 PandasDataFrame = pd.DataFrame
 PandasGroupedFrame = pg.DataFrameGroupBy
 PandasIndex = pd.Index
 PandasRangeIndex = pd.RangeIndex
+PandasSeries = pd.Series
 DateTime = datetime.datetime
@@ -3,6 +3,7 @@ from __future__ import annotations
 import warnings
 
 from ..checks import _check_type
+from ..share import _assign
 from ..types import Column, PandasDataFrame, PandasGroupedFrame
 
 
@@ -17,9 +18,8 @@ def accumulate(
         if into_is_not_column and into_is_in_df_columns:
             message = f"overwriting existing column '{into}'"
             warnings.warn(message)
-        df = df.copy()
     result = df[column].cumsum()
     if isinstance(df, PandasGroupedFrame):
-        df = df.obj.copy()  # type: ignore
-    df[into] = result  # type: ignore
-    return df  # type: ignore
+        df = df.obj  # type: ignore
+    df = _assign(df, {into: result})  # type: ignore
+    return df
@@ -1,9 +1,12 @@
 import pandas as pd  # pyright: ignore[reportMissingImports]
 
+from ..encode import _align
 from ..types import PandasDataFrame
 
 
 def append(top: PandasDataFrame, bottom: PandasDataFrame) -> PandasDataFrame:
+    shared = [col for col in top.columns if col in bottom.columns]
+    top, bottom = _align(top, bottom, shared)
     df = pd.concat([top, bottom])
     df = df.reset_index(drop=True)
     return df
@@ -2,8 +2,27 @@ from __future__ import annotations
 
 import warnings
 
+import pandas as pd  # pyright: ignore[reportMissingImports]
+
+from ..arrow import _combine, _is_arrow
 from ..checks import _check_type
-from ..types import Column, Columns, PandasDataFrame
+from ..share import _assign
+from ..types import Column, Columns, PandasDataFrame, PandasSeries
+
+
+def _as_str(column: PandasSeries) -> PandasSeries:
+    if pd.api.types.is_datetime64_any_dtype(column):
+        column = column.astype(object)  # keep str(Timestamp) formatting
+    return column.astype(str)
+
+
+def _cat(df: PandasDataFrame, columns: Columns, sep: str) -> PandasSeries:
+    """Join columns element-wise (null if any of the values are null)"""
+    if not columns:
+        return PandasSeries("", index=df.index, dtype=object)
+    strings = [_as_str(df[column]) for column in columns]
+    new = strings[0].str.cat(strings[1:], sep=sep)
+    return new.mask(df[columns].isna().any(axis=1), None)
 
 
 def combine(
@@ -19,9 +38,9 @@ def combine(
     if into_is_not_in_columns and into_is_in_df_columns:
         message = f"overwriting existing column '{into}'"
         warnings.warn(message)
-    df = df.copy()
-    new = df[columns].apply(lambda row: sep.join(row.values.astype(str)), axis=1)
-    if drop:
-        df = df.drop(columns, axis=1)
-    df[into] = new
+    if all(_is_arrow(df[column]) for column in columns):
+        new = _combine(df, columns, sep)
+    else:
+        new = _cat(df, columns, sep)
+    df = _assign(df, {into: new}, drop=columns if drop else None)
     return df
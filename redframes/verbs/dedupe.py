@@ -1,12 +1,21 @@
 from __future__ import annotations
 
 from ..checks import _check_keys, _check_type
+from ..index import _HashIndex
 from ..types import LazyColumns, PandasDataFrame
 
 
-def dedupe(df: PandasDataFrame, columns: LazyColumns | None = None) -> PandasDataFrame:
+def dedupe(
+    df: PandasDataFrame,
+    columns: LazyColumns | None = None,
+    index: _HashIndex | None = None,
+) -> PandasDataFrame:
     _check_type(columns, {list, str, None})
     _check_keys(columns, df.columns)
+    if (index != None) and (columns in [index.column, [index.column]]):
+        df = df.take(index.firsts())
+        df = df.reset_index(drop=True)
+        return df
     df = df.drop_duplicates(subset=columns, keep="first")
     df = df.reset_index(drop=True)
     return df
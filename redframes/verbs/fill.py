@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from ..checks import _check_type
+from ..encode import _add_category
+from ..share import _assign
 from ..types import Direction, LazyColumns, PandasDataFrame, Value
 
 
@@ -25,9 +27,10 @@ def fill(
     if constant != None:
         value = constant
         method = None
-    df = df.copy()
+        df = _add_category(df, columns or list(df.columns), constant)
     if columns:
-        df[columns] = df[columns].fillna(value=value, method=method)  # type: ignore
+        filled = df[columns].fillna(value=value, method=method)  # type: ignore
+        df = _assign(df, dict(filled.items()))
     else:
         df = df.fillna(value=value, method=method)  # type: ignore
     return df
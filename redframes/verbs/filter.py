@@ -1,9 +1,24 @@
-from ..types import Func, PandasDataFrame
+from __future__ import annotations
 
+from ..checks import _check_type
+from ..jit import _check_numba, _jit_apply
+from ..types import Func, PandasDataFrame, PandasSeries
 
-def filter(df: PandasDataFrame, func: Func) -> PandasDataFrame:
+
+def filter(df: PandasDataFrame, func: Func, jit: bool = False) -> PandasDataFrame:
     if not callable(func):
         raise TypeError("must be Func")
-    df = df.loc[func]  # type: ignore
+    _check_type(jit, bool)
+    mask = None
+    if jit:  # (func gets one row at a time, compiled or not)
+        _check_numba()
+        mask = _jit_apply(df, func)
+        if (mask is None) or (mask.dtype != bool):
+            mask = df.apply(func, axis=1) if len(df) else []
+        mask = PandasSeries(mask, index=df.index, dtype=bool)
+    if mask is not None:
+        df = df.loc[mask]
+    else:
+        df = df.loc[func]  # type: ignore
     df = df.reset_index(drop=True)
     return df
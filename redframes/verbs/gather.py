@@ -2,10 +2,18 @@ from __future__ import annotations
 
 import warnings
 
+import numpy as np  # pyright: ignore[reportMissingImports]
 import pandas as pd  # pyright: ignore[reportMissingImports]
 
 from ..checks import _check_type
-from ..types import Column, Columns, LazyColumns, PandasDataFrame, PandasGroupedFrame
+from ..types import (
+    Column,
+    Columns,
+    LazyColumns,
+    PandasDataFrame,
+    PandasGroupedFrame,
+    PandasIndex,
+)
 
 
 def _melt(
@@ -14,16 +22,30 @@ def _melt(
     cols_to_gather: list[str],
     into: tuple[str, str],
 ) -> PandasDataFrame:
-    df = pd.melt(
-        df,
-        id_vars=cols_to_keep,
-        value_vars=cols_to_gather,
-        var_name=into[0],
-        value_name=into[1],
+    """pd.melt + dropna in one pass, with a categorical variable column"""
+    if not cols_to_gather:
+        return pd.melt(df, cols_to_keep, [], into[0], into[1])
+    masks = [df[col].notna().to_numpy() for col in cols_to_gather]
+    positions = np.concatenate([np.flatnonzero(mask) for mask in masks])
+    pairs = list(zip(cols_to_gather, masks))
+    empty = pd.melt(df[cols_to_gather].head(0), [], None, into[0], into[1])
+    dtype = empty[into[1]].dtype  # as if unfiltered
+    if isinstance(dtype, np.dtype):
+        values = np.concatenate([df[col].to_numpy(dtype)[mask] for col, mask in pairs])
+    else:
+        values = pd.concat([df[col][mask] for col, mask in pairs]).astype(dtype).array
+    categories = PandasIndex(cols_to_gather)
+    order = categories.argsort()  # sorted, so `sort` still orders alphabetically
+    codes = np.empty(len(order), dtype=np.int64)
+    codes[order] = np.arange(len(order))
+    counts = [int(mask.sum()) for mask in masks]
+    variable = pd.Categorical.from_codes(
+        np.repeat(codes, counts), categories=categories[order]
     )
-    df = df.dropna(subset=into[1])  # type: ignore
-    df = df.reset_index(drop=True)
-    return df
+    columns = {col: df[col].take(positions).array for col in cols_to_keep}
+    columns[into[0]] = variable
+    columns[into[1]] = values
+    return PandasDataFrame(columns, index=pd.RangeIndex(len(positions)))
 
 
 def _grouped_melt(df: PandasGroupedFrame, into: tuple[str, str]) -> PandasDataFrame:
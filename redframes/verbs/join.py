@@ -1,9 +1,150 @@
 from __future__ import annotations
 
+import numpy as np  # pyright: ignore[reportMissingImports]
 import pandas as pd  # pyright: ignore[reportMissingImports]
 
 from ..checks import _check_type
-from ..types import Join, LazyColumns, PandasDataFrame
+from ..encode import _align
+from ..engine import _engine, _polars_join
+from ..index import _HashIndex
+from ..types import Any, Column, Join, LazyColumns, NumpyArray, PandasDataFrame
+
+
+def _is_sorted(lhs: PandasDataFrame, rhs: PandasDataFrame, on: Column) -> bool:
+    left, right = lhs[on], rhs[on]
+    if (len(left) == 0) or (len(right) == 0) or (left.dtype != right.dtype):
+        return False
+    if not (isinstance(left.dtype, np.dtype) and left.dtype.kind in "biufmM"):
+        return False
+    if left.hasnans or right.hasnans:
+        return False
+    return left.is_monotonic_increasing and right.is_monotonic_increasing
+
+
+def _is_indexed(
+    lhs: PandasDataFrame,
+    rhs: PandasDataFrame,
+    on: list[Column],
+    how: Join,
+    index: _HashIndex,
+) -> bool:
+    if (on != [index.column]) or (how not in ["left", "inner"]) or (len(rhs) == 0):
+        return False
+    if (how == "inner") and (len(index.keys) != len(rhs)):
+        return False  # pd.merge interleaves duplicate inner matches
+    return lhs[index.column].dtype == index.dtype
+
+
+def _is_strict(values: NumpyArray) -> bool:
+    return bool((values[1:] != values[:-1]).all())
+
+
+def _indexers(
+    left: NumpyArray, right: NumpyArray, keep: bool
+) -> tuple[NumpyArray, NumpyArray]:
+    """Row indexers for every left row (-1 = no match on the right)"""
+    lo = np.searchsorted(right, left, side="left")
+    hi = np.searchsorted(right, left, side="right")
+    matches = hi - lo
+    repeats = np.maximum(matches, 1) if keep else matches
+    left_idx = np.repeat(np.arange(len(left)), repeats)
+    starts = np.cumsum(repeats) - repeats
+    offsets = np.arange(repeats.sum()) - np.repeat(starts, repeats)
+    right_idx = np.repeat(lo, repeats) + offsets
+    right_idx[np.repeat(matches == 0, repeats)] = -1
+    return left_idx, right_idx
+
+
+def _take(values: Any, idx: NumpyArray | None) -> Any:
+    if idx is None:
+        return values
+    if isinstance(values, pd.arrays.NumpyExtensionArray):
+        values = values.to_numpy()  # (take upcasts ints to float for the -1 fills)
+    return pd.api.extensions.take(values, idx, allow_fill=True)
+
+
+def _full(
+    left: NumpyArray, right: NumpyArray, left_idx: NumpyArray, right_idx: NumpyArray
+) -> tuple[NumpyArray, NumpyArray]:
+    """Slot the unmatched right rows into a (sorted) left join"""
+    matched = np.zeros(len(right), dtype=bool)
+    matched[right_idx[right_idx >= 0]] = True
+    unmatched = np.flatnonzero(~matched)
+    position = np.searchsorted(left[left_idx], right[unmatched])
+    slots = position + np.arange(len(unmatched))
+    inserted = np.zeros(len(left_idx) + len(unmatched), dtype=bool)
+    inserted[slots] = True
+    full_left = np.full(len(inserted), -1)
+    full_right = np.empty(len(inserted), dtype=right_idx.dtype)
+    full_left[~inserted], full_right[~inserted] = left_idx, right_idx
+    full_right[slots] = unmatched
+    return full_left, full_right
+
+
+def _assemble(
+    lhs: PandasDataFrame,
+    rhs: PandasDataFrame,
+    on: Column,
+    left_idx: NumpyArray | None,
+    right_idx: NumpyArray | None,
+    postfix: tuple[str, str],
+) -> PandasDataFrame:
+    """Gather both sides with row indexers (-1 = missing, None = every row)"""
+    left, right = lhs[on].to_numpy(), rhs[on].to_numpy()
+    if left_idx is None:
+        key = left
+    elif right_idx is None:
+        key = right
+    else:
+        key = np.where(left_idx >= 0, left[left_idx], right[right_idx])
+    overlap = set(lhs.columns).intersection(rhs.columns).difference([on])
+    columns = {}
+    for col in lhs.columns:
+        name = f"{col}{postfix[0]}" if col in overlap else col
+        columns[name] = key if (col == on) else _take(lhs[col].array, left_idx)
+    for col in rhs.columns:
+        if col != on:
+            name = f"{col}{postfix[1]}" if col in overlap else col
+            columns[name] = _take(rhs[col].array, right_idx)
+    return PandasDataFrame(columns, copy=False)
+
+
+def _merge_indexed(
+    lhs: PandasDataFrame,
+    rhs: PandasDataFrame,
+    index: _HashIndex,
+    how: Join,
+    postfix: tuple[str, str],
+) -> PandasDataFrame:
+    """Probe the (prebuilt) hash index on rhs instead of rehashing it"""
+    keys = lhs[index.column].to_numpy()
+    left_idx, right_idx = index.indexers(keys, keep=(how == "left"))
+    return _assemble(lhs, rhs, index.column, left_idx, right_idx, postfix)
+
+
+def _merge_sorted(
+    lhs: PandasDataFrame,
+    rhs: PandasDataFrame,
+    on: Column,
+    how: Join,
+    postfix: tuple[str, str],
+) -> PandasDataFrame:
+    """Sort-merge join for a single key that is sorted (and non-null) on both sides"""
+    left, right = lhs[on].to_numpy(), rhs[on].to_numpy()
+    if _is_strict(left) and _is_strict(right):  # unique keys (linear merge)
+        index = pd.Index(left).join(
+            pd.Index(right),
+            how="outer" if (how == "full") else how,
+            return_indexers=True,
+        )
+        left_idx, right_idx = index[1], index[2]  # None = every row, in order
+    elif how == "right":
+        right_idx, left_idx = _indexers(right, left, keep=True)
+    else:
+        left_idx, right_idx = _indexers(left, right, keep=(how != "inner"))
+        if how == "full":
+            left_idx, right_idx = _full(left, right, left_idx, right_idx)
+    return _assemble(lhs, rhs, on, left_idx, right_idx, postfix)
 
 
 def join(
@@ -12,6 +153,7 @@ def join(
     on: LazyColumns,
     how: Join = "left",
     postfix: tuple[str, str] = ("_lhs", "_rhs"),
+    index: _HashIndex | None = None,
 ) -> PandasDataFrame:
     _check_type(on, {list, str})
     _check_type(how, str)
@@ -21,6 +163,16 @@ def join(
             "on argument is invalid, must be one of {'left', 'right', 'inner', 'full'}"
         )
         raise ValueError(message)
+    if _engine() == "polars":
+        result = _polars_join(lhs, rhs, on, how, postfix)
+        if result is not None:
+            return result
+    key = [on] if isinstance(on, str) else on
+    lhs, rhs = _align(lhs, rhs, key)
+    if (index != None) and _is_indexed(lhs, rhs, key, how, index):
+        return _merge_indexed(lhs, rhs, index, how, postfix)  # type: ignore
+    if (len(key) == 1) and _is_sorted(lhs, rhs, key[0]):
+        return _merge_sorted(lhs, rhs, key[0], how, postfix)  # type: ignore
     how = "outer" if (how == "full") else how  # type: ignore
     df = pd.merge(lhs, rhs, on=on, how=how, suffixes=postfix)
     df = df.reset_index(drop=True)
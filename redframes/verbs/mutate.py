@@ -1,12 +1,85 @@
 from __future__ import annotations
 
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import pandas as pd  # pyright: ignore[reportMissingImports]
+
 from ..checks import _check_type
-from ..types import Column, Func, PandasDataFrame
+from ..encode import _decode
+from ..jit import _check_numba, _jit_apply
+from ..share import _assign
+from ..types import Column, Func, PandasDataFrame, PandasSeries
+
+try:
+    import cloudpickle  # pyright: ignore[reportMissingImports]
+except ImportError:  # pragma: no cover
+    cloudpickle = None
+
+
+def _dumps(over: dict[Column, Func]) -> bytes:
+    try:
+        if cloudpickle != None:
+            return cloudpickle.dumps(over)  # type: ignore
+        return pickle.dumps(over)
+    except Exception as error:
+        message = "must be picklable with workers (use `def` functions or `pip install cloudpickle`)"
+        raise TypeError(message) from error
+
+
+def _mutate_chunk(payload: bytes, chunk: PandasDataFrame) -> dict[Column, PandasSeries]:
+    over = pickle.loads(payload)
+    chunk = mutate(chunk, over)
+    return {column: chunk[column] for column in over}
+
+
+def _parallel(
+    df: PandasDataFrame, over: dict[Column, Func], workers: int
+) -> PandasDataFrame:
+    payload = _dumps(over)
+    size = -(-len(df) // (workers * 4))
+    chunks = [df.iloc[start : start + size] for start in range(0, len(df), size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_mutate_chunk, repeat(payload), chunks))
+    columns = {}
+    for column in over:
+        values = [result[column] for result in results]
+        columns[column] = pd.concat(values).infer_objects()
+    return _assign(df, columns)
 
 
-def mutate(df: PandasDataFrame, over: dict[Column, Func]) -> PandasDataFrame:
+def mutate(
+    df: PandasDataFrame,
+    over: dict[Column, Func],
+    vectorized: bool = False,
+    workers: int | None = None,
+    jit: bool = False,
+) -> PandasDataFrame:
     _check_type(over, dict)
-    df = df.copy()
+    _check_type(vectorized, bool)
+    _check_type(workers, {int, None})
+    if isinstance(workers, bool):
+        raise TypeError("must be int | None")
+    _check_type(jit, bool)
+    if jit:
+        if vectorized or (workers != None):
+            raise ValueError("jit is incompatible with vectorized/workers")
+        _check_numba()
+    if workers != None:
+        if vectorized:
+            raise ValueError("workers is incompatible with vectorized")
+        if workers < 1:
+            raise ValueError("must be > 0")
+        if len(df) > 0:
+            return _parallel(df, over, workers)
     for column, mutation in over.items():
-        df[column] = df.apply(mutation, axis=1)
-    return df  # type: ignore
+        values = _jit_apply(df, mutation) if jit else None
+        if vectorized:
+            values = mutation(_decode(df, list(df.columns)))
+        elif len(df) == 0:  # (apply would call mutation on a dummy row)
+            values = PandasSeries(dtype=object, index=df.index)
+        elif values is None:
+            values = df.apply(mutation, axis=1)
+        df = _assign(df, {column: values})
+    return df
@@ -1,7 +1,16 @@
 from __future__ import annotations
 
+import numpy as np  # pyright: ignore[reportMissingImports]
+
+from ..arrow import _flat, _has_arrow, _implode, _is_arrow
 from ..checks import _check_type
-from ..types import Column, PandasDataFrame, PandasGroupedFrame
+from ..types import (
+    Column,
+    PandasArrowDtype,
+    PandasDataFrame,
+    PandasGroupedFrame,
+    PandasSeries,
+)
 
 
 def pack(
@@ -9,8 +18,28 @@ def pack(
 ) -> PandasDataFrame:
     _check_type(column, str)
     _check_type(sep, str)
-    order = df.obj.columns if isinstance(df, PandasGroupedFrame) else df.columns  # type: ignore
-    df = df.agg(**{column: (column, lambda x: x.astype(str).str.cat(sep=sep))})  # type: ignore
+    grouped = isinstance(df, PandasGroupedFrame)
+    order = df.obj.columns if grouped else df.columns  # type: ignore
+    values = df.obj[column] if grouped else df[column]  # type: ignore
+    if not _is_arrow(values):
+        values = values.astype(str)
+        if not _has_arrow():
+            df = df.agg(**{column: (column, lambda x: x.astype(str).str.cat(sep=sep))})  # type: ignore
+            df = df[[col for col in df.columns if col in order]]
+            df = df.reset_index(drop=True)
+            return df
+    if grouped:
+        keys = df.agg(**{column: (column, "size")})  # type: ignore
+        codes = df.ngroup().fillna(-1).to_numpy(dtype=np.int64)  # type: ignore
+    else:
+        keys = PandasDataFrame({column: [len(df)]})
+        codes = np.zeros(len(df), dtype=np.int64)
+    joined = _implode(_flat(values), codes, len(keys), sep)
+    if _is_arrow(values):
+        joined = PandasSeries(joined, dtype=PandasArrowDtype(joined.type))
+    else:
+        joined = PandasSeries(joined.to_numpy(zero_copy_only=False), dtype=object)
+    df = keys.assign(**{column: joined.set_axis(keys.index)})
     df = df[[col for col in df.columns if col in order]]
     df = df.reset_index(drop=True)
     return df
@@ -1,4 +1,6 @@
 from ..checks import _check_type
+from ..encode import _is_encoded, _replace_encoded
+from ..share import _assign
 from ..types import Column, NewValue, OldValue, PandasDataFrame
 
 
@@ -11,5 +13,13 @@ def replace(
         raise KeyError(f"column key: {bad_columns} is invalid")
     if bad_columns and len(bad_columns) > 1:
         raise KeyError(f"column keys: {bad_columns} are invalid")
-    df = df.replace(over)
+    encoded = {col: over[col] for col in over if _is_encoded(df[col])}
+    if encoded:
+        replaced = {
+            col: _replace_encoded(df[col], mapping) for col, mapping in encoded.items()
+        }
+        df = _assign(df, replaced)
+        over = {col: mapping for col, mapping in over.items() if col not in encoded}
+    if over:
+        df = df.replace(over)
     return df
@@ -1,26 +1,70 @@
 from __future__ import annotations
 
+import numpy as np  # pyright: ignore[reportMissingImports]
+
 from ..checks import _check_type
-from ..types import Column, Func, PandasDataFrame, PandasGroupedFrame
+from ..encode import _decode
+from ..engine import _engine, _polars_rollup
+from ..spill import _spill_rollup
+from ..types import Any, Column, Func, PandasDataFrame, PandasGroupedFrame, PandasSeries
+from .group import group
+
+# rf.stat members (len and numpy functions) -> pandas' cythonized aggregations
+_NATIVE: dict[Func, str] = {
+    len: "size",
+    np.max: "max",
+    np.mean: "mean",
+    np.median: "median",
+    np.min: "min",
+    np.std: "std",
+    np.sum: "sum",
+}
+
+
+def _native(
+    over: dict[Column, tuple[Column, Func]],
+) -> dict[Column, tuple[Column, Any]]:
+    return {
+        key: (column, _NATIVE.get(func, func)) for key, (column, func) in over.items()
+    }
+
+
+def _aggregate(values: PandasSeries, func: Any) -> Any:
+    if isinstance(func, str):  # native
+        return values.agg(func)
+    return func(values)
 
 
 def rollup(
     df: PandasDataFrame | PandasGroupedFrame,
     over: dict[Column, tuple[Column, Func]],
+    budget: int | None = None,
 ) -> PandasDataFrame:
     _check_type(over, dict)
+    _check_type(budget, {int, None})
+    if (budget != None) and (budget <= 0):
+        raise ValueError("must be > 0")
+    ordered = [column for column, func in over.values() if func in {np.max, np.min}]
     if isinstance(df, PandasGroupedFrame):
+        decoded = _decode(df.obj, ordered)  # type: ignore
+        if decoded is not df.obj:  # type: ignore
+            df = group(decoded, df.keys)  # type: ignore
         groups = set(df.grouper.names)  # type: ignore
         keys = set(over.keys())
         if groups.intersection(keys):
             raise KeyError("unable to overwrite group keys")
-        df = df.agg(**over)
+        if budget != None:
+            return _spill_rollup(df.obj, df.grouper.names, over, budget)  # type: ignore
+        if _engine() == "polars":
+            result = _polars_rollup(df.obj, df.grouper.names, over)  # type: ignore
+            if result is not None:
+                return result
+        df = df.agg(**_native(over))
         df = df.reset_index(drop=True)
     else:
-        df = df.agg(**over)  # type: ignore
-        df = df.T  # type: ignore
-        df = df.reset_index(drop=True)  # type: ignore
-        df = df.fillna(method="ffill")  # type: ignore
-        df = df.fillna(method="bfill")  # type: ignore
-        df = df.head(1)  # type: ignore
+        if budget != None:
+            raise ValueError("budget requires group+rollup")
+        df = _decode(df, ordered)
+        columns = {key: [_aggregate(df[column], func)] for key, (column, func) in _native(over).items()}  # type: ignore
+        df = PandasDataFrame(columns)
     return df
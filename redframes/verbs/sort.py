@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from ..checks import _check_keys, _check_type
+from ..engine import _engine, _polars_sort
 from ..types import LazyColumns, PandasDataFrame
 
 
@@ -10,6 +11,10 @@ def sort(
     _check_type(columns, {list, str})
     _check_type(descending, bool)
     _check_keys(columns, df.columns)
+    if _engine() == "polars":
+        result = _polars_sort(df, columns, descending)
+        if result is not None:
+            return result
     df = df.sort_values(by=columns, ascending=not descending)
     df = df.reset_index(drop=True)
     return df
@@ -1,7 +1,18 @@
-import uuid
+from __future__ import annotations
 
+from ..arrow import _is_arrow, _split
 from ..checks import _check_type
-from ..types import Column, Columns, PandasDataFrame
+from ..share import _assign
+from ..types import Column, Columns, PandasDataFrame, PandasSeries
+
+
+def _pieces(values: PandasSeries, sep: str, into: int) -> list[PandasSeries]:
+    """At most `into` pieces (the last keeps the remainder, missing are None)"""
+    if _is_arrow(values):
+        return _split(values, sep, into)
+    pieces = values.str.split(sep, n=into - 1, expand=True)
+    empty = PandasSeries([None] * len(values), index=values.index, dtype=object)
+    return [pieces[i] if i in pieces.columns else empty for i in range(into)]
 
 
 def split(
@@ -18,11 +29,8 @@ def split(
     bad_keys = set(df.columns).difference(set([column])).intersection(set(into))
     if bad_keys:
         raise KeyError("into keys must be unique")
-    columns = {uuid.uuid4().hex: col for col in into}
-    temp = list(columns.keys())
-    df = df.copy()
-    df[temp] = df[column].str.split(sep, expand=True)
-    if drop:
-        df = df.drop(column, axis=1)
-    df = df.rename(columns=columns)
+    if not into:
+        raise ValueError("into must not be empty")
+    new = dict(zip(into, _pieces(df[column], sep, len(into))))
+    df = _assign(df, new, drop=[column] if drop else None)
     return df
@@ -1,9 +1,35 @@
-import uuid
+from __future__ import annotations
 
+import numpy as np  # pyright: ignore[reportMissingImports]
 import pandas as pd  # pyright: ignore[reportMissingImports]
 
 from ..checks import _check_type
-from ..types import Column, PandasDataFrame
+from ..types import Column, NumpyArray, PandasDataFrame, PandasIndex, PandasSeries
+
+
+def _rows(df: PandasDataFrame, index: list[Column], column: Column) -> NumpyArray:
+    """Output row for every input row (sorted by the index columns, -1 = dropped)"""
+    if not index:  # two columns: the nth occurrence of each column value
+        rows = df.groupby(column, observed=True).cumcount()
+    else:
+        rows = df.groupby(index, sort=True, observed=True).ngroup()
+    return rows.fillna(-1).to_numpy(dtype=np.int64)
+
+
+def _scatter(
+    values: PandasSeries, positions: NumpyArray, labels: PandasIndex
+) -> PandasDataFrame:
+    """Take values into (column-major) output cells, allocated once"""
+    array = values.to_numpy() if isinstance(values.dtype, np.dtype) else values.array
+    cells = pd.api.extensions.take(array, positions, allow_fill=True)
+    rows = len(positions) // max(len(labels), 1)
+    if isinstance(cells, np.ndarray):  # a single block (no per-column copies)
+        block = cells.reshape(len(labels), rows)
+        return PandasDataFrame(block.T, columns=labels, copy=False)
+    columns = [cells[j * rows : (j + 1) * rows] for j in range(len(labels))]
+    return PandasDataFrame(dict(zip(range(len(labels)), columns))).set_axis(
+        labels, axis=1
+    )
 
 
 def spread(df: PandasDataFrame, column: Column, using: Column) -> PandasDataFrame:
@@ -11,14 +37,27 @@ def spread(df: PandasDataFrame, column: Column, using: Column) -> PandasDataFram
     _check_type(using, str)
     if column == using:
         raise KeyError("column and using must be unique")
-    original_shape = df.shape[1]
-    if original_shape == 2:
-        temp = uuid.uuid4().hex
-        df[temp] = df.groupby(column).cumcount()
     index = [col for col in df.columns if col not in [column, using]]
-    df = pd.pivot_table(df, index=index, columns=[column], values=[using], aggfunc="first")  # type: ignore
-    df.columns = [col for col in df.columns.get_level_values(1)]  # type: ignore
-    df = df.reset_index().rename_axis(None, axis=0)
-    if original_shape == 2:
-        df = df.drop(temp, axis=1)  # type: ignore
-    return df
+    rows = _rows(df, index, column)
+    cols, labels = pd.factorize(df[column], sort=True)
+    if isinstance(labels, pd.CategoricalIndex):  # encoded: plain column names
+        labels = PandasIndex(np.asarray(labels, dtype=object))
+    keep = (rows >= 0) & (cols >= 0) & df[using].notna().to_numpy()
+    positions = np.flatnonzero(keep)
+    nrows, ncols = (rows.max() + 1 if len(rows) else 0), len(labels)
+    cells = cols[positions] * nrows + rows[positions]  # column-major
+    first = ~pd.Series(cells).duplicated().to_numpy()  # first non-null value wins
+    cells, positions = cells[first], positions[first]
+    keep_rows = np.bincount(cells % max(nrows, 1), minlength=nrows) > 0
+    keep_cols = np.bincount(cells // max(nrows, 1), minlength=ncols) > 0
+    grid = np.full(nrows * ncols, -1, dtype=np.int64)
+    grid[cells] = positions
+    if not (keep_rows.all() and keep_cols.all()):  # drop all-null rows/columns
+        grid = grid.reshape(ncols, nrows)[keep_cols][:, keep_rows].ravel()
+    values = _scatter(df[using], grid, PandasIndex(labels)[keep_cols])
+    if not index:
+        return values
+    firsts = np.flatnonzero(~pd.Series(rows).duplicated().to_numpy() & (rows >= 0))
+    firsts = firsts[np.argsort(rows[firsts])][keep_rows]  # first row of each group
+    keys = df[index].take(firsts).reset_index(drop=True)
+    return pd.concat([keys, values], axis=1, copy=False)
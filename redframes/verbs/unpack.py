@@ -1,13 +1,32 @@
 from __future__ import annotations
 
+from ..arrow import _explode, _flat, _has_arrow, _is_arrow
 from ..checks import _check_type
-from ..types import Column, PandasDataFrame
+from ..share import _assign
+from ..types import (
+    Column,
+    PandasArrowDtype,
+    PandasDataFrame,
+    PandasIndex,
+    PandasSeries,
+)
 
 
 def unpack(df: PandasDataFrame, column: Column, sep: str) -> PandasDataFrame:
     _check_type(column, str)
     _check_type(sep, str)
-    df = df.assign(**{column: df[column].str.split(sep)})
-    df = df.explode(column)
-    df = df.reset_index(drop=True)
+    strings = _flat(df[column]) if _has_arrow() else None
+    if strings is None:
+        df = df.assign(**{column: df[column].str.split(sep)})
+        df = df.explode(column)
+        df = df.reset_index(drop=True)
+        return df
+    rows, values = _explode(strings, sep)
+    df = df.take(rows)
+    index = PandasIndex(range(len(df)))
+    if _is_arrow(df[column]):
+        values = PandasSeries(values, index=index, dtype=PandasArrowDtype(values.type))
+    else:
+        values = PandasSeries(values.to_numpy(zero_copy_only=False), index=index)
+    df = _assign(df.set_axis(index), {column: values})
     return df
@@ -19,6 +19,10 @@ setup(
     python_requires=">=3.8",
     install_requires=["pandas>=1.5,<3.0"],
     extras_require={
+        "arrow": ["pyarrow"],
+        "jit": ["numba"],
+        "parallel": ["cloudpickle"],
+        "polars": ["polars>=1.24", "pyarrow"],
         "test": [
             "matplotlib",
             "scikit-learn",
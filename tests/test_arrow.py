@@ -0,0 +1,102 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import redframes as rf
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+def is_arrow(df: rf.DataFrame, column: str) -> bool:
+    return isinstance(df._data[column].dtype, pd.ArrowDtype)
+
+
+@unittest.skipUnless(pyarrow, "requires pyarrow")
+class TestArrow(unittest.TestCase):
+    def setUp(self):
+        self.df = rf.DataFrame(
+            {
+                "foo": [1, 2, 3, None],
+                "bar": ["A::1", "B::2", "C::3", None],
+                "baz": ["x", "x", "y", "y"],
+            },
+            arrow=True,
+        )
+
+    def test_init(self):
+        self.assertTrue(all(is_arrow(self.df, col) for col in self.df.columns))
+
+    def test_init_empty(self):
+        self.assertTrue(rf.DataFrame(arrow=True).empty)
+
+    def test_types(self):
+        expected = {"foo": int, "bar": str, "baz": str}
+        self.assertEqual(self.df.types, expected)
+
+    def test_getitem_nulls(self):
+        self.assertEqual(self.df["foo"], [1, 2, 3, None])
+        self.assertEqual(self.df["bar"], ["A::1", "B::2", "C::3", None])
+
+    def test_combine(self):
+        result = self.df.combine(["baz", "foo"], into="jaz", sep="-")
+        expected = rf.DataFrame(
+            {"bar": ["A::1", "B::2", "C::3", None], "jaz": ["x-1", "x-2", "y-3", None]},
+            arrow=True,
+        )
+        self.assertEqual(result, expected)
+
+    def test_pack(self):
+        result = self.df.group("baz").pack("bar", sep="|")
+        expected = rf.DataFrame(
+            {"baz": ["x", "y"], "bar": ["A::1|B::2", "C::3"]}, arrow=True
+        )
+        self.assertEqual(result, expected)
+
+    def test_pack_skips_nulls(self):
+        df = rf.DataFrame({"foo": ["x", "x", "y"], "bar": [1, None, 3]}, arrow=True)
+        result = df.group("foo").pack("bar", sep="|")
+        self.assertTrue(is_arrow(result, "bar"))
+        self.assertEqual(result["bar"], ["1", "3"])
+
+    def test_split(self):
+        result = self.df.split("bar", into=["bar", "raz"], sep="::")
+        self.assertTrue(is_arrow(result, "bar"))
+        self.assertTrue(is_arrow(result, "raz"))
+        self.assertEqual(result["raz"][:3], ["1", "2", "3"])
+        self.assertTrue(pd.isna(result["raz"][3]))
+
+    def test_split_keeps_remainder(self):
+        df = rf.DataFrame({"foo": ["A::1::x", "B", None]}, arrow=True)
+        result = df.split("foo", into=["bar", "baz"], sep="::")
+        self.assertTrue(is_arrow(result, "baz"))
+        self.assertEqual(result["baz"][0], "1::x")
+        self.assertTrue(pd.isna(result["baz"][1]))
+        self.assertTrue(pd.isna(result["bar"][2]))
+
+    def test_unpack(self):
+        result = self.df.unpack("bar", sep="::")
+        self.assertTrue(is_arrow(result, "bar"))
+        self.assertEqual(result["bar"][:6], ["A", "1", "B", "2", "C", "3"])
+        self.assertTrue(pd.isna(result["bar"][6]))
+
+    def test_unpack_keeps_null_rows(self):
+        df = rf.DataFrame({"foo": [1, 2, 3], "bar": ["A::B", None, ""]}, arrow=True)
+        result = df.unpack("bar", sep="::")
+        self.assertEqual(result["foo"], [1, 1, 2, 3])
+        self.assertEqual(result["bar"][:2], ["A", "B"])
+        self.assertTrue(pd.isna(result["bar"][2]))
+        self.assertEqual(result["bar"][3], "")
+
+    def test_unwrap_zero_copy(self):
+        df = rf.DataFrame({"foo": np.arange(10)})
+        pdf = rf.unwrap(df, copy=False)
+        self.assertTrue(np.shares_memory(pdf["foo"].values, df._data["foo"].values))
+
+    def test_wrap_zero_copy(self):
+        pdf = pd.DataFrame({"foo": np.arange(10)})
+        df = rf.wrap(pdf, copy=False)
+        self.assertTrue(np.shares_memory(pdf["foo"].values, df._data["foo"].values))
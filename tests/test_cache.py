@@ -0,0 +1,132 @@
+import os
+import unittest
+from shutil import rmtree as delete
+from tempfile import mkdtemp as make_temp_dir
+
+import redframes as rf
+from redframes.cache import _CACHE
+
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = make_temp_dir()
+        _CACHE.clear()
+        self.lhs = rf.DataFrame({"foo": ["A", "B", "A"], "bar": [1, 2, 3]})
+        self.rhs = rf.DataFrame({"foo": ["A", "B"], "baz": [True, False]})
+
+    def tearDown(self):
+        delete(self.tempdir)
+
+    def test_cache_hit(self):
+        with rf.cache():
+            result1 = self.lhs.join(self.rhs, on="foo")
+            result2 = self.lhs.join(self.rhs, on="foo", how="left")
+        self.assertEqual(result1, self.lhs.join(self.rhs, on="foo"))
+        self.assertIs(result1._data, result2._data)
+
+    def test_cache_object_cell_types(self):
+        adf = rf.DataFrame({"foo": [1, "x"], "bar": [1, 2]})
+        bdf = rf.DataFrame({"foo": ["1", "x"], "bar": [1, 2]})
+        rhs = rf.DataFrame({"foo": ["1", "x"], "baz": [10, 20]})
+        with rf.cache():
+            result1 = adf.join(rhs, on="foo")
+            result2 = bdf.join(rhs, on="foo")
+        self.assertEqual(result1, adf.join(rhs, on="foo"))
+        self.assertEqual(result2, bdf.join(rhs, on="foo"))
+        self.assertNotEqual(result1, result2)
+
+    def test_cache_survives_blocks(self):
+        over = {"bar": ("bar", rf.stat.sum)}
+        with rf.cache():
+            result1 = self.lhs.group("foo").rollup(over)
+        with rf.cache():
+            result2 = self.lhs.group("foo").rollup(over)
+        self.assertIs(result1._data, result2._data)
+
+    def test_cache_miss_on_new_data(self):
+        other = rf.DataFrame({"foo": ["A", "B", "A"], "bar": [1, 2, 4]})
+        with rf.cache():
+            result1 = self.lhs.join(self.rhs, on="foo")
+            result2 = other.join(self.rhs, on="foo")
+        self.assertEqual(result2["bar"], [1, 2, 4])
+        self.assertIsNot(result1._data, result2._data)
+
+    def test_cache_miss_on_groups(self):
+        over = {"n": ("bar", rf.stat.count)}
+        with rf.cache():
+            result1 = self.lhs.rollup(over)
+            result2 = self.lhs.group("foo").rollup(over)
+        self.assertEqual(result1, rf.DataFrame({"n": [3]}))
+        self.assertEqual(result2, rf.DataFrame({"foo": ["A", "B"], "n": [2, 1]}))
+
+    def test_cache_skips_lambdas(self):
+        over = {"bar": ("bar", lambda values: values.sum())}
+        with rf.cache():
+            result1 = self.lhs.rollup(over)
+            result2 = self.lhs.rollup(over)
+        self.assertIsNot(result1._data, result2._data)
+
+    def test_cache_miss_on_redefined_function(self):
+        namespace = {"__name__": "notebook"}
+        exec("def agg(values):\n    return values.sum()", namespace)
+        with rf.cache():
+            result1 = self.lhs.rollup({"bar": ("bar", namespace["agg"])})
+            exec("def agg(values):\n    return values.max()", namespace)
+            result2 = self.lhs.rollup({"bar": ("bar", namespace["agg"])})
+        self.assertEqual(result1, rf.DataFrame({"bar": [6]}))
+        self.assertEqual(result2, rf.DataFrame({"bar": [3]}))
+
+    def test_cache_miss_on_changed_global(self):
+        namespace = {"__name__": "notebook", "K": 1}
+        exec("def agg(values):\n    return values.sum() + K", namespace)
+        with rf.cache():
+            result1 = self.lhs.rollup({"bar": ("bar", namespace["agg"])})
+            namespace["K"] = 100
+            result2 = self.lhs.rollup({"bar": ("bar", namespace["agg"])})
+            result3 = self.lhs.rollup({"bar": ("bar", namespace["agg"])})
+        self.assertEqual(result1, rf.DataFrame({"bar": [7]}))
+        self.assertEqual(result2, rf.DataFrame({"bar": [106]}))
+        self.assertIs(result2._data, result3._data)
+
+    def test_cache_outside_block(self):
+        df = rf.DataFrame({"id": [1, 1, 2], "foo": ["A", "B", "A"], "bar": [1, 2, 3]})
+        with rf.cache():
+            result1 = df.spread("foo", using="bar")
+        result2 = df.spread("foo", using="bar")
+        self.assertEqual(result1, result2)
+        self.assertIsNot(result1._data, result2._data)
+
+    def test_cache_budget_eviction(self):
+        with rf.cache(budget=1):
+            result1 = self.lhs.cross(self.rhs)
+            result2 = self.lhs.cross(self.rhs)
+        self.assertIsNot(result1._data, result2._data)
+
+    def test_cache_path(self):
+        with rf.cache(path=self.tempdir):
+            result1 = self.lhs.cross(self.rhs)
+        _CACHE.clear()  # (new session)
+        with rf.cache(path=self.tempdir):
+            result2 = self.lhs.cross(self.rhs)
+        self.assertEqual(len(os.listdir(self.tempdir)), 1)
+        self.assertEqual(result1, result2)
+
+    def test_cache_path_budget(self):
+        with rf.cache(path=self.tempdir):
+            self.lhs.cross(self.rhs)
+            self.rhs.cross(self.lhs)
+        files = [os.path.join(self.tempdir, file) for file in os.listdir(self.tempdir)]
+        self.assertEqual(len(files), 2)
+        size = max(os.path.getsize(file) for file in files)
+        with rf.cache(budget=size, path=self.tempdir):
+            self.assertEqual(len(os.listdir(self.tempdir)), 1)
+
+    def test_cache_bad_budget(self):
+        with self.assertRaisesRegex(ValueError, "must be > 0"):
+            with rf.cache(budget=0):
+                pass
+
+    def test_cache_bad_path(self):
+        with self.assertRaisesRegex(TypeError, "must be str | None"):
+            with rf.cache(path=1):
+                pass
@@ -0,0 +1,19 @@
+import unittest
+
+import pandas as pd
+
+import redframes as rf
+
+
+class TestCombine(unittest.TestCase):
+    def test_combine_nulls(self):
+        df = rf.DataFrame({"foo": [1, None, 3], "bar": ["A", "B", None]})
+        result = df.combine(["foo", "bar"], into="baz", sep="-")
+        expected = rf.DataFrame({"baz": ["1.0-A", None, None]})
+        self.assertEqual(result, expected)
+
+    def test_combine_datetime(self):
+        df = rf.DataFrame({"foo": [pd.Timestamp("2022-01-01")], "bar": ["A"]})
+        result = df.combine(["foo", "bar"], into="baz", sep="|")
+        expected = rf.DataFrame({"baz": ["2022-01-01 00:00:00|A"]})
+        self.assertEqual(result, expected)
@@ -21,6 +21,7 @@ class TestDeprecations(unittest.TestCase):
                 "value": [1, 2, 3, 4],
             }
         )
+        expected = rf.wrap(rf.unwrap(expected).astype({"variable": "category"}))
         with self.assertWarnsRegex(FutureWarning, "Marked for removal*"):
             result = df.gather(beside="foo")
             self.assertEqual(result, expected)
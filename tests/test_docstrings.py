@@ -2,6 +2,11 @@ import unittest
 
 import redframes as rf
 
+try:
+    import cloudpickle
+except ImportError:
+    cloudpickle = None
+
 
 class TestDocstrings(unittest.TestCase):
     def test_take(self):
@@ -71,6 +76,7 @@ class TestDocstrings(unittest.TestCase):
                 ],
             }
         )
+        expected1 = rf.wrap(rf.unwrap(expected1).astype({"variable": "category"}))
         expected2 = rf.DataFrame(
             {
                 "baz": ["!", "@", "#", "$", "!", "@", "#", "$"],
@@ -79,6 +85,7 @@ class TestDocstrings(unittest.TestCase):
                 "val": [1, 2, 1, 2, "A", "B", "C", "D"],
             }
         )
+        expected2 = rf.wrap(rf.unwrap(expected2).astype({"var": "category"}))
         expected3 = rf.DataFrame(
             {
                 "foo": [1, 2, 1, 2, 1, 2, 1, 2],
@@ -87,6 +94,7 @@ class TestDocstrings(unittest.TestCase):
                 "value": ["!", "@", "#", "$", 0, 1, 2, 3],
             }
         )
+        expected3 = rf.wrap(rf.unwrap(expected3).astype({"variable": "category"}))
         self.assertEqual(result1, expected1)
         self.assertEqual(result2, expected2)
         self.assertEqual(result3, expected3)
@@ -125,12 +133,12 @@ class TestDocstrings(unittest.TestCase):
         )
         expected = rf.DataFrame(
             {
-                "fcount": [5.0],
+                "fcount": [5],
                 "fmean": [3.0],
-                "fsum": [15.0],
-                "fmax": [5.0],
+                "fsum": [15],
+                "fmax": [5],
                 "bmedian": [2.0],
-                "bmin": [-5.0],
+                "bmin": [-5],
                 "bstd": [54.929955397760885],
             }
         )
@@ -183,6 +191,17 @@ class TestDocstrings(unittest.TestCase):
         is_small = result.startswith("3") and result.endswith("B")
         self.assertTrue(is_small)
 
+    def test_init_encode(self):
+        df = rf.DataFrame({"foo": range(4), "bar": ["A", "B", "A", "A"]}, encode=0.5)
+        result = df.types
+        expected = {"foo": int, "bar": object}
+        self.assertEqual(result, expected)
+
+    def test_fingerprint(self):
+        adf = rf.DataFrame({"foo": [1, 2], "bar": ["A", "B"]})
+        bdf = rf.DataFrame({"foo": [1, 2], "bar": ["A", "B"]})
+        self.assertEqual(adf.fingerprint(), bdf.fingerprint())
+
     def test_types(self):
         df = rf.DataFrame({"foo": [1, 2], "bar": ["A", "B"], "baz": [True, False]})
         result = df.types
@@ -342,6 +361,7 @@ class TestDocstrings(unittest.TestCase):
                 "value": [1, 2, 3, 4, 5, 9, 7, 7, 5, 6],
             }
         )
+        expected2 = rf.wrap(rf.unwrap(expected2).astype({"variable": "category"}))
         expected3 = rf.DataFrame({"foo": ["A", "B"], "bar": ["1:2:3", "4:5"]})
         expected4 = rf.DataFrame(
             {
@@ -388,6 +408,44 @@ class TestDocstrings(unittest.TestCase):
         self.assertEqual(result3, expected3)
         self.assertEqual(result4, expected4)
 
+    def test_index_on(self):
+        df = rf.DataFrame({"foo": ["A", "B", "A", "C"], "bar": [1, 2, 3, 4]})
+        df = df.index_on("foo")
+        result1 = df.lookup(["A", "C"])
+        result2 = rf.DataFrame({"foo": ["C", "A"]}).join(df, on="foo")
+        result3 = df.dedupe("foo")
+        expected1 = rf.DataFrame({"foo": ["A", "A", "C"], "bar": [1, 3, 4]})
+        expected2 = rf.DataFrame({"foo": ["C", "A", "A"], "bar": [4, 1, 3]})
+        expected3 = rf.DataFrame({"foo": ["A", "B", "C"], "bar": [1, 2, 4]})
+        self.assertEqual(result1, expected1)
+        self.assertEqual(result2, expected2)
+        self.assertEqual(result3, expected3)
+
+    def test_lookup(self):
+        df = rf.DataFrame({"foo": ["A", "B", "A", "C"], "bar": [1, 2, 3, 4]})
+        result = df.index_on("foo").lookup("A")
+        expected = rf.DataFrame({"foo": ["A", "A"], "bar": [1, 3]})
+        self.assertEqual(result, expected)
+
+    def test_lazy(self):
+        df = rf.DataFrame({"foo": [1, 2, 3, 4], "bar": ["A", "B", "C", "D"]})
+        result = (
+            df.lazy()
+            .filter(lambda row: row["foo"] >= 2)
+            .select("bar")
+            .take(2)
+            .collect()
+        )
+        expected = rf.DataFrame({"bar": ["B", "C"]})
+        self.assertEqual(result, expected)
+
+    def test_lazy_collect(self):
+        df = rf.DataFrame({"foo": [3, 1, 2], "bar": ["A", "B", "C"]})
+        lazy = df.lazy().sort("foo").filter(lambda row: row["foo"] > 1, row_local=True)
+        result = lazy.select("bar").collect()
+        expected = rf.DataFrame({"bar": ["C", "A"]})
+        self.assertEqual(result, expected)
+
     def test_mutate(self):
         df = rf.DataFrame({"foo": [1, 2, 3]})
         result = df.mutate(
@@ -407,6 +465,31 @@ class TestDocstrings(unittest.TestCase):
         )
         self.assertEqual(result, expected)
 
+    @unittest.skipUnless(cloudpickle, "requires cloudpickle")
+    def test_mutate_workers(self):
+        df = rf.DataFrame({"foo": [1, 2, 3]})
+        result = df.mutate({"bar": lambda row: row["foo"] ** 2}, workers=4)
+        expected = rf.DataFrame({"foo": [1, 2, 3], "bar": [1, 4, 9]})
+        self.assertEqual(result, expected)
+
+    def test_mutate_vectorized(self):
+        df = rf.DataFrame({"foo": [1, 2, 3]})
+        result = df.mutate(
+            {
+                "bar": lambda df: df["foo"] * 1.5,
+                "baz": lambda df: "X" + (df["bar"] * 2).astype(str),
+            },
+            vectorized=True,
+        )
+        expected = rf.DataFrame(
+            {
+                "foo": [1, 2, 3],
+                "bar": [1.5, 3.0, 4.5],
+                "baz": ["X3.0", "X6.0", "X9.0"],
+            }
+        )
+        self.assertEqual(result, expected)
+
     def test_rename(self):
         df = rf.DataFrame({"foo": [1, 2], "bar": [3, 4]})
         result = df.rename({"foo": "oof", "bar": "rab"})
@@ -0,0 +1,47 @@
+import unittest
+
+import redframes as rf
+
+
+class TestEncode(unittest.TestCase):
+    def test_encode_matches_object_columns(self):
+        data = {"foo": ["A", "B", "A", None, "B"], "bar": [1, 2, 3, 4, 5]}
+        adf, bdf = rf.DataFrame(data), rf.DataFrame(data, encode=0.5)
+        rhs = rf.DataFrame({"foo": ["B", "C", "A"], "baz": [1, 2, 3]}, encode=1.0)
+        results = [
+            lambda df: df.group("foo").rollup({"n": ("bar", rf.stat.sum)}),
+            lambda df: df.join(rhs, on="foo", how="inner"),
+            lambda df: df.replace({"foo": {"A": "B", "B": "Z"}}),
+            lambda df: df.fill("foo", constant="Z"),
+            lambda df: df.dedupe("foo"),
+            lambda df: df.sort("foo"),
+            lambda df: df.replace({"foo": {"A": "Z"}}).sort("foo"),
+            lambda df: df.fill("foo", constant="0").sort("foo"),
+            lambda df: df.join(rhs, on="foo", how="full").sort("foo"),
+            lambda df: df.group("bar").rollup({"foo": ("foo", rf.stat.max)}),
+            lambda df: df.denix("foo").rollup({"foo": ("foo", rf.stat.min)}),
+        ]
+        for result in results:
+            expected = rf.unwrap(result(adf)).fillna({"foo": float("nan")})
+            encoded = rf.unwrap(result(bdf)).astype({"foo": object})
+            self.assertEqual(rf.wrap(encoded), rf.wrap(expected))
+
+    def test_encode_decodes_for_users(self):
+        data = {"foo": ["A", "B", "A", None], "bar": [1, 2, 3, 4]}
+        adf, bdf = rf.DataFrame(data), rf.DataFrame(data, encode=0.75)
+        self.assertEqual(bdf["foo"], adf["foo"])
+        over = {"baz": lambda df: df["foo"] + "!"}
+        expected = rf.unwrap(adf.mutate(over, vectorized=True))["baz"]
+        result = rf.unwrap(bdf.mutate(over, vectorized=True))["baz"]
+        self.assertEqual(list(result.fillna("")), list(expected.fillna("")))
+
+    def test_encode_append_keeps_encoding(self):
+        top = rf.DataFrame({"foo": ["B", "B"]}, encode=0.5)
+        bottom = rf.DataFrame({"foo": ["C", "A", "A"]}, encode=1.0)
+        result = rf.unwrap(top.append(bottom))["foo"]
+        self.assertEqual(list(result.cat.categories), ["A", "B", "C"])
+        self.assertEqual(list(result), ["B", "B", "C", "A", "A"])
+
+    def test_encode_keeps_high_cardinality(self):
+        df = rf.DataFrame({"foo": ["A", "B", "C"], "bar": [1, 1, 1]}, encode=0.5)
+        self.assertEqual(str(rf.unwrap(df)["foo"].dtype), "object")
@@ -0,0 +1,159 @@
+import subprocess
+import sys
+import threading
+import unittest
+from random import Random
+
+import redframes as rf
+from redframes.engine import _engine
+
+try:
+    import polars
+except ImportError:
+    polars = None
+
+
+class TestEngine(unittest.TestCase):
+    def setUp(self):
+        self.df = rf.DataFrame(
+            {
+                "foo": range(10),
+                "bar": [1, 3.2, 4.5, 2, -1, 30, None, 1.1, 1.1, 9],
+                "baz": ["A", "A", None, "B", "B", "A", "B", "C", "C", "A"],
+            }
+        )
+        self.rhs = rf.DataFrame(
+            {"baz": ["A", "B", "D", None], "bar": [0.5, 1.5, 2.5, 3.5], "jaz": range(4)}
+        )
+
+    def test_bad_engine(self):
+        with self.assertRaisesRegex(ValueError, "must be one of"):
+            with rf.engine("spark"):
+                pass
+
+    def test_bad_engine_type(self):
+        with self.assertRaisesRegex(TypeError, "must be str"):
+            with rf.engine(1):
+                pass
+
+    def test_polars_not_imported_eagerly(self):
+        code = "import sys, redframes; print('polars' in sys.modules)"
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True)
+        self.assertEqual(output.stdout.strip(), b"False")
+
+    @unittest.skipUnless(polars, "requires polars")
+    def test_engine_is_per_thread(self):
+        entered, done, seen = threading.Event(), threading.Event(), []
+
+        def worker():
+            with rf.engine("polars"):
+                entered.set()
+                done.wait(5)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        entered.wait(5)
+        seen.append(_engine())
+        done.set()
+        thread.join()
+        self.assertEqual(seen, ["pandas"])
+
+    def test_pandas_engine(self):
+        with rf.engine("pandas"):
+            result = self.df.sort("bar")
+        self.assertEqual(result, self.df.sort("bar"))
+
+    @unittest.skipUnless(polars, "requires polars")
+    def test_polars_docstring(self):
+        df = rf.DataFrame({"foo": ["A", "B", "A"], "bar": [1, 2, 3]})
+        with rf.engine("polars"):
+            result = df.group("foo").rollup({"bar": ("bar", rf.stat.sum)})
+        expected = rf.DataFrame({"foo": ["A", "B"], "bar": [4, 2]})
+        self.assertEqual(result, expected)
+
+    @unittest.skipUnless(polars, "requires polars")
+    def test_polars_join(self):
+        for how in ["left", "right", "inner", "full"]:
+            expected = self.df.join(self.rhs, on="baz", how=how, postfix=("_l", "_r"))
+            with rf.engine("polars"):
+                result = self.df.join(self.rhs, on="baz", how=how, postfix=("_l", "_r"))
+            self.assertEqual(result, expected)
+
+    @unittest.skipUnless(polars, "requires polars")
+    def test_polars_join_row_order(self):
+        cases = [
+            (["A", "B", "A", "C"], ["A", "A"], "inner"),  # duplicate keys
+            ([None, "B"], ["A", None, None, "A", "C"], "inner"),
+            ([None], ["B"], "full"),  # null keys
+        ]
+        for left, right, how in cases:
+            lhs = rf.DataFrame({"k": left, "a": range(len(left))})
+            rhs = rf.DataFrame({"k": right, "b": range(len(right))})
+            expected = lhs.join(rhs, on="k", how=how)
+            with rf.engine("polars"):
+                result = lhs.join(rhs, on="k", how=how)
+            self.assertEqual(result, expected)
+
+    @unittest.skipUnless(polars, "requires polars")
+    def test_polars_join_random(self):
+        random = Random(42)
+        keys = [["A", "B", "C", None], [1, 2, 3, None]]
+        for _ in range(300):
+            values = random.choice(keys)
+            n, m = random.randint(1, 6), random.randint(1, 6)
+            lhs = {"k": [random.choice(values) for _ in range(n)], "j": [1] * n}
+            rhs = {"k": [random.choice(values) for _ in range(m)], "j": [1] * m}
+            lhs, rhs = rf.DataFrame({**lhs, "a": range(n)}), rf.DataFrame(rhs)
+            on = random.choice(["k", ["k", "j"]])
+            how = random.choice(["left", "right", "inner", "full"])
+            try:
+                expected = lhs.join(rhs, on=on, how=how)
+            except ValueError:  # (pandas can't build some outer joins on nulls)
+                continue
+            with rf.engine("polars"):
+                result = lhs.join(rhs, on=on, how=how)
+            self.assertEqual(result, expected, (lhs, rhs, on, how))
+
+    @unittest.skipUnless(polars, "requires polars")
+    def test_polars_sort(self):
+        expected = self.df.sort(["baz", "bar"], descending=True)
+        with rf.engine("polars"):
+            result = self.df.sort(["baz", "bar"], descending=True)
+        self.assertEqual(result, expected)
+
+    @unittest.skipUnless(polars, "requires polars")
+    def test_polars_rollup(self):
+        over = {
+            "count": ("bar", rf.stat.count),
+            "mean": ("bar", rf.stat.mean),
+            "max": ("foo", rf.stat.max),
+            "std": ("bar", rf.stat.std),
+        }
+        expected = self.df.group("baz").rollup(over)
+        with rf.engine("polars"):
+            result = self.df.group("baz").rollup(over)
+        self.assertEqual(result, expected)
+
+    @unittest.skipUnless(polars, "requires polars")
+    def test_polars_rollup_fallback(self):
+        over = {"range": ("foo", lambda x: x.max() - x.min())}
+        expected = self.df.group("baz").rollup(over)
+        with rf.engine("polars"):
+            result = self.df.group("baz").rollup(over)
+        self.assertEqual(result, expected)
+
+    @unittest.skipUnless(polars, "requires polars")
+    def test_polars_mixed_types_fallback(self):
+        df = rf.DataFrame({"foo": [1, "A", 2.0], "bar": [3, 2, 1]})
+        expected = df.sort("bar")
+        with rf.engine("polars"):
+            result = df.sort("bar")
+        self.assertEqual(result, expected)
+
+    @unittest.skipUnless(polars, "requires polars")
+    def test_polars_engine_is_scoped(self):
+        from redframes.engine import _engine
+
+        with rf.engine("polars"):
+            self.assertEqual(_engine(), "polars")
+        self.assertEqual(_engine(), "pandas")
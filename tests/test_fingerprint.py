@@ -0,0 +1,47 @@
+import unittest
+
+import redframes as rf
+
+
+class TestFingerprint(unittest.TestCase):
+    def test_fingerprint_matches_equality(self):
+        adf = rf.DataFrame({"foo": [0.0, None], "bar": ["A", None]})
+        bdf = rf.DataFrame({"foo": [-0.0, float("nan")], "bar": ["A", float("nan")]})
+        cdf = rf.DataFrame({"foo": [0.0, None], "bar": ["B", None]})
+        self.assertEqual(adf.fingerprint(), bdf.fingerprint())
+        self.assertNotEqual(adf.fingerprint(), cdf.fingerprint())
+        self.assertEqual(adf, bdf)
+        self.assertNotEqual(adf, cdf)
+
+    def test_fingerprint_follows_data(self):
+        df = rf.DataFrame({"foo": [1, 2]})
+        before = df.fingerprint()
+        df._data = rf.DataFrame({"foo": [1, 3]})._data
+        self.assertNotEqual(df.fingerprint(), before)
+
+    def test_fingerprint_unhashable_values(self):
+        adf = rf.DataFrame({"foo": [[1, 2], [3]]})
+        bdf = rf.DataFrame({"foo": [[1, 2], [4]]})
+        self.assertNotEqual(adf.fingerprint(), bdf.fingerprint())
+
+    def test_fingerprint_object_cell_types(self):
+        frames = [
+            rf.DataFrame({"foo": [1, "x"]}),
+            rf.DataFrame({"foo": ["1", "x"]}),
+            rf.DataFrame({"foo": [None, "x"]}),
+            rf.DataFrame({"foo": ["None", "x"]}),
+        ]
+        fingerprints = {df.fingerprint() for df in frames}
+        self.assertEqual(len(fingerprints), len(frames))
+        for i, adf in enumerate(frames):
+            for j, bdf in enumerate(frames):
+                self.assertEqual(adf == bdf, i == j)
+
+    def test_eq_mismatched_dtypes(self):
+        self.assertNotEqual(rf.DataFrame({"foo": [1]}), rf.DataFrame({"foo": [1.0]}))
+
+    def test_eq_object_fingerprints(self):
+        adf, bdf = rf.DataFrame({"foo": [1, "x"]}), rf.DataFrame({"foo": [1.0, "x"]})
+        self.assertNotEqual(adf, bdf)
+        self.assertNotEqual(adf.fingerprint(), bdf.fingerprint())
+        self.assertNotEqual(adf, bdf)
@@ -0,0 +1,24 @@
+import unittest
+
+import redframes as rf
+
+
+class TestGather(unittest.TestCase):
+    def test_gather_encoded_variable(self):
+        df = rf.DataFrame({"foo": [1, None], "bar": [None, 2], "baz": [3, 4]})
+        result = df.gather().sort("variable")
+        expected = rf.DataFrame(
+            {"variable": ["bar", "baz", "baz", "foo"], "value": [2.0, 3.0, 4.0, 1.0]}
+        )
+        self.assertEqual(result.types, expected.types)
+        self.assertEqual(result["variable"], expected["variable"])
+        self.assertEqual(result["value"], expected["value"])
+
+    def test_gather_columns_named_like_melt_defaults(self):
+        df = rf.DataFrame({"value": [1, 2], "variable": [3, 4]})
+        result = df.gather(into=("k", "v")).sort(["k", "v"])
+        expected = rf.DataFrame(
+            {"k": ["value", "value", "variable", "variable"], "v": [1, 2, 3, 4]}
+        )
+        self.assertEqual(result["k"], expected["k"])
+        self.assertEqual(result["v"], expected["v"])
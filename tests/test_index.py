@@ -91,6 +91,10 @@ class TestIndex(unittest.TestCase):
         new = self.df.mutate({"foo": lambda row: row["foo"] * 10})
         self.assertTrue(index_is_okay(new))
 
+    def test_mutate_vectorized(self):
+        new = self.df.mutate({"foo": lambda df: df["foo"] * 10}, vectorized=True)
+        self.assertTrue(index_is_okay(new))
+
     def test_pack(self):
         new = self.df.pack("baz", sep="|")
         self.assertTrue(index_is_okay(new))
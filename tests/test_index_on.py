@@ -0,0 +1,18 @@
+import unittest
+
+import redframes as rf
+
+
+class TestIndexOn(unittest.TestCase):
+    def test_index_on_join_matches_merge(self):
+        rhs = rf.DataFrame({"foo": ["B", None, "A", "B"], "bar": [1, 2, 3, 4]})
+        lhs = rf.DataFrame({"foo": ["A", "B", "Z", None], "baz": range(4)})
+        for how in ["left", "inner", "right", "full"]:
+            result = lhs.join(rhs.index_on("foo"), on="foo", how=how)
+            expected = lhs.join(rhs, on="foo", how=how)
+            self.assertEqual(result, expected)
+
+    def test_index_on_dropped_by_verbs(self):
+        df = rf.DataFrame({"foo": [1, 2, 1], "bar": [1, 2, 3]}).index_on("foo")
+        with self.assertRaisesRegex(ValueError, "must be indexed"):
+            df.filter(lambda row: row["bar"] > 1).lookup(1)
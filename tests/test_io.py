@@ -3,10 +3,16 @@ from pathlib import Path
 from shutil import rmtree as delete
 from tempfile import mkdtemp as make_temp_dir
 
+import numpy as np
 import pandas as pd
 
 import redframes as rf
 
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
 
 class TestIO(unittest.TestCase):
     def setUp(self):
@@ -26,6 +32,10 @@ class TestIO(unittest.TestCase):
         with self.assertRaisesRegex(TypeError, "must end in .csv"):
             rf.load("test_bad_file_format.json")
 
+    def test_load_bad_format_message(self):
+        with self.assertRaisesRegex(TypeError, r"\.csv \| \.parquet \| \.feather"):
+            rf.load("test_bad_file_format.xlsx")
+
     def test_save_bad_path_format(self):
         with self.assertRaisesRegex(TypeError, "must end in .csv"):
             rf.save(self.df, "example.json")
@@ -73,3 +83,165 @@ class TestIO(unittest.TestCase):
         result = rf.wrap(pdf)
         expected = rf.DataFrame({"foo": [1, 2], "bar": [3, 4]})
         self.assertEqual(result, expected)
+
+    def test_stream_chunks(self):
+        rf.save(rf.DataFrame({"foo": range(5), "bar": list("ABCDE")}), self.path)
+        chunks = list(rf.stream(self.path, chunksize=2))
+        expected = [
+            rf.DataFrame({"foo": [0, 1], "bar": ["A", "B"]}),
+            rf.DataFrame({"foo": [2, 3], "bar": ["C", "D"]}),
+            rf.DataFrame({"foo": [4], "bar": ["E"]}),
+        ]
+        self.assertEqual(chunks, expected)
+
+    def test_stream_verbs_round_trip(self):
+        df = rf.DataFrame(
+            {
+                "foo": range(7),
+                "bar": ["a::1", "b::2", None, "c::3", "d::4", "e::5", "f::6"],
+            }
+        )
+        rf.save(df, self.path)
+        path = str(Path(self.tempdir) / "streamed.csv")
+        stream = (
+            rf.stream(self.path, chunksize=3)
+            .filter(lambda row: row["foo"] != 4)
+            .fill("bar", constant="z::0")
+            .split("bar", into=["baz", "jaz"], sep="::")
+            .mutate({"foo": lambda row: row["foo"] * 10})
+            .rename({"foo": "oof"})
+        )
+        rf.save(stream, path)
+        result = rf.load(path)
+        expected = (
+            df.filter(lambda row: row["foo"] != 4)
+            .fill("bar", constant="z::0")
+            .split("bar", into=["baz", "jaz"], sep="::")
+            .mutate({"foo": lambda row: row["foo"] * 10})
+            .rename({"foo": "oof"})
+            .mutate({"jaz": lambda row: int(row["jaz"])})
+        )
+        self.assertEqual(result, expected)
+
+    def test_stream_save_over_source(self):
+        df = rf.DataFrame({"foo": range(5), "bar": range(5)})
+        rf.save(df, self.path)
+        rf.save(
+            rf.stream(self.path, chunksize=2).filter(lambda row: row["foo"] > 1),
+            self.path,
+        )
+        self.assertEqual(rf.load(self.path), df.filter(lambda row: row["foo"] > 1))
+
+    def test_stream_failed_save_keeps_file(self):
+        rf.save(self.df, self.path)
+        stream = rf.stream(self.path).mutate({"foo": lambda row: row["oof"]})
+        with self.assertRaises(KeyError):
+            rf.save(stream, self.path)
+        self.assertEqual(rf.load(self.path), self.df)
+        self.assertFalse(Path(f"{self.path}.tmp").exists())
+
+    def test_stream_fill_direction(self):
+        rf.save(self.df, self.path)
+        with self.assertRaisesRegex(ValueError, "constant must not be None"):
+            rf.stream(self.path).fill("foo")
+
+    def test_stream_bad_chunksize(self):
+        with self.assertRaisesRegex(ValueError, "must be > 0"):
+            rf.stream(self.path, chunksize=0)
+
+    def test_stream_bad_format(self):
+        with self.assertRaisesRegex(TypeError, "must end in .csv"):
+            rf.stream("example.json")
+
+    @unittest.skipUnless(pyarrow, "requires pyarrow")
+    def test_round_trip_parquet(self):
+        path = str(Path(self.tempdir) / "example.parquet")
+        rf.save(self.df, path)
+        result = rf.load(path)
+        self.assertEqual(result, self.df)
+
+    @unittest.skipUnless(pyarrow, "requires pyarrow")
+    def test_round_trip_feather(self):
+        for name in ["example.feather", "example.arrow"]:
+            path = str(Path(self.tempdir) / name)
+            rf.save(self.df, path)
+            result = rf.load(path)
+            self.assertEqual(result, self.df)
+
+    @unittest.skipUnless(pyarrow, "requires pyarrow")
+    def test_load_parquet_projection(self):
+        path = str(Path(self.tempdir) / "example.parquet")
+        rf.save(self.df, path)
+        result = rf.load(path, columns=["bar"], filters=[("foo", ">", 1)])
+        expected = rf.DataFrame({"bar": [4]})
+        self.assertEqual(result, expected)
+
+    @unittest.skipUnless(pyarrow, "requires pyarrow")
+    def test_load_parquet_bad_index(self):
+        path = str(Path(self.tempdir) / "example.parquet")
+        self.pdf.set_index("foo").to_parquet(path)
+        with self.assertRaisesRegex(IndexError, "must be unnamed"):
+            rf.load(path)
+
+    def test_save_stream_bad_format(self):
+        rf.save(self.df, self.path)
+        with self.assertRaisesRegex(TypeError, "must end in .csv"):
+            rf.save(rf.stream(self.path), "example.parquet")
+
+    def test_load_encode(self):
+        df = rf.DataFrame({"foo": ["A", "B", "A", "A"], "bar": ["A", "B", "C", "D"]})
+        rf.save(df, self.path)
+        result = rf.load(self.path, encode=0.5)
+        self.assertEqual(str(rf.unwrap(result)["foo"].dtype), "category")
+        self.assertEqual(str(rf.unwrap(result)["bar"].dtype), "object")
+        self.assertEqual(result.types, df.types)
+
+    def test_load_bad_encode(self):
+        rf.save(self.df, self.path)
+        with self.assertRaisesRegex(ValueError, "must be between 0 and 1"):
+            rf.load(self.path, encode=2.0)
+
+    def test_round_trip_native(self):
+        path = str(Path(self.tempdir) / "example.rf")
+        df = rf.DataFrame(
+            {
+                "foo": [1, 2, 3],
+                "bar": [1.5, None, 3.0],
+                "baz": ["A", None, "ç"],
+                "jaz": [True, False, True],
+                "raz": [1, "B", None],
+            }
+        )
+        rf.save(df, path)
+        self.assertEqual(rf.load(path), df)
+        self.assertEqual(rf.unwrap(rf.load(path))["baz"].dtype, object)
+
+    @unittest.skipUnless(pyarrow, "requires pyarrow")
+    def test_round_trip_native_arrow(self):
+        path = str(Path(self.tempdir) / "example.rf")
+        df = rf.DataFrame({"foo": [1, 2, 3], "bar": ["A", None, "ç"]}, arrow=True)
+        rf.save(df, path)
+        self.assertEqual(rf.load(path), df)
+
+    def test_save_native_bad_kwargs(self):
+        path = str(Path(self.tempdir) / "example.rf")
+        with self.assertRaisesRegex(TypeError, "unexpected keyword arguments"):
+            rf.save(self.df, path, compression="gzip")
+
+    def test_load_native_is_memory_mapped(self):
+        path = str(Path(self.tempdir) / "example.rf")
+        rf.save(self.df, path)
+        result = rf.load(path, columns=["bar"])
+        self.assertEqual(result.columns, ["bar"])
+        self.assertIsInstance(rf.unwrap(result)["bar"].to_numpy().base, np.memmap)
+
+    def test_round_trip_native_encoded(self):
+        path = str(Path(self.tempdir) / "example.rf")
+        df = rf.DataFrame({"foo": ["A", "B", "A", None]}, encode=0.5)
+        rf.save(df, path)
+        self.assertEqual(rf.load(path), df)
+
+    def test_save_native_bad_path(self):
+        Path(self.tempdir, "other.rf").mkdir()
+        with self.assertRaisesRegex(FileExistsError, "must be a new path"):
+            rf.save(self.df, str(Path(self.tempdir) / "other.rf"))
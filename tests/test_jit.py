@@ -0,0 +1,96 @@
+import unittest
+
+import redframes as rf
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+@unittest.skipUnless(numba, "requires numba")
+class TestJit(unittest.TestCase):
+    def setUp(self):
+        self.df = rf.DataFrame(
+            {
+                "foo": ["A", "A", "A", "B"],
+                "bar": [1, 2, 3, 4],
+                "baz": [0.5, -1.5, 2.5, None],
+            }
+        )
+
+    def test_filter_docstring(self):
+        result = self.df.select(["foo", "bar"]).filter(
+            lambda row: row["bar"] % 2 == 0, jit=True
+        )
+        expected = rf.DataFrame({"foo": ["A", "B"], "bar": [2, 4]})
+        self.assertEqual(result, expected)
+
+    def test_mutate_docstring(self):
+        df = rf.DataFrame({"foo": [1, 2, 3]})
+        result = df.mutate({"bar": lambda row: row["foo"] ** 2}, jit=True)
+        expected = rf.DataFrame({"foo": [1, 2, 3], "bar": [1, 4, 9]})
+        self.assertEqual(result, expected)
+
+    def test_mutate_matches_apply(self):
+        over = {
+            "jaz": lambda row: row["bar"] * 2 + (row["baz"] if row["bar"] > 2 else 0),
+            "raz": lambda row: row["jaz"] > 4,
+        }
+        result = self.df.mutate(over, jit=True)
+        expected = self.df.mutate(over)
+        self.assertEqual(result, expected)
+
+    def test_filter_matches_vectorized(self):
+        func = lambda row: (row["bar"] > 1) & (row["baz"] > 0)
+        result = self.df.filter(func, jit=True)
+        expected = self.df.filter(func)
+        self.assertEqual(result, expected)
+
+    def test_mutate_fallback_strings(self):
+        result = self.df.mutate({"jaz": lambda row: row["foo"] + "!"}, jit=True)
+        expected = self.df.mutate({"jaz": lambda row: row["foo"] + "!"})
+        self.assertEqual(result, expected)
+
+    def test_filter_fallback_strings(self):
+        result = self.df.filter(lambda row: row["foo"] == "B", jit=True)
+        expected = self.df.filter(lambda row: row["foo"] == "B")
+        self.assertEqual(result, expected)
+
+    def test_mutate_closure_not_stale(self):
+        results = []
+        for factor in [2, 3]:
+            df = self.df.mutate({"jaz": lambda row: row["bar"] * factor}, jit=True)
+            results.append(df["jaz"])
+        self.assertEqual(results, [[2, 4, 6, 8], [3, 6, 9, 12]])
+
+    def test_mutate_empty(self):
+        df = rf.DataFrame({"foo": []})
+        result = df.mutate({"bar": lambda row: row["foo"] * 2}, jit=True)
+        expected = df.mutate({"bar": lambda row: row["foo"] * 2})
+        self.assertEqual(result, expected)
+
+    def test_mutate_jit_vectorized(self):
+        with self.assertRaisesRegex(ValueError, "jit is incompatible"):
+            self.df.mutate({"jaz": lambda df: df["bar"]}, vectorized=True, jit=True)
+
+    def test_mutate_global_not_stale(self):
+        namespace = {"K": 1}
+        exec("def func(row):\n    return row['baz'] + K", namespace)
+        df = self.df.denix("baz")
+        result1 = df.mutate({"jaz": namespace["func"]}, jit=True)
+        namespace["K"] = 100
+        result2 = df.mutate({"jaz": namespace["func"]}, jit=True)
+        self.assertEqual(result1["jaz"], [1.5, -0.5, 3.5])
+        self.assertEqual(result2["jaz"], [100.5, 98.5, 102.5])
+
+    def test_mutate_mixed_numbers_match_apply(self):
+        df = self.df.drop("foo")
+        over = {"jaz": lambda row: row["bar"] * 2}
+        self.assertEqual(df.mutate(over, jit=True), df.mutate(over))
+
+    def test_filter_fallback_is_row_wise(self):
+        func = lambda row: (row["foo"] == "A") and (row["bar"] > 1)
+        result = self.df.filter(func, jit=True)
+        expected = rf.DataFrame({"foo": ["A", "A"], "bar": [2, 3], "baz": [-1.5, 2.5]})
+        self.assertEqual(result, expected)
@@ -0,0 +1,34 @@
+import unittest
+
+import pandas as pd
+
+import redframes as rf
+
+
+class TestJoin(unittest.TestCase):
+    def test_join_sorted_keys_match_merge(self):
+        lhs = rf.DataFrame({"foo": [1, 1, 2, 4, 6], "bar": ["A", "B", "C", "D", "E"]})
+        rhs = rf.DataFrame({"bar": [10, 20, 30, 40], "foo": [1, 2, 2, 5]})
+        for how in ["left", "right", "inner", "full"]:
+            result = lhs.join(rhs, on="foo", how=how, postfix=("_l", "_r"))
+            expected = pd.merge(
+                rf.unwrap(lhs),
+                rf.unwrap(rhs),
+                on="foo",
+                how="outer" if how == "full" else how,
+                suffixes=("_l", "_r"),
+            )
+            self.assertEqual(result, rf.wrap(expected))
+
+    def test_join_sorted_unique_keys_match_merge(self):
+        lhs = rf.DataFrame({"foo": [1.0, 2.0, 4.0], "bar": [True, False, True]})
+        rhs = rf.DataFrame({"foo": [0.5, 2.0, 5.0], "baz": ["A", "B", "C"]})
+        for how in ["left", "right", "inner", "full"]:
+            result = lhs.join(rhs, on="foo", how=how)
+            expected = pd.merge(
+                rf.unwrap(lhs),
+                rf.unwrap(rhs),
+                on="foo",
+                how="outer" if how == "full" else how,
+            )
+            self.assertEqual(result, rf.wrap(expected))
@@ -69,3 +69,9 @@ class TestLadyBugs(unittest.TestCase):
         )
         with self.assertRaisesRegex(ValueError, "columns is incompatible*"):
             df.group("foo").gather(columns=["foo", "bar"])
+
+    def test_mutate_empty_frame(self):
+        df = rf.DataFrame({"foo": ["A"]}).filter(lambda row: row["foo"] == "B")
+        result = df.mutate({"bar": lambda row: row["foo"].lower()})
+        self.assertEqual(result.columns, ["foo", "bar"])
+        self.assertEqual(result.dimensions, {"rows": 0, "columns": 2})
@@ -0,0 +1,275 @@
+import unittest
+from random import Random
+
+import redframes as rf
+from redframes.lazy import _optimize
+
+
+class TestLazy(unittest.TestCase):
+    def setUp(self):
+        self.df = rf.DataFrame(
+            {
+                "foo": range(10),
+                "bar": [1, 3.2, 4.5, 2, -1, 30, None, 1.1, 1.5, 9],
+                "baz": ["A", "A", None, "B", "B", "A", "B", "C", "C", "A"],
+                "jaz": [
+                    "1::1",
+                    "2::2",
+                    "3:3",
+                    "4::4",
+                    "5::5",
+                    "6::7",
+                    "7::8",
+                    "8::9",
+                    "9::0",
+                    "0::-1",
+                ],
+            }
+        )
+
+    def test_collect_without_steps(self):
+        result = self.df.lazy().collect()
+        self.assertEqual(result, self.df)
+
+    def test_collect_matches_eager(self):
+        eager = (
+            self.df.sort("bar", descending=True)
+            .filter(lambda row: row["foo"] > 1)
+            .filter(lambda row: row["baz"].isin(["A", "B"]))
+            .split("jaz", into=["left", "right"], sep="::")
+            .select(["foo", "bar", "left"])
+            .take(3)
+        )
+        lazy = (
+            self.df.lazy()
+            .sort("bar", descending=True)
+            .filter(lambda row: row["foo"] > 1)
+            .filter(lambda row: row["baz"].isin(["A", "B"]))
+            .split("jaz", into=["left", "right"], sep="::")
+            .select(["foo", "bar", "left"])
+            .take(3)
+        )
+        self.assertEqual(lazy.collect(), eager)
+        self.assertEqual(lazy.collect(optimize=False), eager)
+
+    def test_collect_rollup(self):
+        eager = self.df.denix("bar").rollup({"bar_sum": ("bar", rf.stat.sum)})
+        lazy = self.df.lazy().denix("bar").rollup({"bar_sum": ("bar", rf.stat.sum)})
+        self.assertEqual(lazy.collect(), eager)
+
+    def test_projection_pruning(self):
+        lazy = self.df.lazy().sort("foo").rollup({"bar_max": ("bar", rf.stat.max)})
+        plan = _optimize(lazy._plan, self.df.columns)
+        self.assertEqual([step.verb for step in plan], ["select", "sort", "rollup"])
+        self.assertEqual(plan[0].args, (["foo", "bar"],))
+
+    def test_projection_pruning_after_filter(self):
+        lazy = self.df.lazy().filter(lambda row: row["foo"] > 5).select("baz")
+        plan = _optimize(lazy._plan, self.df.columns)
+        self.assertEqual([step.verb for step in plan], ["filter"])
+        self.assertEqual(plan[0].keep, ["baz"])
+        self.assertEqual(lazy.collect(), rf.DataFrame({"baz": ["B", "C", "C", "A"]}))
+
+    def test_projection_pruning_trims_drop(self):
+        lazy = self.df.lazy().drop("jaz").select(["foo", "baz"])
+        plan = _optimize(lazy._plan, self.df.columns)
+        self.assertEqual([step.verb for step in plan], ["select"])
+        self.assertEqual(lazy.collect(), self.df.select(["foo", "baz"]))
+
+    def test_predicate_pushdown(self):
+        lazy = self.df.lazy().sort("bar")
+        lazy = lazy.filter(lambda row: row["foo"] > 5, row_local=True)
+        plan = _optimize(lazy._plan, self.df.columns)
+        self.assertEqual([step.verb for step in plan], ["filter", "sort"])
+
+    def test_predicate_pushdown_is_opt_in(self):
+        lazy = self.df.lazy().sort("bar", descending=True)
+        lazy = lazy.filter(lambda df: ~df["baz"].duplicated())
+        plan = _optimize(lazy._plan, self.df.columns)
+        eager = self.df.sort("bar", descending=True)
+        eager = eager.filter(lambda df: ~df["baz"].duplicated())
+        self.assertEqual([step.verb for step in plan], ["sort", "filter"])
+        self.assertEqual(lazy.collect(), eager)
+
+    def test_filter_checks_arguments(self):
+        with self.assertRaisesRegex(TypeError, "must be Func"):
+            self.df.lazy().filter(1)
+        with self.assertRaisesRegex(TypeError, "must be bool"):
+            self.df.lazy().filter(lambda row: row["foo"] > 1, row_local=1)
+
+    def test_filter_fusion(self):
+        lazy = (
+            self.df.lazy()
+            .filter(lambda row: row["foo"] > 2)
+            .filter(lambda row: row["bar"] > row["bar"].mean())
+        )
+        plan = _optimize(lazy._plan, self.df.columns)
+        eager = self.df.filter(lambda row: row["foo"] > 2).filter(
+            lambda row: row["bar"] > row["bar"].mean()
+        )
+        self.assertEqual([step.verb for step in plan], ["filter"])
+        self.assertEqual(lazy.collect(), eager)
+
+    def test_limit_pushdown(self):
+        lazy = (
+            self.df.lazy()
+            .mutate({"foo": lambda row: row["foo"] * 10})
+            .rename({"foo": "oof"})
+            .take(-2)
+        )
+        plan = _optimize(lazy._plan, self.df.columns)
+        eager = self.df.mutate({"foo": lambda row: row["foo"] * 10})
+        eager = eager.rename({"foo": "oof"}).take(-2)
+        self.assertEqual([step.verb for step in plan], ["take", "mutate", "rename"])
+        self.assertEqual(lazy.collect(), eager)
+
+    def test_limit_pushdown_stops_at_vectorized_mutate(self):
+        lazy = (
+            self.df.lazy()
+            .mutate({"cumsum": lambda df: df["foo"].cumsum()}, vectorized=True)
+            .take(3)
+        )
+        plan = _optimize(lazy._plan, self.df.columns)
+        self.assertEqual([step.verb for step in plan], ["mutate", "take"])
+
+    def test_take_too_many_rows_still_raises(self):
+        lazy = self.df.lazy().take(5).take(6)
+        with self.assertRaisesRegex(ValueError, "exceeds total size"):
+            lazy.collect()
+
+    def test_take_too_many_rows_before_smaller_take_still_raises(self):
+        df = rf.DataFrame({"foo": [1, 2, 3, 4]})
+        lazy = df.lazy().take(5).take(2)
+        with self.assertRaisesRegex(ValueError, "exceeds total size"):
+            lazy.collect()
+
+    def test_bad_key_still_raises(self):
+        lazy = (
+            self.df.lazy().select(["foo", "oof"]).rollup({"foo": ("foo", rf.stat.sum)})
+        )
+        with self.assertRaisesRegex(KeyError, "is invalid"):
+            lazy.collect()
+
+    def test_no_side_effects(self):
+        expected = rf.DataFrame(
+            {"foo": range(10), "bar": [1, 3.2, 4.5, 2, -1, 30, None, 1.1, 1.5, 9]}
+        )
+        df = rf.DataFrame(
+            {"foo": range(10), "bar": [1, 3.2, 4.5, 2, -1, 30, None, 1.1, 1.5, 9]}
+        )
+        _ = df.lazy().fill(constant=0).accumulate("bar", into="bar").collect()
+        self.assertEqual(df, expected)
+
+    def test_select_first(self):
+        lazy = self.df.lazy().select(["bar"])
+        self.assertEqual(lazy.collect(), self.df.select(["bar"]))
+
+    def test_select_after_mutate(self):
+        lazy = (
+            self.df.lazy()
+            .sort("foo")
+            .mutate({"m": lambda row: row["foo"] * 2})
+            .select(["m"])
+        )
+        eager = self.df.sort("foo").mutate({"m": lambda row: row["foo"] * 2})
+        self.assertEqual(lazy.collect(), eager.select(["m"]))
+
+    def test_merged_takes(self):
+        lazy = (
+            self.df.lazy()
+            .take(5)
+            .take(5)
+            .filter(lambda row: row["foo"] > 1)
+            .denix("bar")
+        )
+        expected = self.df.take(5).filter(lambda row: row["foo"] > 1).denix("bar")
+        self.assertEqual(lazy.collect(), expected)
+
+    def test_fused_filters_see_reset_index(self):
+        lazy = (
+            self.df.lazy()
+            .filter(lambda row: row["foo"] > 2)
+            .filter(lambda row: row.index % 2 == 0)
+        )
+        eager = self.df.filter(lambda row: row["foo"] > 2).filter(
+            lambda row: row.index % 2 == 0
+        )
+        self.assertEqual(lazy.collect(), eager)
+
+    def test_positional_predicates_keep_their_order(self):
+        lazy = self.df.lazy().sort("bar").filter(lambda row: row.index < 3)
+        eager = self.df.sort("bar").filter(lambda row: row.index < 3)
+        self.assertEqual(lazy.collect(optimize=False), eager)
+        self.assertEqual(lazy.collect(), eager)
+
+    def test_random_plans(self):
+        random = Random(42)
+        for _ in range(300):
+            eager, lazy = self.df, self.df.lazy()
+            columns = list(self.df.columns)
+            numbers = ["foo", "bar"]
+            for _ in range(random.randint(1, 6)):
+                eager, lazy, columns, numbers = _random_step(
+                    random, eager, lazy, columns, numbers
+                )
+            self.assertEqual(lazy.collect(), eager, lazy)
+            self.assertEqual(lazy.collect(optimize=False), eager, lazy)
+
+
+def _random_step(random, eager, lazy, columns, numbers):
+    verbs = ["select", "rename", "mutate", "sort", "filter", "take", "denix", "fill"]
+    if len(columns) > 1:
+        verbs.append("drop")
+    if "jaz" in columns:
+        verbs.append("split")
+    verb = random.choice(verbs)
+    options = {}
+    if verb in {"select", "drop"}:
+        keep = random.sample(columns, random.randint(1, len(columns)))
+        if verb == "drop":
+            if len(keep) == len(columns):
+                keep = keep[1:]
+            args = ([col for col in columns if col not in keep],)
+        else:
+            args = (keep,)
+        columns = keep if verb == "select" else [c for c in columns if c in keep]
+    elif verb == "rename":
+        old = random.choice(columns)
+        args = ({old: f"{old}_"},)
+        columns = [f"{old}_" if col == old else col for col in columns]
+        numbers = [f"{old}_" if col == old else col for col in numbers]
+    elif verb == "mutate":
+        base = random.choice(numbers or [None])
+        new = f"m{random.randint(0, 2)}"
+        if base == None:
+            args = ({new: lambda row: 1},)
+        else:
+            args = ({new: lambda row, base=base: row[base] * 2},)
+        columns = columns + [new] if new not in columns else columns
+        numbers = numbers + [new] if new not in numbers else numbers
+    elif verb == "sort":
+        args = (random.choice(columns), random.random() < 0.5)
+    elif verb == "filter":
+        base = random.choice(numbers or [None])
+        if base == None:
+            args = (lambda row: row.index >= 0,)
+        else:
+            args = (lambda row, base=base: row[base].fillna(0) > 2,)
+            options = {"row_local": True}
+    elif verb == "take":
+        args = (random.choice([1, 3, -2]),)
+    elif verb == "denix":
+        args = (random.choice([None, random.choice(columns)]),)
+    elif verb == "fill":
+        args = (random.choice(columns), None, 0)
+    else:
+        args = ("jaz", ["left", "right"], "::")
+        columns = [col for col in columns if col != "jaz"]
+        columns = columns + [col for col in ["left", "right"] if col not in columns]
+    numbers = [col for col in numbers if col in columns]
+    try:
+        eager = getattr(eager, verb)(*args)
+    except (KeyError, ValueError):
+        return eager, lazy, list(eager.columns), numbers
+    lazy = getattr(lazy, verb)(*args, **options)
+    return eager, lazy, columns, numbers
@@ -0,0 +1,23 @@
+import unittest
+
+import redframes as rf
+
+
+class TestPack(unittest.TestCase):
+    def test_pack_empty(self):
+        df = rf.DataFrame({"foo": [], "bar": []})
+        self.assertEqual(df.pack("bar", sep="|"), rf.DataFrame({"bar": [""]}))
+        self.assertEqual(
+            df.group("foo").pack("bar", sep="|").dimensions, {"rows": 0, "columns": 2}
+        )
+
+    def test_pack_keeps_group_order(self):
+        df = rf.DataFrame({"foo": ["B", "A", None, "B"], "bar": [1, 2, 3, None]})
+        result = df.group("foo").pack("bar", sep="|")
+        expected = rf.DataFrame({"foo": ["B", "A"], "bar": ["1.0|nan", "2.0"]})
+        self.assertEqual(result, expected)
+
+    def test_unpack_mixed_values(self):
+        df = rf.DataFrame({"foo": ["A:B", None, 1]})
+        result = df.unpack("foo", sep=":")
+        self.assertEqual(result, rf.DataFrame({"foo": ["A", "B", None, None]}))
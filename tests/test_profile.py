@@ -0,0 +1,82 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+import redframes as rf
+
+
+class TestProfile(unittest.TestCase):
+    def setUp(self):
+        self.df = rf.DataFrame({"foo": [1, 2, 3], "bar": ["A", "B", "C"]})
+
+    def test_profile_docstring(self):
+        with rf.profile() as p:
+            self.df.filter(lambda row: row["foo"] > 1).select("bar")
+        result = p.frame.select(["verb", "rows_in", "rows_out", "columns_out"])
+        expected = rf.DataFrame(
+            {
+                "verb": ["filter", "select"],
+                "rows_in": [3, 2],
+                "rows_out": [2, 2],
+                "columns_out": [2, 1],
+            }
+        )
+        self.assertEqual(result, expected)
+
+    def test_profile_outside_block(self):
+        with rf.profile() as p:
+            pass
+        self.df.sort("foo")
+        self.assertEqual(p.records, [])
+        self.assertEqual(p.frame.dimensions, {"rows": 0, "columns": 7})
+
+    def test_profile_grouped(self):
+        with rf.profile() as p:
+            self.df.group("bar").rollup({"n": ("foo", rf.stat.count)})
+        self.assertEqual(p.frame["verb"], ["group", "rollup"])
+        self.assertEqual(p.frame["rows_out"], [3, 3])
+
+    def test_profile_lazy(self):
+        with rf.profile() as p:
+            self.df.lazy().sort("foo").take(1).collect()
+        self.assertEqual(p.frame["verb"], ["collect"])
+        self.assertEqual(p.frame["rows_out"], [1])
+
+    def test_profile_memory(self):
+        with rf.profile(memory=True) as p:
+            self.df.mutate({"baz": lambda row: row["foo"] * 2})
+        self.assertGreater(p.records[0]["memory"], 0)
+
+    def test_profile_trace(self):
+        with rf.profile() as p:
+            self.df.sort("foo").take(2)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "profile.json")
+            p.trace(path)
+            with open(path) as f:
+                trace = json.load(f)
+        events = trace["traceEvents"]
+        self.assertEqual([event["name"] for event in events], ["sort", "take"])
+        self.assertEqual({event["ph"] for event in events}, {"X"})
+        self.assertEqual(events[1]["args"]["rows_out"], 2)
+
+    def test_profile_is_per_thread(self):
+        thread = threading.Thread(target=lambda: self.df.sort("foo"))
+        with rf.profile() as p:
+            thread.start()
+            thread.join()
+            self.df.take(1)
+        self.assertEqual(p.frame["verb"], ["take"])
+
+    def test_profile_bad_memory(self):
+        with self.assertRaisesRegex(TypeError, "must be bool"):
+            with rf.profile(memory=1):
+                pass
+
+    def test_profile_bad_trace(self):
+        with rf.profile() as p:
+            pass
+        with self.assertRaisesRegex(ValueError, "must end in .json"):
+            p.trace("profile.csv")
@@ -0,0 +1,42 @@
+import unittest
+
+import redframes as rf
+
+
+class TestRollup(unittest.TestCase):
+    def test_rollup_ungrouped_dtypes(self):
+        df = rf.DataFrame({"foo": ["AB", "C", "D"], "bar": [1, 2, 3]})
+        result = df.rollup({"n": ("foo", rf.stat.count), "m": ("bar", rf.stat.mean)})
+        self.assertEqual(result, rf.DataFrame({"n": [3], "m": [2.0]}))
+
+    def test_rollup_ungrouped_empty(self):
+        df = rf.DataFrame({"foo": [1, 2]}).filter(lambda row: row["foo"] > 2)
+        result = df.rollup({"n": ("foo", rf.stat.count)})
+        self.assertEqual(result, rf.DataFrame({"n": [0]}))
+
+    def test_rollup_native_stats_match_python(self):
+        df = rf.DataFrame({"foo": ["A", "A", "B"], "bar": [1.0, None, 3.0]})
+        stats = {
+            rf.stat.count: lambda x: len(x),
+            rf.stat.mean: lambda x: x.mean(),
+            rf.stat.sum: lambda x: x.sum(),
+            rf.stat.max: lambda x: x.max(),
+            rf.stat.median: lambda x: x.median(),
+            rf.stat.min: lambda x: x.min(),
+            rf.stat.std: lambda x: x.std(),
+        }
+        for func, python in stats.items():
+            result = df.group("foo").rollup({"baz": ("bar", func)})
+            expected = df.group("foo").rollup({"baz": ("bar", python)})
+            self.assertEqual(result, expected)
+
+    def test_rollup_ungrouped_calls_func_once(self):
+        calls = []
+
+        def func(values):
+            calls.append(values)
+            return len(values)
+
+        df = rf.DataFrame({"foo": [1, 2, 3]})
+        self.assertEqual(df.rollup({"bar": ("foo", func)}), rf.DataFrame({"bar": [3]}))
+        self.assertEqual(len(calls), 1)
@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 import redframes as rf
 
 
@@ -106,6 +108,10 @@ class TestSideEffects(unittest.TestCase):
         _ = self.df.mutate({"foo": lambda row: row["foo"] * 10})
         self.assertEqual(self.df, self.expected)
 
+    def test_mutate_vectorized(self):
+        _ = self.df.mutate({"foo": lambda df: df["foo"] * 10}, vectorized=True)
+        self.assertEqual(self.df, self.expected)
+
     def test_pack(self):
         _ = self.df.pack("baz", sep="|")
         self.assertEqual(self.df, self.expected)
@@ -150,6 +156,11 @@ class TestSideEffects(unittest.TestCase):
         _ = self.df.denix("baz").select(["baz", "foo"]).spread("baz", "foo")
         self.assertEqual(self.df, self.expected)
 
+    def test_spread_two_columns(self):
+        df = rf.DataFrame({"foo": ["A", "B", "A"], "bar": [1, 2, 3]})
+        _ = df.spread("foo", using="bar")
+        self.assertEqual(df, rf.DataFrame({"foo": ["A", "B", "A"], "bar": [1, 2, 3]}))
+
     def test_take(self):
         _ = self.df.take(-3)
         self.assertEqual(self.df, self.expected)
@@ -157,3 +168,55 @@ class TestSideEffects(unittest.TestCase):
     def test_take(self):
         _ = self.df.unpack("jaz", sep="::")
         self.assertEqual(self.df, self.expected)
+
+
+def shares_column(new: rf.DataFrame, old: rf.DataFrame, column: str) -> bool:
+    return np.shares_memory(new._data[column].values, old._data[column].values)
+
+
+class TestStructuralSharing(unittest.TestCase):
+    def setUp(self):
+        self.df = rf.DataFrame(
+            {
+                "foo": np.arange(10),
+                "bar": np.linspace(0, 1, 10),
+                "baz": ["A", "A", None, "B", "B", "A", "B", "C", "C", "A"],
+                "jaz": ["1::1", "2::2", "3::3", "4::4", "5::5"] * 2,
+            }
+        )
+
+    def test_accumulate(self):
+        new = self.df.accumulate("foo", into="foo")
+        self.assertTrue(shares_column(new, self.df, "bar"))
+
+    def test_accumulate_grouped(self):
+        new = self.df.group("baz").accumulate("foo", into="foo_cumsum")
+        self.assertTrue(shares_column(new, self.df, "bar"))
+
+    def test_combine(self):
+        new = self.df.combine(["baz", "jaz"], into="baz", sep="-")
+        self.assertTrue(shares_column(new, self.df, "bar"))
+
+    def test_fill(self):
+        new = self.df.fill("baz", direction="down")
+        self.assertTrue(shares_column(new, self.df, "bar"))
+
+    def test_mutate(self):
+        new = self.df.mutate({"foo": lambda row: row["foo"] * 10})
+        self.assertTrue(shares_column(new, self.df, "bar"))
+
+    def test_mutate_vectorized(self):
+        new = self.df.mutate({"foo": lambda df: df["foo"] * 10}, vectorized=True)
+        self.assertTrue(shares_column(new, self.df, "bar"))
+
+    def test_rank(self):
+        new = self.df.rank("bar", into="bar_rank")
+        self.assertTrue(shares_column(new, self.df, "bar"))
+
+    def test_rank_grouped(self):
+        new = self.df.group("baz").rank("bar", into="bar_rank")
+        self.assertTrue(shares_column(new, self.df, "foo"))
+
+    def test_split(self):
+        new = self.df.split("jaz", into=["jaz1", "jaz2"], sep="::")
+        self.assertTrue(shares_column(new, self.df, "bar"))
@@ -0,0 +1,63 @@
+import unittest
+
+import redframes as rf
+
+
+class TestSpill(unittest.TestCase):
+    def setUp(self):
+        self.df = rf.DataFrame(
+            {
+                "foo": [(i * 7) % 13 for i in range(300)],
+                "bar": ["A" if i % 3 else "B" for i in range(300)],
+                "baz": [float(i % 11) if i % 5 else None for i in range(300)],
+                "jaz": range(300),
+            }
+        )
+        self.over = {
+            "n": ("jaz", rf.stat.count),
+            "s": ("jaz", rf.stat.sum),
+            "m": ("baz", rf.stat.mean),
+            "lo": ("baz", rf.stat.min),
+            "hi": ("jaz", rf.stat.max),
+        }
+
+    def test_rollup_budget_matches_in_memory(self):
+        for budget in [20_000, 10**9]:
+            result = self.df.group(["foo", "bar"]).rollup(self.over, budget=budget)
+            expected = self.df.group(["foo", "bar"]).rollup(self.over)
+            self.assertEqual(result, expected)
+
+    def test_rollup_budget_first_appearance_order(self):
+        df = rf.DataFrame({"foo": ["C", "A", "B", "A", "C"], "bar": range(5)})
+        result = df.group("foo").rollup({"bar": ("bar", rf.stat.sum)}, budget=1)
+        expected = rf.DataFrame({"foo": ["C", "A", "B"], "bar": [4, 4, 2]})
+        self.assertEqual(result, expected)
+
+    def test_rollup_budget_null_keys(self):
+        df = rf.DataFrame({"foo": [None, "A", None, "A"], "bar": range(4)})
+        result = df.group("foo").rollup({"bar": ("bar", rf.stat.sum)}, budget=1)
+        expected = df.group("foo").rollup({"bar": ("bar", rf.stat.sum)})
+        self.assertEqual(result, expected)
+
+    def test_rollup_budget_not_decomposable(self):
+        with self.assertRaisesRegex(ValueError, "budget requires decomposable"):
+            self.df.group("foo").rollup({"m": ("jaz", rf.stat.median)}, budget=100)
+
+    def test_rollup_budget_bad_value(self):
+        with self.assertRaisesRegex(ValueError, "must be > 0"):
+            self.df.group("foo").rollup(self.over, budget=0)
+
+    def test_rollup_budget_bad_type(self):
+        with self.assertRaisesRegex(TypeError, "must be int | None"):
+            self.df.group("foo").rollup(self.over, budget="1GB")
+
+    def test_rollup_budget_ungrouped(self):
+        with self.assertRaisesRegex(ValueError, "budget requires group"):
+            self.df.rollup(self.over, budget=100)
+
+    def test_rollup_budget_float_sums_match_exactly(self):
+        values = [(-1) ** i * 10.0 ** (i % 17 - 8) / 3 for i in range(3000)]
+        df = rf.DataFrame({"foo": [i % 5 for i in range(3000)], "bar": values})
+        over = {"s": ("bar", rf.stat.sum), "m": ("bar", rf.stat.mean)}
+        result = df.group("foo").rollup(over, budget=20_000)
+        self.assertEqual(result, df.group("foo").rollup(over))
@@ -0,0 +1,21 @@
+import unittest
+
+import redframes as rf
+
+
+class TestSplit(unittest.TestCase):
+    def test_split_keeps_remainder(self):
+        df = rf.DataFrame({"foo": ["A::1::x", "B::2", "C", None]})
+        result = df.split("foo", into=["bar", "baz"], sep="::")
+        expected = rf.DataFrame(
+            {"bar": ["A", "B", "C", None], "baz": ["1::x", "2", None, None]}
+        )
+        self.assertEqual(result, expected)
+
+    def test_split_pads_short_rows(self):
+        df = rf.DataFrame({"foo": ["A::1", "B"]})
+        result = df.split("foo", into=["bar", "baz", "jaz"], sep="::")
+        expected = rf.DataFrame(
+            {"bar": ["A", "B"], "baz": ["1", None], "jaz": [None, None]}
+        )
+        self.assertEqual(result, expected)
@@ -0,0 +1,32 @@
+import unittest
+
+import redframes as rf
+
+
+class TestSpread(unittest.TestCase):
+    def test_spread_first_non_null(self):
+        df = rf.DataFrame(
+            {
+                "foo": ["A", "A", "B", "B", "C", None],
+                "bar": [None, 1.0, 2.0, 3.0, None, 4.0],
+                "baz": [2, 2, 1, 1, 3, 1],
+            }
+        )
+        result = df.spread("foo", using="bar")
+        expected = rf.DataFrame({"baz": [1, 2], "A": [None, 1.0], "B": [2.0, None]})
+        self.assertEqual(result, expected)
+
+    def test_spread_keeps_integer_values(self):
+        df = rf.DataFrame({"foo": ["A", "B", "A", "B"], "bar": [1, 2, 3, 4]})
+        result = df.spread("foo", using="bar")
+        self.assertEqual(result, rf.DataFrame({"A": [1, 3], "B": [2, 4]}))
+
+    def test_spread_encoded_column(self):
+        data = {"foo": [1, 1, 2, 2], "bar": ["A", "B", "A", "B"], "baz": [1, 2, 3, 4]}
+        result = rf.DataFrame(data, encode=0.5).spread("bar", using="baz")
+        expected = rf.DataFrame({"foo": [1, 2], "A": [1, 3], "B": [2, 4]})
+        self.assertEqual(result, expected)
+        self.assertEqual(rf.wrap(rf.unwrap(result)), expected)
+        result = rf.DataFrame(data, encode=0.5).drop("foo").spread("bar", using="baz")
+        expected = rf.DataFrame({"A": [1, 3], "B": [2, 4]})
+        self.assertEqual(rf.wrap(rf.unwrap(result)), expected)
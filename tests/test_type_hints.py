@@ -26,6 +26,22 @@ class TestTypeHints(unittest.TestCase):
             }
         )
 
+    def test_init_bad_arrow(self):
+        with self.assertRaisesRegex(TypeError, "must be bool"):
+            rf.DataFrame({"foo": [1]}, arrow=1)
+
+    def test_init_bad_encode(self):
+        with self.assertRaisesRegex(TypeError, "must be float | None"):
+            rf.DataFrame({"foo": ["A"]}, encode="0.5")
+
+    def test_io_unwrap_bad_copy(self):
+        with self.assertRaisesRegex(TypeError, "must be bool"):
+            rf.unwrap(self.df, copy=1)
+
+    def test_io_wrap_bad_copy(self):
+        with self.assertRaisesRegex(TypeError, "must be bool"):
+            rf.wrap(rf.unwrap(self.df), copy=1)
+
     def test_io_load_bad_path(self):
         with self.assertRaisesRegex(TypeError, "must be str"):
             rf.load(1)
@@ -193,10 +209,38 @@ class TestTypeHints(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, message):
             self.df.join(rhs, on="baz", how="inside")
 
+    def test_index_on_bad_column(self):
+        with self.assertRaisesRegex(TypeError, "must be str"):
+            self.df.index_on(1)
+
+    def test_index_on_missing_column(self):
+        with self.assertRaisesRegex(KeyError, "invalid key"):
+            self.df.index_on("missing")
+
+    def test_lookup_without_index(self):
+        with self.assertRaisesRegex(ValueError, "must be indexed"):
+            self.df.lookup(1)
+
     def test_mutate_bad_over(self):
         with self.assertRaisesRegex(TypeError, "must be dict"):
             self.df.mutate(1)
 
+    def test_mutate_bad_vectorized(self):
+        with self.assertRaisesRegex(TypeError, "must be bool"):
+            self.df.mutate({"foo": lambda df: df["foo"] * 10}, vectorized=1)
+
+    def test_mutate_bad_workers(self):
+        with self.assertRaisesRegex(TypeError, "must be int | None"):
+            self.df.mutate({"foo": lambda row: row["foo"] * 10}, workers="4")
+
+    def test_mutate_bad_jit(self):
+        with self.assertRaisesRegex(TypeError, "must be bool"):
+            self.df.mutate({"foo": lambda row: row["foo"] * 10}, jit=1)
+
+    def test_filter_bad_jit(self):
+        with self.assertRaisesRegex(TypeError, "must be bool"):
+            self.df.filter(lambda row: row["foo"] > 1, jit="yes")
+
     def test_pack_bad_column(self):
         with self.assertRaisesRegex(TypeError, "must be str"):
             self.df.pack(1, sep="|")
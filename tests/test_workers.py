@@ -0,0 +1,41 @@
+import threading
+import unittest
+
+import redframes as rf
+
+
+def _double(row):
+    return row["foo"] * 2
+
+
+def _label(row):
+    return f"{row['foo']}:{row['bar']}"
+
+
+class TestWorkers(unittest.TestCase):
+    def test_mutate_workers_ordered_dependencies(self):
+        df = rf.DataFrame({"foo": range(100)})
+        result = df.mutate({"bar": _double, "baz": _label}, workers=3)
+        expected = df.mutate({"bar": _double, "baz": _label})
+        self.assertEqual(result, expected)
+
+    def test_mutate_workers_unpicklable(self):
+        lock = threading.Lock()
+        df = rf.DataFrame({"foo": [1, 2, 3]})
+        with self.assertRaisesRegex(TypeError, "must be picklable"):
+            df.mutate({"bar": lambda row: lock.locked()}, workers=2)
+
+    def test_mutate_workers_vectorized(self):
+        df = rf.DataFrame({"foo": [1, 2, 3]})
+        with self.assertRaisesRegex(ValueError, "workers is incompatible"):
+            df.mutate({"bar": lambda df: df["foo"]}, vectorized=True, workers=2)
+
+    def test_mutate_workers_zero(self):
+        df = rf.DataFrame({"foo": [1, 2, 3]})
+        with self.assertRaisesRegex(ValueError, "must be > 0"):
+            df.mutate({"bar": _double}, workers=0)
+
+    def test_mutate_workers_bool(self):
+        df = rf.DataFrame({"foo": [1, 2]})
+        with self.assertRaisesRegex(TypeError, "must be int"):
+            df.mutate({"bar": _double}, workers=True)